@@ -1,14 +1,33 @@
 # src/Tools/interview/__init__.py
-from .interview_toolkit import InterviewToolkit
-from .question_selector import QuestionSelectorTool
-from .answer_evaluator import AnswerEvaluatorTool
-from .response_generator import ResponseGeneratorTool
-from .session_manager import SessionManagerTool
-
-__all__ = [
-    "InterviewToolkit",
-    "QuestionSelectorTool",
-    "AnswerEvaluatorTool",
-    "ResponseGeneratorTool",
-    "SessionManagerTool",
-]
+"""
+Interview tools, loaded lazily.
+
+Importing this package is cheap: each tool module (and Django/LangChain behind
+it) is only imported when the name is first accessed.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    "InterviewToolkit": ".interview_toolkit",
+    "QuestionSelectorTool": ".question_selector",
+    "AnswerEvaluatorTool": ".answer_evaluator",
+    "DeepAnswerEvaluatorTool": ".deep_evaluator",
+    "ResponseGeneratorTool": ".response_generator",
+    "SessionManagerTool": ".session_manager",
+    "TurnOrchestrator": ".turn_orchestrator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
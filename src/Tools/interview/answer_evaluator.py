@@ -1,9 +1,11 @@
 # src/Tools/interview/answer_evaluator.py
 import os
+import re
 import sys
-from typing import Type, Dict, Any
+import json
+import hashlib
+from typing import Type, Dict, Any, Optional
 from pydantic import BaseModel, Field
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 # Add project root to path
@@ -12,22 +14,79 @@ if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
 from src.tool_framework.base_tool import BaseTool
+from src.Tools.interview.llm_clients import get_chat_llm
+from src.Tools.interview.answer_prescorer import local_evaluation
+from src.Tools.interview.evaluation_cache import get_evaluation_cache, evaluation_cache_key
 
 
 class AnswerEvaluatorInput(BaseModel):
     """Input schema for answer evaluation."""
     user_transcript: str = Field(..., description="The user's spoken answer (transcript)")
     expected_answer_points: str = Field(
-        ..., 
+        ...,
         description="Expected key points that should be in the answer"
     )
     question_text: str = Field(..., description="The original question asked")
 
 
+# Evaluation prompt (built once, shared by the sync and async paths)
+EVALUATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert technical interviewer evaluating a candidate's answer.
+
+Your task:
+1. Compare the candidate's answer against the expected key points
+2. Assign a score from 0-10 (10 = perfect answer covering all points)
+3. Provide clear reasoning for the score
+4. Give constructive feedback
+
+Be fair but rigorous. Partial credit for partially correct answers."""),
+    ("user", """Question: {question}
+
+Expected Key Points:
+{expected_points}
+
+Candidate's Answer:
+{user_answer}
+
+Provide your evaluation in this format:
+SCORE: [0-10]
+REASONING: [Why you gave this score]
+FEEDBACK: [Constructive feedback for the candidate]""")
+])
+
+# Compact JSON evaluation prompt: short fields keep output tokens (and latency) low
+JSON_EVALUATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert technical interviewer evaluating a candidate's answer.
+
+Compare the answer against the expected key points and score it from 0-10
+(10 = perfect answer covering all points). Give partial credit for partially
+correct answers.
+
+Reply with ONLY a JSON object, no other text:
+{{"score": <integer 0-10>, "reasoning": "<one sentence>", "feedback": "<one or two sentences for the candidate>"}}"""),
+    ("user", """Question: {question}
+
+Expected Key Points:
+{expected_points}
+
+Candidate's Answer:
+{user_answer}""")
+])
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.S)
+
+
 class AnswerEvaluatorTool(BaseTool):
     """
     Evaluates a user's answer using LLM-based scoring.
     Compares the transcript against expected answer points.
+
+    Answers with no substance (silence, filler, "I don't know") are scored 0
+    locally without an LLM call unless EVALUATOR_FAST_PATH is disabled. The LLM
+    output format is chosen by EVALUATOR_OUTPUT_MODE: "json" (default, token-capped
+    by EVALUATOR_MAX_TOKENS) or "text" (the original SCORE/REASONING/FEEDBACK form).
+    LLM results are cached by content (see evaluation_cache), so identical
+    evaluations are only paid for once.
     """
     name: str = "Answer_Evaluator"
     args_schema: Type[BaseModel] = AnswerEvaluatorInput
@@ -44,94 +103,191 @@ class AnswerEvaluatorTool(BaseTool):
     ) -> Dict[str, Any]:
         """
         Execute the answer evaluation logic.
-        
+
         Args:
             user_transcript: What the user said
             expected_answer_points: What we expect in a good answer
             question_text: The original question
-            
+
         Returns:
             Dictionary with score, reasoning, and feedback
         """
         try:
-            # Get Krutrim API key
-            krutrim_api_key = self.get_tool_config('KRUTRIM_API_KEY')
-            if not krutrim_api_key:
+            fast_result = self._fast_path(user_transcript, expected_answer_points)
+            if fast_result is not None:
+                return fast_result
+
+            cache = get_evaluation_cache()
+            cache_key = self._cache_key(user_transcript, expected_answer_points, question_text)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+            chain = self._build_chain()
+            if chain is None:
                 return {
                     "error": "KRUTRIM_API_KEY not configured in environment"
                 }
-            
-            # Initialize LLM (Krutrim via OpenAI-compatible endpoint)
-            llm = ChatOpenAI(
-                model="gpt-oss-120b",
-                base_url="https://cloud.olakrutrim.com/v1",
-                api_key=krutrim_api_key,
-                temperature=0.3  # Lower temperature for consistent evaluation
-            )
-            
-            # Create evaluation prompt
-            evaluation_prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are an expert technical interviewer evaluating a candidate's answer.
 
-Your task:
-1. Compare the candidate's answer against the expected key points
-2. Assign a score from 0-10 (10 = perfect answer covering all points)
-3. Provide clear reasoning for the score
-4. Give constructive feedback
+            # Run evaluation
+            result = chain.invoke({
+                "question": question_text,
+                "expected_points": expected_answer_points,
+                "user_answer": user_transcript
+            })
 
-Be fair but rigorous. Partial credit for partially correct answers."""),
-                ("user", """Question: {question}
+            evaluation = self._parse_evaluation(result.content)
+            if "warning" not in evaluation:
+                cache.set(cache_key, evaluation)
+            return evaluation
 
-Expected Key Points:
-{expected_points}
+        except Exception as e:
+            return self._failed_evaluation(e)
 
-Candidate's Answer:
-{user_answer}
+    async def _aexecute(
+        self,
+        user_transcript: str,
+        expected_answer_points: str,
+        question_text: str
+    ) -> Dict[str, Any]:
+        """Async version of _execute using the LLM's native ainvoke."""
+        try:
+            fast_result = self._fast_path(user_transcript, expected_answer_points)
+            if fast_result is not None:
+                return fast_result
 
-Provide your evaluation in this format:
-SCORE: [0-10]
-REASONING: [Why you gave this score]
-FEEDBACK: [Constructive feedback for the candidate]""")
-            ])
-            
-            # Run evaluation
-            chain = evaluation_prompt | llm
-            result = chain.invoke({
+            cache = get_evaluation_cache()
+            cache_key = self._cache_key(user_transcript, expected_answer_points, question_text)
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+            chain = self._build_chain()
+            if chain is None:
+                return {
+                    "error": "KRUTRIM_API_KEY not configured in environment"
+                }
+
+            result = await chain.ainvoke({
                 "question": question_text,
                 "expected_points": expected_answer_points,
                 "user_answer": user_transcript
             })
-            
-            # Parse the response
-            response_text = result.content
-            
-            # Extract score, reasoning, feedback
-            score = 5  # Default
-            reasoning = ""
-            feedback = ""
-            
-            for line in response_text.split('\n'):
-                if line.startswith('SCORE:'):
-                    try:
-                        score = int(line.split(':')[1].strip())
-                    except:
-                        pass
-                elif line.startswith('REASONING:'):
-                    reasoning = line.split(':', 1)[1].strip()
-                elif line.startswith('FEEDBACK:'):
-                    feedback = line.split(':', 1)[1].strip()
-            
-            return {
-                "score": score,
-                "reasoning": reasoning,
-                "feedback": feedback,
-                "raw_evaluation": response_text
-            }
-            
+
+            evaluation = self._parse_evaluation(result.content)
+            if "warning" not in evaluation:
+                await cache.aset(cache_key, evaluation)
+            return evaluation
+
         except Exception as e:
+            return self._failed_evaluation(e)
+
+    @property
+    def output_mode(self) -> str:
+        return (self.get_tool_config('EVALUATOR_OUTPUT_MODE') or "json").lower()
+
+    def _fast_path(self, user_transcript: str, expected_answer_points: str) -> Optional[Dict[str, Any]]:
+        """Score non-answers locally, or return None to use the LLM."""
+        return local_evaluation(user_transcript)
+
+    def _cache_key(self, user_transcript: str, expected_answer_points: str, question_text: str) -> str:
+        """Content-addressed key; changing the prompt or mode changes every key."""
+        prompt = EVALUATION_PROMPT if self.output_mode == "text" else JSON_EVALUATION_PROMPT
+        prompt_version = hashlib.sha256(repr(prompt.messages).encode("utf-8")).hexdigest()[:16]
+        return evaluation_cache_key(
+            f"{self.output_mode}:{prompt_version}",
+            question_text,
+            expected_answer_points,
+            user_transcript,
+        )
+
+    def _build_chain(self):
+        """Return the evaluation chain, or None if the API key is missing."""
+        # Get Krutrim API key
+        krutrim_api_key = self.get_tool_config('KRUTRIM_API_KEY')
+        if not krutrim_api_key:
+            return None
+
+        # Shared, connection-pooled LLM client (Krutrim via OpenAI-compatible endpoint)
+        llm = get_chat_llm(
+            api_key=krutrim_api_key,
+            temperature=0.3  # Lower temperature for consistent evaluation
+        )
+
+        if self.output_mode == "text":
+            return EVALUATION_PROMPT | llm
+
+        max_tokens = int(self.get_tool_config('EVALUATOR_MAX_TOKENS') or 200)
+        return JSON_EVALUATION_PROMPT | llm.bind(max_tokens=max_tokens)
+
+    @classmethod
+    def _parse_evaluation(cls, response_text: str) -> Dict[str, Any]:
+        """Extract score, reasoning and feedback from the LLM's reply."""
+        parsed = cls._parse_json(response_text) or cls._parse_text(response_text)
+
+        if parsed.get("score") is None:
+            # Keep the neutral default, but say so instead of hiding it
+            parsed["score"] = 5
+            parsed["warning"] = "Could not parse a score from the evaluation; defaulted to 5"
+
+        parsed["score"] = max(0, min(10, parsed["score"]))
+        parsed["raw_evaluation"] = response_text
+        parsed["source"] = "llm"
+        return parsed
+
+    @staticmethod
+    def _parse_json(response_text: str) -> Optional[Dict[str, Any]]:
+        match = _JSON_OBJECT.search(response_text)
+        if not match:
+            return None
+        try:
+            data = json.loads(match.group(0))
             return {
-                "error": f"Failed to evaluate answer: {str(e)}",
-                "score": 0,
-                "reasoning": "Evaluation failed",
-                "feedback": "Unable to evaluate answer due to technical error"
+                "score": int(data["score"]) if data.get("score") is not None else None,
+                "reasoning": str(data.get("reasoning", "")).strip(),
+                "feedback": str(data.get("feedback", "")).strip(),
             }
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def _parse_text(response_text: str) -> Dict[str, Any]:
+        score = None
+        reasoning = ""
+        feedback = ""
+
+        for line in response_text.split('\n'):
+            if line.startswith('SCORE:'):
+                try:
+                    score = int(line.split(':')[1].strip())
+                except ValueError:
+                    pass
+            elif line.startswith('REASONING:'):
+                reasoning = line.split(':', 1)[1].strip()
+            elif line.startswith('FEEDBACK:'):
+                feedback = line.split(':', 1)[1].strip()
+
+        return {
+            "score": score,
+            "reasoning": reasoning,
+            "feedback": feedback,
+        }
+
+    @staticmethod
+    def _failed_evaluation(error: Exception) -> Dict[str, Any]:
+        return failed_evaluation(error)
+
+
+def failed_evaluation(error: Any) -> Dict[str, Any]:
+    """
+    Placeholder evaluation for an answer that could not be scored.
+
+    It carries an "error" so callers can tell it from a real 0; the turn is
+    still saved, and the post-interview re-scoring replaces the score.
+    """
+    return {
+        "error": f"Failed to evaluate answer: {str(error)}",
+        "score": 0,
+        "reasoning": "Evaluation failed",
+        "feedback": "Unable to evaluate answer due to technical error"
+    }
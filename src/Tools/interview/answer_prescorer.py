@@ -0,0 +1,85 @@
+# src/Tools/interview/answer_prescorer.py
+"""
+Local pre-scoring for candidate answers.
+
+Only answers that are empty or consist solely of explicit non-answer phrases
+("I don't know", "no idea", "pass") are scored locally (0). Everything else
+goes to the LLM, however short: "C", "Go" or "O(1)" can be the whole correct
+answer, and keyword overlap with the expected points cannot tell a correct
+answer from a wrong one that uses the same words ("TCP isn't reliable"), so
+it never decides a score.
+
+Every evaluation path (AnswerEvaluatorTool, combined mode in
+ResponseGeneratorTool) goes through local_evaluation(), so EVALUATOR_FAST_PATH
+switches them all.
+"""
+import os
+import re
+from typing import Dict, Optional, Any
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Words that may surround a non-answer without adding anything to it
+FILLER_WORDS = frozenset("""
+um uh er erm hmm hm oh well so okay ok yeah sorry honestly actually really
+just i im ive me the a an that this it about question answer to be honest
+""".split())
+
+# Phrases that only say "no answer" ("No" is not one: it can answer a yes/no question)
+NON_ANSWER_PHRASES = tuple(tuple(phrase.split()) for phrase in (
+    "dont know", "do not know", "no idea", "have no idea", "no clue", "have no clue",
+    "not sure", "unsure", "not certain", "cant say", "idk",
+    "dont remember", "do not remember", "cant remember", "cannot remember", "dont recall",
+    "forgot", "forget", "pass", "skip", "next",
+))
+
+
+def _words(text: str) -> list:
+    # "don't" -> "dont"
+    return _WORD.findall((text or "").lower().replace("'", "").replace("\u2019", ""))
+
+
+def is_non_answer(text: str) -> bool:
+    """True if text is empty or only non-answer phrases and filler words."""
+    words = [word for word in _words(text) if word not in FILLER_WORDS]
+    position = 0
+    while position < len(words):
+        for phrase in NON_ANSWER_PHRASES:
+            if tuple(words[position:position + len(phrase)]) == phrase:
+                position += len(phrase)
+                break
+        else:
+            return False
+    return True
+
+
+def prescore(user_transcript: str) -> Optional[Dict[str, Any]]:
+    """
+    Score an answer locally when it is not an answer at all.
+
+    Args:
+        user_transcript: What the user said
+
+    Returns:
+        Evaluation dictionary (score, reasoning, feedback), or None when the
+        answer needs a full LLM evaluation
+    """
+    if not is_non_answer(user_transcript):
+        return None
+    return {
+        "score": 0,
+        "reasoning": "No substantive answer was given.",
+        "feedback": "Try to walk through what you know about the question, even partially.",
+    }
+
+
+def local_evaluation(user_transcript: str) -> Optional[Dict[str, Any]]:
+    """prescore() unless EVALUATOR_FAST_PATH is disabled, tagged with its source."""
+    enabled = (os.getenv("EVALUATOR_FAST_PATH") or "true").lower()
+    if enabled not in ("1", "true", "yes", "on"):
+        return None
+
+    result = prescore(user_transcript)
+    if result is not None:
+        result["source"] = "fast_path"
+    return result
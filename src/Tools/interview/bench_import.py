@@ -0,0 +1,88 @@
+# src/Tools/interview/bench_import.py
+"""
+Import-time benchmark for the interview toolkit.
+
+Each scenario runs in a fresh interpreter so module caches do not hide the
+cold-start cost a bot worker pays. Run from the project root:
+
+    python -m src.Tools.interview.bench_import --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+
+_TIMER = """
+import sys, time
+sys.path.append({src!r})
+start = time.perf_counter()
+{body}
+print(time.perf_counter() - start)
+"""
+
+SCENARIOS = {
+    # What a worker pays just to reference the toolkit
+    "import package + toolkit": (
+        "from src.Tools.interview import InterviewToolkit\n"
+        "InterviewToolkit()"
+    ),
+    # Deferred cost, paid once when the tools are first needed
+    "get_tools()": (
+        "from src.Tools.interview import InterviewToolkit\n"
+        "InterviewToolkit().get_tools()"
+    ),
+    # Full bootstrap including Django setup
+    "get_tools() + ensure_django()": (
+        "from src.Tools.interview import InterviewToolkit\n"
+        "from src.Tools.interview.bootstrap import ensure_django\n"
+        "InterviewToolkit().get_tools()\n"
+        "ensure_django()"
+    ),
+}
+
+
+# Django settings refuse to load without these; nothing here connects to LiveKit
+SETTINGS_ENV = {
+    "LIVEKIT_API_KEY": "bench-import",
+    "LIVEKIT_API_SECRET": "bench-import",
+}
+
+
+def time_scenario(body: str, runs: int) -> list:
+    """Run a snippet in fresh interpreters and return wall times in seconds."""
+    code = _TIMER.format(src=os.path.join(PROJECT_ROOT, "src"), body=body)
+    env = {**SETTINGS_ENV, **os.environ}
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<34}{'median ms':>12}{'min ms':>10}")
+    for name, body in SCENARIOS.items():
+        timings = time_scenario(body, args.runs)
+        print(
+            f"{name:<34}"
+            f"{statistics.median(timings) * 1000:>12.1f}"
+            f"{min(timings) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
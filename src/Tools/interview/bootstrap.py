@@ -0,0 +1,40 @@
+# src/Tools/interview/bootstrap.py
+"""
+One-time Django bootstrap for the interview tools.
+
+Tool modules never configure Django at import time. Code that touches the
+ORM calls ensure_django() first, which is a no-op inside manage.py commands
+(Django is already set up) and sets Django up once for standalone workers.
+"""
+import os
+import threading
+
+_lock = threading.Lock()
+
+
+def ensure_django() -> None:
+    """Set up Django once if it has not been set up yet."""
+    from django.apps import apps
+
+    if apps.ready:
+        return
+
+    with _lock:
+        if not apps.ready:
+            os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+            import django
+            django.setup()
+
+
+def get_model(model_label: str):
+    """
+    Look up a model by "app_label.ModelName" (e.g. "interviews.Question").
+
+    Importing src.apps.<app>.models would load the model module a second time
+    under another name inside manage.py, where the apps live on the path as
+    apps.<app>; the app registry gives the one Django actually registered.
+    """
+    ensure_django()
+    from django.apps import apps
+
+    return apps.get_model(model_label)
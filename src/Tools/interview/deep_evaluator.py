@@ -0,0 +1,114 @@
+# src/Tools/interview/deep_evaluator.py
+import os
+import sys
+import json
+import hashlib
+from typing import Type, Dict, Any, Optional
+from pydantic import BaseModel
+from langchain_core.prompts import ChatPromptTemplate
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.Tools.interview.answer_evaluator import AnswerEvaluatorInput, AnswerEvaluatorTool, _JSON_OBJECT
+from src.Tools.interview.llm_clients import get_chat_llm, KRUTRIM_MODEL
+from src.Tools.interview.evaluation_cache import evaluation_cache_key
+
+
+# Thorough, point-by-point grading; only ever run off the live call
+DEEP_EVALUATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a senior technical interviewer reviewing a recorded interview answer.
+
+Go through the expected key points one by one and decide whether the candidate
+covered each of them, partially covered it, or missed it. Note anything the
+candidate said that is wrong. Then score the answer from 0-10
+(10 = every point covered accurately and with depth).
+
+Reply with ONLY a JSON object, no other text:
+{{"score": <integer 0-10>,
+  "covered_points": ["<point>", ...],
+  "missed_points": ["<point>", ...],
+  "inaccuracies": ["<statement>", ...],
+  "reasoning": "<two or three sentences>",
+  "feedback": "<two or three sentences for the candidate>"}}"""),
+    ("user", """Question: {question}
+
+Expected Key Points:
+{expected_points}
+
+Candidate's Answer:
+{user_answer}""")
+])
+
+
+class DeepAnswerEvaluatorTool(AnswerEvaluatorTool):
+    """
+    Slow, thorough answer evaluation for post-interview scoring.
+
+    Same interface as AnswerEvaluatorTool, but never takes the local fast path,
+    grades each expected point separately, and can use a stronger model
+    (DEEP_EVALUATOR_MODEL) with a larger output budget (DEEP_EVALUATOR_MAX_TOKENS).
+    Run by the interviews Celery tasks after a session completes, so the live
+    loop can keep a cheap evaluator.
+    """
+    name: str = "Deep_Answer_Evaluator"
+    args_schema: Type[BaseModel] = AnswerEvaluatorInput
+    description: str = (
+        "Re-evaluates a candidate's answer point by point against the expected key points. "
+        "Returns a score (0-10), covered and missed points, reasoning, and feedback."
+    )
+
+    @property
+    def output_mode(self) -> str:
+        return "deep"
+
+    def _fast_path(self, user_transcript: str, expected_answer_points: str) -> Optional[Dict[str, Any]]:
+        # Every answer gets a full read, however obvious it looks
+        return None
+
+    def _cache_key(self, user_transcript: str, expected_answer_points: str, question_text: str) -> str:
+        prompt_version = hashlib.sha256(repr(DEEP_EVALUATION_PROMPT.messages).encode("utf-8")).hexdigest()[:16]
+        return evaluation_cache_key(
+            f"deep:{self.model}:{prompt_version}",
+            question_text,
+            expected_answer_points,
+            user_transcript,
+        )
+
+    @property
+    def model(self) -> str:
+        return self.get_tool_config('DEEP_EVALUATOR_MODEL') or KRUTRIM_MODEL
+
+    def _build_chain(self):
+        """Return the deep evaluation chain, or None if the API key is missing."""
+        krutrim_api_key = self.get_tool_config('KRUTRIM_API_KEY')
+        if not krutrim_api_key:
+            return None
+
+        llm = get_chat_llm(
+            api_key=krutrim_api_key,
+            temperature=0.0,  # Reports should not change between runs
+            model=self.model,
+        )
+        max_tokens = int(self.get_tool_config('DEEP_EVALUATOR_MAX_TOKENS') or 800)
+        return DEEP_EVALUATION_PROMPT | llm.bind(max_tokens=max_tokens)
+
+    @classmethod
+    def _parse_evaluation(cls, response_text: str) -> Dict[str, Any]:
+        """Parse the base fields, then add the per-point breakdown if present."""
+        parsed = super()._parse_evaluation(response_text)
+        parsed["source"] = "deep"
+
+        match = _JSON_OBJECT.search(response_text)
+        try:
+            data = json.loads(match.group(0)) if match else {}
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        for key in ("covered_points", "missed_points", "inaccuracies"):
+            value = data.get(key)
+            parsed[key] = [str(item) for item in value] if isinstance(value, list) else []
+        return parsed
@@ -0,0 +1,366 @@
+# src/Tools/interview/difficulty_engine.py
+"""
+Adaptive difficulty for question selection (Rasch / Elo style).
+
+Each question has a difficulty b and each session an ability estimate theta,
+on the same logit scale; the expected score of an answer is
+sigmoid(theta - b) of the maximum (scores are read as 0-10 -> 0.0-1.0).
+
+- Ability is updated after every scored turn with one Newton step
+  theta += (s - p) / information, where information accumulates p * (1 - p)
+  on top of a unit prior, so early answers move the estimate a lot and later
+  ones fine-tune it.
+- Question difficulty is calibrated offline from InterviewTurn history by
+  calibrate_question_difficulty() (a nightly Celery task, or the
+  calibrate_questions command) into Question.difficulty_rating. Until then a
+  question's difficulty is estimated from its QuestionStats mean score, or
+  taken from its EASY/MEDIUM/HARD label if it has too few attempts.
+- The most informative next question is the one with b closest to theta
+  (Fisher information p * (1 - p) peaks at p = 0.5). Questions are
+  pre-sorted into fixed-width difficulty bins, so a pick looks at theta's
+  bin and its neighbours: a constant number of lookups, no query.
+"""
+import os
+import sys
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+from src.Tools.interview.bootstrap import get_model
+from src.Tools.interview.question_index import QuestionPool, _Bucket, get_question_index
+from src.Tools.interview.session_history import get_session_history
+
+# Difficulty assumed for questions that have not been calibrated yet
+LABEL_PRIOR = {"EASY": -1.0, "MEDIUM": 0.0, "HARD": 1.0}
+# Difficulty bins cover [-BIN_RANGE, BIN_RANGE] in steps of BIN_WIDTH
+BIN_WIDTH = 0.25
+BIN_RANGE = 4.0
+BIN_COUNT = int(2 * BIN_RANGE / BIN_WIDTH) + 1
+# Precision of the ability prior (a standard normal)
+PRIOR_INFORMATION = 1.0
+# Attempts before an uncalibrated question's mean score is trusted over its label
+MIN_STATS_ATTEMPTS = 5
+# Mean scores are clipped to this range (of 0-1) before taking the logit
+MEAN_SCORE_CLIP = 0.05
+
+
+def expected_score(ability: float, difficulty: float) -> float:
+    """Expected fraction of the maximum score (0-1)."""
+    return 1.0 / (1.0 + math.exp(difficulty - ability))
+
+
+def question_difficulty(item: Dict[str, Any]) -> float:
+    """Calibrated difficulty of an index item, else an estimate from its stats or label."""
+    rating = item.get("difficulty_rating")
+    if rating is not None:
+        return rating
+    mean_score = item.get("mean_score")
+    if mean_score is not None and item.get("attempts", 0) >= MIN_STATS_ATTEMPTS:
+        # Abilities average about 0, where the expected score is sigmoid(-b)
+        p = min(max(mean_score / 10.0, MEAN_SCORE_CLIP), 1.0 - MEAN_SCORE_CLIP)
+        return math.log((1.0 - p) / p)
+    return LABEL_PRIOR.get(str(item.get("difficulty", "")).upper(), 0.0)
+
+
+def difficulty_label(ability: float) -> str:
+    """The EASY/MEDIUM/HARD label nearest to an ability."""
+    return min(LABEL_PRIOR, key=lambda label: abs(LABEL_PRIOR[label] - ability))
+
+
+def _bin(value: float) -> int:
+    position = int(round((value + BIN_RANGE) / BIN_WIDTH))
+    return max(0, min(BIN_COUNT - 1, position))
+
+
+class _Ability:
+    __slots__ = ("theta", "information", "turns")
+
+    def __init__(self):
+        self.theta = 0.0
+        self.information = PRIOR_INFORMATION
+        self.turns = 0
+
+    def update(self, difficulty: float, score: float) -> None:
+        p = expected_score(self.theta, difficulty)
+        self.information += p * (1.0 - p)
+        self.theta += (score - p) / self.information
+        self.turns += 1
+
+
+class AdaptiveDifficultyEngine:
+    """
+    Per-session ability estimates plus difficulty-binned question pools.
+
+    Sessions are tracked from their first adaptive pick (seeded from their
+    InterviewTurn history) and at most QUESTION_HISTORY_MAX_SESSIONS are
+    kept, least recently used first out. The bins are rebuilt from the
+    question index whenever the index changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, _Ability]" = OrderedDict()
+        self._bins: List[_Bucket] = []
+        self._bins_version: Optional[int] = None
+        self._difficulty: Dict[str, float] = {}
+
+    @property
+    def max_sessions(self) -> int:
+        return int(get_config("QUESTION_HISTORY_MAX_SESSIONS", 10000))
+
+    # -------- ABILITY --------
+
+    def _seed(self, session_id: str) -> _Ability:
+        from django.core.exceptions import ValidationError
+        InterviewTurn = get_model('interviews.InterviewTurn')
+
+        ability = _Ability()
+        try:
+            turns = list(
+                InterviewTurn.objects
+                .filter(session_id=session_id, question_id__isnull=False)
+                .order_by('created_at')
+                .values_list('question_id', 'score')
+            )
+        except (ValidationError, ValueError):
+            return ability
+
+        index = get_question_index()
+        for question_id, score in turns:
+            item = index.get(str(question_id))
+            if item is not None:
+                ability.update(question_difficulty(item), score / 10.0)
+        return ability
+
+    def _ability(self, session_id: str) -> _Ability:
+        with self._lock:
+            ability = self._sessions.get(session_id)
+            if ability is not None:
+                self._sessions.move_to_end(session_id)
+                return ability
+
+        # Seed outside the lock so one slow query does not stall other sessions
+        seeded = self._seed(session_id)
+        with self._lock:
+            ability = self._sessions.setdefault(session_id, seeded)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return ability
+
+    def ability(self, session_id: str) -> float:
+        """Current ability estimate of a session (0.0 = MEDIUM)."""
+        return self._ability(session_id).theta
+
+    def record(self, session_id: str, question_id: str, score: int) -> None:
+        """
+        Fold a scored answer into the session's ability.
+
+        Only sessions already tracked are updated; an untracked one is seeded
+        from its saved turns (this one included) on its next pick instead.
+        """
+        if not session_id or not question_id or session_id not in self._sessions:
+            return
+        # Resolved before taking the lock: the index lookup may reload from the database
+        difficulty = self._difficulty.get(str(question_id))
+        if difficulty is None:
+            item = get_question_index().get(str(question_id))
+            if item is None:
+                return
+            difficulty = question_difficulty(item)
+        with self._lock:
+            ability = self._sessions.get(session_id)
+            if ability is None:
+                return
+            ability.update(difficulty, max(0, min(10, score)) / 10.0)
+
+    # -------- SELECTION --------
+
+    def _ensure_bins(self) -> None:
+        index = get_question_index()
+        index.ensure_loaded()
+        if self._bins_version == index.version:
+            return
+
+        bins = [_Bucket() for _ in range(BIN_COUNT)]
+        difficulty = {}
+        version = index.version
+        for item in index.items():
+            value = question_difficulty(item)
+            difficulty[item["id"]] = value
+            bins[_bin(value)].add(item)
+        self._bins, self._difficulty, self._bins_version = bins, difficulty, version
+
+    def pick(self, session_id: str, topic: str = "") -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Pick the unasked question that tells us most about the session.
+
+        Args:
+            session_id: The interview session ID
+            topic: Optional topic filter; with a topic, the question is drawn
+                from that topic at the difficulty label nearest the ability
+
+        Returns:
+            (question or None if every question was asked, ability estimate)
+        """
+        theta = self.ability(session_id)
+        history = get_session_history()
+        index = get_question_index()
+
+        if topic:
+            pool = index.pool(difficulty_label(theta), topic)
+            return history.draw(session_id, pool), theta
+
+        with self._lock:
+            self._ensure_bins()
+            bins, version = self._bins, self._bins_version
+
+        # theta's own bin first, then outwards one bin at a time
+        center = _bin(theta)
+        for distance in range(BIN_COUNT):
+            for position in {center - distance, center + distance}:
+                if 0 <= position < BIN_COUNT and len(bins[position]):
+                    pool = QuestionPool([bins[position]], version, ("ADAPTIVE", str(position)))
+                    question = history.draw(session_id, pool)
+                    if question is not None:
+                        return question, theta
+        return None, theta
+
+
+def fit_difficulties(s_idx, q_idx, outcome, prior, iterations: int = 30, regularization: float = 1.0):
+    """
+    Jointly fit session abilities and question difficulties (NumPy arrays).
+
+    Args:
+        s_idx: Session row of each turn
+        q_idx: Question row of each turn
+        outcome: Score of each turn as a fraction of the maximum (0-1)
+        prior: Prior difficulty of each question row
+        iterations: Newton iterations (each updates abilities, then difficulties)
+        regularization: Prior precision; higher keeps estimates nearer the priors
+
+    Returns:
+        Fitted difficulty of each question row
+    """
+    import numpy as np
+
+    sessions, questions = int(s_idx.max()) + 1, len(prior)
+    theta = np.zeros(sessions)
+    b = np.array(prior, dtype=np.float64)
+
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(b[q_idx] - theta[s_idx]))
+        theta += (
+            (np.bincount(s_idx, outcome - p, sessions) - regularization * theta)
+            / (np.bincount(s_idx, p * (1.0 - p), sessions) + regularization)
+        )
+        p = 1.0 / (1.0 + np.exp(b[q_idx] - theta[s_idx]))
+        b += (
+            (-np.bincount(q_idx, outcome - p, questions) - regularization * (b - prior))
+            / (np.bincount(q_idx, p * (1.0 - p), questions) + regularization)
+        )
+    return np.clip(b, -BIN_RANGE, BIN_RANGE)
+
+
+def calibrate_question_difficulty(
+    iterations: int = 30,
+    regularization: float = 1.0,
+    min_attempts: int = 5
+) -> Dict[str, Any]:
+    """
+    Fit question difficulties to the whole InterviewTurn history (batch job).
+
+    Abilities and difficulties are fitted jointly by regularized maximum
+    likelihood (diagonal Newton steps): abilities are pulled towards 0 and
+    difficulties towards their label's prior, so thinly attempted questions
+    stay near their label. Questions with fewer than min_attempts scored
+    turns are left uncalibrated.
+
+    Returns:
+        Dictionary with turns, questions_calibrated and mean_change, the mean
+        absolute change from each calibrated question's previous rating (its
+        label prior if it had none)
+    """
+    import numpy as np
+    from django.db import transaction
+
+    Question = get_model('interviews.Question')
+    InterviewTurn = get_model('interviews.InterviewTurn')
+
+    sessions: Dict[Any, int] = {}
+    questions: Dict[Any, int] = {}
+    session_rows, question_rows, scores = [], [], []
+    turns = (
+        InterviewTurn.objects
+        .filter(question_id__isnull=False)
+        .values_list('session_id', 'question_id', 'score')
+        .iterator(chunk_size=5000)
+    )
+    for session_id, question_id, score in turns:
+        session_rows.append(sessions.setdefault(session_id, len(sessions)))
+        question_rows.append(questions.setdefault(question_id, len(questions)))
+        scores.append(max(0, min(10, score)) / 10.0)
+
+    if not scores:
+        return {"turns": 0, "questions_calibrated": 0, "mean_change": 0.0}
+
+    s_idx = np.array(session_rows, dtype=np.int64)
+    q_idx = np.array(question_rows, dtype=np.int64)
+    stored = {
+        question_id: (label, rating)
+        for question_id, label, rating in Question.objects.filter(id__in=list(questions))
+        .values_list('id', 'difficulty', 'difficulty_rating')
+    }
+    prior = np.array([LABEL_PRIOR.get(stored.get(qid, ("MEDIUM", None))[0], 0.0) for qid in questions])
+    previous = np.array([
+        prior[row] if stored.get(qid, (None, None))[1] is None else stored[qid][1]
+        for qid, row in questions.items()
+    ])
+    b = fit_difficulties(s_idx, q_idx, np.array(scores), prior, iterations, regularization)
+
+    attempts = np.bincount(q_idx, minlength=len(questions))
+    calibrated = []
+    for question_id, row in questions.items():
+        if attempts[row] >= min_attempts:
+            calibrated.append(Question(id=question_id, difficulty_rating=round(float(b[row]), 4)))
+
+    with transaction.atomic():
+        Question.objects.bulk_update(calibrated, ['difficulty_rating'], batch_size=2000)
+
+    # Other processes pick the new ratings up with their next index reload
+    get_question_index().invalidate()
+    changed = [abs(b[row] - previous[row]) for row in range(len(questions)) if attempts[row] >= min_attempts]
+    return {
+        "turns": len(scores),
+        "questions_calibrated": len(calibrated),
+        "mean_change": round(float(np.mean(changed)), 4) if changed else 0.0,
+    }
+
+
+# Singleton instance
+_engine_instance = None
+_engine_lock = threading.Lock()
+
+
+def get_difficulty_engine() -> AdaptiveDifficultyEngine:
+    """
+    Get the process-wide adaptive difficulty engine.
+
+    Returns:
+        AdaptiveDifficultyEngine instance
+    """
+    global _engine_instance
+
+    if _engine_instance is None:
+        with _engine_lock:
+            if _engine_instance is None:
+                _engine_instance = AdaptiveDifficultyEngine()
+
+    return _engine_instance
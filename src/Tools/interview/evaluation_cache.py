@@ -0,0 +1,183 @@
+# src/Tools/interview/evaluation_cache.py
+"""
+Content-addressed cache for answer evaluations.
+
+Keys are a SHA-256 of the prompt version plus the normalized question,
+expected points and transcript, so retries, replayed sessions and regression
+runs over stored transcripts are served without another LLM call.
+
+Two tiers: an in-process LRU (EVALUATION_CACHE_SIZE entries) and, when
+EVALUATION_CACHE_REDIS_URL is set, a shared Redis tier whose entries expire
+after EVALUATION_CACHE_TTL_SECONDS. Redis failures are logged and treated as
+misses; the cache never fails an evaluation.
+"""
+import os
+import sys
+import json
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config, get_tool_executor
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "codevoice:evaluation:"
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace so trivial differences share a key."""
+    return " ".join((text or "").lower().split())
+
+
+def evaluation_cache_key(
+    prompt_version: str,
+    question_text: str,
+    expected_answer_points: str,
+    user_transcript: str
+) -> str:
+    """Build the content-addressed cache key for one evaluation."""
+    payload = "\x1f".join([
+        prompt_version,
+        normalize_text(question_text),
+        normalize_text(expected_answer_points),
+        normalize_text(user_transcript),
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """Two-tier (LRU + optional Redis) cache of evaluation results."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._redis = None
+        self._redis_checked = False
+
+    @property
+    def max_entries(self) -> int:
+        return int(get_config("EVALUATION_CACHE_SIZE", 4096))
+
+    @property
+    def ttl_seconds(self) -> int:
+        return int(get_config("EVALUATION_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+
+    def _redis_client(self):
+        if not self._redis_checked:
+            self._redis_checked = True
+            url = get_config("EVALUATION_CACHE_REDIS_URL")
+            if url:
+                import redis
+                self._redis = redis.Redis.from_url(url, socket_timeout=0.2)
+        return self._redis
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _local_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = self._redis_client()
+        if client is None:
+            return None
+        try:
+            raw = client.get(REDIS_KEY_PREFIX + key)
+            if raw is None:
+                return None
+            value = json.loads(raw)
+            if not isinstance(value, dict):
+                raise ValueError(f"expected an object, got {type(value).__name__}")
+        except ValueError:
+            # Corrupt or truncated entry: a miss, and don't serve it again
+            logger.warning(f"Dropping unreadable evaluation cache entry {key}", exc_info=True)
+            try:
+                client.delete(REDIS_KEY_PREFIX + key)
+            except Exception:
+                pass
+            return None
+        except Exception:
+            logger.warning("Evaluation cache Redis read failed", exc_info=True)
+            return None
+        self._remember(key, value)
+        return value
+
+    def _redis_set(self, key: str, value: Dict[str, Any]) -> None:
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            client.set(REDIS_KEY_PREFIX + key, json.dumps(value), ex=self.ttl_seconds)
+        except Exception:
+            logger.warning("Evaluation cache Redis write failed", exc_info=True)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached evaluation, or None on a miss."""
+        value = self._local_get(key)
+        if value is None:
+            value = self._redis_get(key)
+        return dict(value) if value is not None else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an evaluation in both tiers."""
+        self._remember(key, dict(value))
+        self._redis_set(key, value)
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """Async get; only a local miss goes to Redis, off the event loop."""
+        value = self._local_get(key)
+        if value is None and self._redis_client() is not None:
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(get_tool_executor(), self._redis_get, key)
+        return dict(value) if value is not None else None
+
+    async def aset(self, key: str, value: Dict[str, Any]) -> None:
+        """Async set; the Redis write runs off the event loop."""
+        self._remember(key, dict(value))
+        if self._redis_client() is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(get_tool_executor(), self._redis_set, key, value)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries expire on their own)."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Singleton instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """
+    Get the process-wide evaluation cache.
+
+    Returns:
+        EvaluationCache instance
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = EvaluationCache()
+
+    return _cache_instance
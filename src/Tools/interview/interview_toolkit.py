@@ -14,12 +14,6 @@ from src.tool_framework.base_toolkit import BaseToolkit
 from src.tool_framework.tool_config import ToolConfiguration
 from src.types.key_type import ToolConfigKeyType
 
-# Import interview tools
-from src.Tools.interview.question_selector import QuestionSelectorTool
-from src.Tools.interview.answer_evaluator import AnswerEvaluatorTool
-from src.Tools.interview.response_generator import ResponseGeneratorTool
-from src.Tools.interview.session_manager import SessionManagerTool
-
 
 class InterviewToolkit(BaseToolkit, ABC):
     """
@@ -40,10 +34,18 @@ class InterviewToolkit(BaseToolkit, ABC):
     def get_tools(self) -> List[BaseTool]:
         """
         Returns all interview tools.
+
+        Tool modules are imported here rather than at module level, so
+        importing the toolkit stays cheap until the tools are needed.
         
         Returns:
             List of BaseTool instances for interview operations
         """
+        from src.Tools.interview.question_selector import QuestionSelectorTool
+        from src.Tools.interview.answer_evaluator import AnswerEvaluatorTool
+        from src.Tools.interview.response_generator import ResponseGeneratorTool
+        from src.Tools.interview.session_manager import SessionManagerTool
+
         return [
             QuestionSelectorTool(),
             AnswerEvaluatorTool(),
@@ -100,4 +102,138 @@ class InterviewToolkit(BaseToolkit, ABC):
                 is_required=False,
                 is_secret=False
             ),
+
+            # Performance Configuration
+            ToolConfiguration(
+                key="LLM_HTTP_POOL_SIZE",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="TOOL_THREAD_POOL_SIZE",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="SESSION_WRITE_BEHIND",
+                key_type=ToolConfigKeyType.BOOLEAN,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="TURN_FLUSH_INTERVAL_MS",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="EVALUATOR_OUTPUT_MODE",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="EVALUATOR_MAX_TOKENS",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="EVALUATOR_FAST_PATH",
+                key_type=ToolConfigKeyType.BOOLEAN,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="EVALUATION_CACHE_SIZE",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="EVALUATION_CACHE_REDIS_URL",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=True
+            ),
+            ToolConfiguration(
+                key="EVALUATION_CACHE_TTL_SECONDS",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="RESPONSE_GENERATOR_MODE",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="RESPONSE_GENERATOR_MAX_TOKENS",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="TURN_SPECULATIVE_ACK",
+                key_type=ToolConfigKeyType.BOOLEAN,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="DEEP_EVALUATOR_MODEL",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="DEEP_EVALUATOR_MAX_TOKENS",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="POST_INTERVIEW_SCORING",
+                key_type=ToolConfigKeyType.BOOLEAN,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="QUESTION_SELECTOR_MODE",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="QUESTION_EMBEDDING_MODEL",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="QUESTION_EMBEDDING_DIM",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="QUESTION_VECTOR_DIR",
+                key_type=ToolConfigKeyType.STRING,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="QUESTION_VECTOR_NPROBE",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
+            ToolConfiguration(
+                key="QUESTION_VECTOR_IVF_MIN_ROWS",
+                key_type=ToolConfigKeyType.INTEGER,
+                is_required=False,
+                is_secret=False
+            ),
         ]
@@ -0,0 +1,182 @@
+# src/Tools/interview/llm_clients.py
+"""
+Shared LLM client registry for the interview tools.
+
+ChatOpenAI instances are cached per (model, base_url, temperature, api key),
+and every instance for the same endpoint shares one keep-alive HTTP connection
+pool, so consecutive LLM calls reuse warm TCP/TLS connections instead of
+opening a new one per call.
+
+Async connections belong to the event loop that opened them, so inside a
+running loop both the async pool and the ChatOpenAI instances using it are
+kept per loop and forgotten with it; a later asyncio.run() (another
+management command, a Celery task) gets fresh ones instead of connections
+tied to a closed loop. Outside any loop only the thread-safe sync pool is
+used.
+"""
+import os
+import sys
+import asyncio
+import hashlib
+import threading
+import weakref
+from typing import Callable, Dict, Optional, Tuple, Any, TYPE_CHECKING
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# Krutrim's OpenAI-compatible endpoint
+KRUTRIM_BASE_URL = "https://cloud.olakrutrim.com/v1"
+KRUTRIM_MODEL = "gpt-oss-120b"
+
+_lock = threading.Lock()
+# httpx and langchain_openai are imported on first use to keep imports cheap
+# Outside an event loop
+_llms: Dict[Tuple[str, str, float, str], Any] = {}
+_http_clients: Dict[str, Any] = {}
+# Per running event loop: {loop: {registry key: llm}} and {loop: {base_url: AsyncClient}}
+_loop_llms: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_loop_http_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# Optional factory that replaces ChatOpenAI (e.g. local stand-ins for benchmarks)
+_llm_factory: Optional[Callable[..., Any]] = None
+
+
+def set_chat_llm_factory(factory: Optional[Callable[..., Any]]) -> None:
+    """
+    Route get_chat_llm through a custom factory, or restore ChatOpenAI with None.
+
+    The factory receives the same keyword arguments as get_chat_llm and must
+    return a LangChain chat model.
+    """
+    global _llm_factory
+    with _lock:
+        _llm_factory = factory
+        _llms.clear()
+        _loop_llms.clear()
+
+
+def _pool_limits():
+    import httpx
+
+    pool_size = int(get_config("LLM_HTTP_POOL_SIZE", 20))
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=float(get_config("LLM_HTTP_KEEPALIVE_SECONDS", 60)),
+    )
+
+
+def _timeout():
+    import httpx
+
+    return httpx.Timeout(float(get_config("LLM_HTTP_TIMEOUT_SECONDS", 60)))
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_http_client(base_url: str) -> Any:
+    """Return the pooled sync HTTP client for an endpoint (shared by all threads)."""
+    client = _http_clients.get(base_url)
+    if client is None:
+        import httpx
+
+        client = _http_clients[base_url] = httpx.Client(limits=_pool_limits(), timeout=_timeout())
+    return client
+
+
+def _get_async_http_client(base_url: str, loop: asyncio.AbstractEventLoop) -> Any:
+    """Return the pooled async HTTP client for an endpoint on one event loop."""
+    clients = _loop_http_clients.setdefault(loop, {})
+    client = clients.get(base_url)
+    if client is None:
+        import httpx
+
+        client = clients[base_url] = httpx.AsyncClient(limits=_pool_limits(), timeout=_timeout())
+    return client
+
+
+def get_chat_llm(
+    api_key: str,
+    temperature: float,
+    model: str = KRUTRIM_MODEL,
+    base_url: str = KRUTRIM_BASE_URL,
+) -> "ChatOpenAI":
+    """
+    Get a shared ChatOpenAI client.
+
+    Args:
+        api_key: API key for the endpoint
+        temperature: Sampling temperature
+        model: Model name
+        base_url: OpenAI-compatible endpoint URL
+
+    Returns:
+        Cached ChatOpenAI instance backed by a pooled HTTP client (cached per
+        event loop when called inside one)
+    """
+    # Key on a digest so API keys are never held as plain dict keys
+    key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    registry_key = (model, base_url, float(temperature), key_digest)
+    loop = _running_loop()
+
+    llms = _llms if loop is None else _loop_llms.get(loop, {})
+    llm = llms.get(registry_key)
+    if llm is not None:
+        return llm
+
+    with _lock:
+        llms = _llms if loop is None else _loop_llms.setdefault(loop, {})
+        llm = llms.get(registry_key)
+        if llm is None:
+            if _llm_factory is not None:
+                llm = llms[registry_key] = _llm_factory(
+                    api_key=api_key, temperature=temperature, model=model, base_url=base_url
+                )
+                return llm
+
+            from langchain_openai import ChatOpenAI
+
+            clients = {"http_client": _get_http_client(base_url)}
+            if loop is not None:
+                clients["http_async_client"] = _get_async_http_client(base_url, loop)
+            llm = ChatOpenAI(
+                model=model,
+                base_url=base_url,
+                api_key=api_key,
+                temperature=temperature,
+                **clients,
+            )
+            llms[registry_key] = llm
+    return llm
+
+
+def close_llm_clients() -> None:
+    """Close pooled sync HTTP connections and forget cached clients."""
+    with _lock:
+        for http_client in _http_clients.values():
+            http_client.close()
+        _http_clients.clear()
+        _llms.clear()
+        _loop_llms.clear()
+
+
+async def aclose_llm_clients() -> None:
+    """Close the running event loop's async HTTP connections (e.g. before asyncio.run returns)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        _loop_llms.pop(loop, None)
+        clients = _loop_http_clients.pop(loop, {})
+    for client in clients.values():
+        await client.aclose()
@@ -0,0 +1,303 @@
+# src/Tools/interview/question_index.py
+"""
+Process-wide in-memory index of the question bank.
+
+Questions are grouped into buckets keyed by (difficulty, normalized topic), so
+picking a random question is a constant-time lookup instead of loading the
+whole table on every call. The index is loaded lazily on first use and kept in
+sync through Question post_save/post_delete signals.
+"""
+import os
+import sys
+import random
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+from src.apps.interviews.text import normalize_topic
+from src.Tools.interview.bootstrap import get_model
+
+# Fields copied out of each Question row into the index
+QUESTION_FIELDS = ("id", "text", "expected_answer_points", "difficulty", "topic", "difficulty_rating")
+# Precomputed QuestionStats numbers joined in on load
+STATS_FIELDS = ("stats__attempts", "stats__mean_score")
+
+BucketKey = Tuple[str, str]
+
+
+class _Bucket:
+    """Questions sharing one (difficulty, topic) key with O(1) add/remove."""
+    __slots__ = ("items", "positions")
+
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+        self.positions: Dict[str, int] = {}
+
+    def add(self, item: Dict[str, Any]) -> None:
+        position = self.positions.get(item["id"])
+        if position is not None:
+            self.items[position] = item
+            return
+        self.positions[item["id"]] = len(self.items)
+        self.items.append(item)
+
+    def remove(self, question_id: str) -> None:
+        # Swap-remove keeps deletion O(1); order inside a bucket is irrelevant
+        position = self.positions.pop(question_id)
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last["id"]] = position
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class QuestionPool:
+    """
+    A read view over the buckets matching one selection filter.
+
+    Positions 0..len-1 address every question in the pool, which lets callers
+    sample uniformly without copying the underlying lists.
+    """
+
+    def __init__(self, buckets: List[_Bucket], version: int, key: BucketKey = ("", "")):
+        self._buckets = buckets
+        self._size = sum(len(bucket) for bucket in buckets)
+        self.version = version
+        self.key = key
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, position: int) -> Dict[str, Any]:
+        """Return the question at a pool position."""
+        for bucket in self._buckets:
+            if position < len(bucket):
+                return bucket.items[position]
+            position -= len(bucket)
+        raise IndexError("question pool position out of range")
+
+    def ids(self) -> Iterator[str]:
+        """Iterate over the IDs of every question in the pool."""
+        for bucket in self._buckets:
+            yield from bucket.positions
+
+    def sample(self) -> Optional[Dict[str, Any]]:
+        """Return a uniformly random question from the pool, or None if empty."""
+        if not self._size:
+            return None
+        return self.get(random.randrange(self._size))
+
+
+class QuestionIndex:
+    """
+    In-memory question bank indexed by (difficulty, normalized topic).
+
+    The whole table is read once with a streaming query and then maintained
+    incrementally from model signals. Because signals only fire in the process
+    that wrote the row, the index is also reloaded after
+    QUESTION_INDEX_TTL_SECONDS (0 disables the reload) so edits made through
+    the admin eventually reach long-running bot processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._buckets: Dict[BucketKey, _Bucket] = {}
+        self._locations: Dict[str, BucketKey] = {}
+        self._match_cache: Dict[BucketKey, List[BucketKey]] = {}
+        self._loaded_at: Optional[float] = None
+        self.version = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return float(get_config("QUESTION_INDEX_TTL_SECONDS", 300))
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup reloads it from the database."""
+        with self._lock:
+            self._loaded_at = None
+
+    def ensure_loaded(self) -> None:
+        """Load the index if it is empty or older than the configured TTL."""
+        with self._lock:
+            ttl = self.ttl_seconds
+            expired = (
+                self._loaded_at is not None
+                and ttl > 0
+                and time.monotonic() - self._loaded_at > ttl
+            )
+            if self._loaded_at is None or expired:
+                self._load()
+
+    def _load(self) -> None:
+        Question = get_model('interviews.Question')
+
+        self._buckets = {}
+        self._locations = {}
+        self._match_cache = {}
+        rows = Question.objects.values(*QUESTION_FIELDS, *STATS_FIELDS).iterator(chunk_size=2000)
+        for row in rows:
+            self._add(_row_to_item(row))
+        self._loaded_at = time.monotonic()
+        self.version += 1
+
+    def _add(self, item: Dict[str, Any]) -> None:
+        key = (item["difficulty"].upper(), normalize_topic(item["topic"]))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+            self._match_cache.clear()
+        bucket.add(item)
+        self._locations[item["id"]] = key
+
+    def _remove(self, question_id: str) -> None:
+        key = self._locations.pop(question_id, None)
+        if key is None:
+            return
+        bucket = self._buckets[key]
+        bucket.remove(question_id)
+        if not bucket:
+            del self._buckets[key]
+            self._match_cache.clear()
+
+    def upsert(self, item: Dict[str, Any]) -> None:
+        """Insert or replace a question. No-op until the index is loaded."""
+        with self._lock:
+            if not self.is_loaded:
+                return
+            self._remove(item["id"])
+            self._add(item)
+            self.version += 1
+
+    def remove(self, question_id: str) -> None:
+        """Remove a question. No-op until the index is loaded."""
+        with self._lock:
+            if not self.is_loaded:
+                return
+            self._remove(question_id)
+            self.version += 1
+
+    def get(self, question_id: str) -> Optional[Dict[str, Any]]:
+        """Return a question by ID, or None if it is not in the bank."""
+        self.ensure_loaded()
+        with self._lock:
+            key = self._locations.get(question_id)
+            if key is None:
+                return None
+            bucket = self._buckets[key]
+            return bucket.items[bucket.positions[question_id]]
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Return every question in the bank (a snapshot list)."""
+        self.ensure_loaded()
+        with self._lock:
+            return [item for bucket in self._buckets.values() for item in bucket.items]
+
+    def pool(self, difficulty: str = "", topic: str = "") -> QuestionPool:
+        """
+        Return the pool of questions matching a filter.
+
+        Args:
+            difficulty: Difficulty level; empty matches every level
+            topic: Case-insensitive substring of the topic; empty matches all
+
+        Returns:
+            QuestionPool over the matching buckets
+        """
+        self.ensure_loaded()
+        query = (difficulty.upper(), normalize_topic(topic))
+        with self._lock:
+            keys = self._match_cache.get(query)
+            if keys is None:
+                # Resolved once per distinct filter; the number of distinct
+                # topics is tiny compared to the number of questions.
+                keys = [
+                    key for key in self._buckets
+                    if (not query[0] or key[0] == query[0]) and query[1] in key[1]
+                ]
+                self._match_cache[query] = keys
+            return QuestionPool(
+                [self._buckets[key] for key in keys], self.version, query
+            )
+
+    def sample(self, difficulty: str = "", topic: str = "") -> Optional[Dict[str, Any]]:
+        """Return a random question matching the filter, or None."""
+        with self._lock:
+            return self.pool(difficulty, topic).sample()
+
+
+def _row_to_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(row["id"]),
+        "text": row["text"],
+        "expected_answer_points": row["expected_answer_points"],
+        "difficulty": row["difficulty"],
+        "topic": row["topic"],
+        "difficulty_rating": row["difficulty_rating"],
+        # Absent for rows from save signals; refreshed on the next reload
+        "attempts": row.get("stats__attempts") or 0,
+        "mean_score": row.get("stats__mean_score"),
+    }
+
+
+# Singleton instance
+_index_instance = None
+_index_lock = threading.Lock()
+
+
+def get_question_index() -> QuestionIndex:
+    """
+    Get the process-wide question index.
+
+    The Question signal handlers are connected when the index is first
+    created, so importing this module does not import Django.
+
+    Returns:
+        QuestionIndex instance
+    """
+    global _index_instance
+
+    if _index_instance is None:
+        with _index_lock:
+            if _index_instance is None:
+                _connect_signals()
+                _index_instance = QuestionIndex()
+
+    return _index_instance
+
+
+def _on_question_saved(sender, instance, **kwargs):
+    get_question_index().upsert(
+        _row_to_item({field: getattr(instance, field) for field in QUESTION_FIELDS})
+    )
+
+
+def _on_question_deleted(sender, instance, **kwargs):
+    get_question_index().remove(str(instance.pk))
+
+
+def _connect_signals() -> None:
+    from django.db.models.signals import post_save, post_delete
+
+    # A lazy "app_label.Model" sender avoids importing the models module here
+    post_save.connect(
+        _on_question_saved,
+        sender="interviews.Question",
+        dispatch_uid="question_index_saved",
+    )
+    post_delete.connect(
+        _on_question_deleted,
+        sender="interviews.Question",
+        dispatch_uid="question_index_deleted",
+    )
@@ -1,8 +1,8 @@
 # src/Tools/interview/question_selector.py
 import os
 import sys
-import random
-from typing import Type, Dict, Any
+import logging
+from typing import Type, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 # Add project root to path
@@ -11,13 +11,11 @@ if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
 from src.tool_framework.base_tool import BaseTool
+from src.Tools.interview.bootstrap import ensure_django
+from src.Tools.interview.question_index import get_question_index
+from src.Tools.interview.session_history import get_session_history
 
-# Django setup
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-import django
-django.setup()
-
-from src.apps.interviews.models import Question
+logger = logging.getLogger(__name__)
 
 
 class QuestionSelectorInput(BaseModel):
@@ -31,12 +29,31 @@ class QuestionSelectorInput(BaseModel):
         default="",
         description="Optional topic filter (e.g., 'Network Engineering', 'Algorithms')"
     )
+    query: str = Field(
+        default="",
+        description=(
+            "Optional free text to pick the most related question, e.g. the "
+            "candidate's last answer (semantic mode only)"
+        )
+    )
 
 
 class QuestionSelectorTool(BaseTool):
     """
     Selects the next interview question from the database.
-    Uses smart selection based on difficulty, topic, and interview history.
+    Uses smart selection based on difficulty, topic, and interview history,
+    avoiding questions the session has already been asked.
+
+    QUESTION_SELECTOR_MODE picks how: "random" (default) draws uniformly from
+    the questions whose topic contains the filter; "semantic" ranks questions
+    by similarity to the query in the vector index (see vector_index), so a
+    follow-up can relate to what the candidate just said. The topic still
+    filters: only its questions are ranked, and a topic no question contains
+    is itself matched semantically, so "networking" finds "Network
+    Engineering". Semantic selection falls back to random when nothing
+    matches or the index is unavailable (e.g. still loading). "adaptive"
+    ignores the requested difficulty and picks the question most informative
+    about the candidate's current ability (see difficulty_engine).
     """
     name: str = "Question_Selector"
     args_schema: Type[BaseModel] = QuestionSelectorInput
@@ -49,7 +66,8 @@ class QuestionSelectorTool(BaseTool):
         self, 
         session_id: str, 
         difficulty: str = "MEDIUM",
-        topic: str = ""
+        topic: str = "",
+        query: str = ""
     ) -> Dict[str, Any]:
         """
         Execute the question selection logic.
@@ -58,41 +76,93 @@ class QuestionSelectorTool(BaseTool):
             session_id: The interview session ID
             difficulty: Question difficulty level
             topic: Optional topic filter
+            query: Optional text to rank questions by (semantic mode)
             
         Returns:
             Dictionary with question_id, text, expected_points, difficulty, topic
         """
         try:
-            # Build query
-            query = Question.objects.filter(difficulty=difficulty.upper())
-            
-            if topic:
-                query = query.filter(topic__icontains=topic)
-            
-            # Get all matching questions
-            questions = list(query)
-            
-            if not questions:
-                # Fallback: get any question if no matches
-                questions = list(Question.objects.all())
-                
-            if not questions:
+            ensure_django()
+            index = get_question_index()
+            history = get_session_history()
+
+            selected_question = None
+            ability = None
+            if self.mode == "semantic" and (query or topic):
+                selected_question = self._semantic_pick(session_id, difficulty, topic, query)
+            elif self.mode == "adaptive":
+                from src.Tools.interview.difficulty_engine import get_difficulty_engine
+
+                selected_question, ability = get_difficulty_engine().pick(session_id, topic)
+
+            if selected_question is None:
+                # Randomly select a question this session has not been asked yet
+                selected_question = history.draw(session_id, index.pool(difficulty, topic))
+
+            if selected_question is None:
+                # Fallback: get any unasked question if no matches
+                selected_question = history.draw(session_id, index.pool())
+
+            if selected_question is None:
+                # Every question has been asked; repeat one rather than stall
+                selected_question = index.pool().sample()
+
+            if selected_question is None:
                 return {
                     "error": "No questions found in database. Please add questions first."
                 }
             
-            # Randomly select one question
-            selected_question = random.choice(questions)
-            
-            return {
-                "question_id": str(selected_question.id),
-                "text": selected_question.text,
-                "expected_points": selected_question.expected_answer_points,
-                "difficulty": selected_question.difficulty,
-                "topic": selected_question.topic,
+            result = {
+                "question_id": selected_question["id"],
+                "text": selected_question["text"],
+                "expected_points": selected_question["expected_answer_points"],
+                "difficulty": selected_question["difficulty"],
+                "topic": selected_question["topic"],
             }
+            if ability is not None:
+                result["ability"] = round(ability, 2)
+            return result
             
         except Exception as e:
             return {
                 "error": f"Failed to select question: {str(e)}"
             }
+
+    @property
+    def mode(self) -> str:
+        return (self.get_tool_config('QUESTION_SELECTOR_MODE') or "random").lower()
+
+    def _semantic_pick(
+        self,
+        session_id: str,
+        difficulty: str,
+        topic: str,
+        query: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the unasked question (of the topic) most similar to the query, or None."""
+        text, within = query or topic, None
+        if topic:
+            pool = get_question_index().pool(difficulty, topic)
+            if len(pool):
+                # Rank only the topic's questions; the query just orders them
+                within = list(pool.ids())
+            else:
+                # No topic contains the filter literally; match it by meaning
+                text = topic
+
+        try:
+            from src.Tools.interview.vector_index import get_vector_index
+
+            matches = get_vector_index().search(
+                text, difficulty, k=1, exclude=get_session_history().asked_ids(session_id), within=within
+            )
+        except Exception:
+            logger.exception("Semantic question search failed; falling back to random selection")
+            return None
+
+        for question_id, _ in matches:
+            question = get_question_index().get(question_id)
+            if question is not None:
+                get_session_history().mark_asked(session_id, question_id)
+                return question
+        return None
@@ -1,9 +1,12 @@
 # src/Tools/interview/response_generator.py
 import os
+import re
 import sys
-from typing import Type, Dict, Any, List
+import json
+import hashlib
+import logging
+from typing import Type, Dict, Any, List, Tuple, AsyncIterator
 from pydantic import BaseModel, Field
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 # Add project root to path
@@ -12,22 +15,133 @@ if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
 from src.tool_framework.base_tool import BaseTool
+from src.Tools.interview.llm_clients import get_chat_llm
+from src.Tools.interview.answer_prescorer import local_evaluation
+from src.Tools.interview.answer_evaluator import failed_evaluation
+from src.Tools.interview.evaluation_cache import get_evaluation_cache, evaluation_cache_key
+
+logger = logging.getLogger(__name__)
 
 
 class ResponseGeneratorInput(BaseModel):
     """Input schema for response generation."""
-    evaluation_result: Dict = Field(..., description="The evaluation result from AnswerEvaluatorTool")
+    evaluation_result: Dict = Field(
+        default={},
+        description="The evaluation result from AnswerEvaluatorTool (leave empty in combined mode)"
+    )
     conversation_history: List[Dict] = Field(
         default=[],
         description="Previous conversation messages"
     )
     question_text: str = Field(..., description="The current question")
+    user_transcript: str = Field(default="", description="The user's answer (combined mode only)")
+    expected_answer_points: str = Field(
+        default="",
+        description="Expected key points for the answer (combined mode only)"
+    )
+
+
+# Response prompt (built once, shared by the sync and async paths)
+RESPONSE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a friendly AI technical interviewer conducting a voice interview.
+
+Guidelines:
+- Speak naturally as if in a real conversation
+- Keep responses concise (2-3 sentences max)
+- Don't use markdown formatting (no asterisks, underscores, etc.)
+- Be encouraging and constructive
+- Sound human, not robotic
+
+{instruction}"""),
+    ("user", """Question: {question}
+
+Evaluation Feedback: {feedback}
+
+Generate a natural spoken response:""")
+])
+
+# Combined prompt: score the answer and write the spoken reply in one call
+COMBINED_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a friendly AI technical interviewer conducting a voice interview.
+
+First evaluate the candidate's answer against the expected key points and score
+it from 0-10 (10 = perfect answer covering all points), giving partial credit
+for partially correct answers. Then write what you say to the candidate next:
+- If the score is 7 or more, acknowledge the answer positively and say you'll move to the next question
+- If the score is 4 to 6, give the feedback and move on
+- If the score is below 4, give a hint or ask a simpler follow-up question
+Keep the reply to 2-3 natural spoken sentences with no markdown.
+
+Reply with ONLY a JSON object, no other text:
+{{"score": <integer 0-10>, "reasoning": "<one sentence>", "feedback": "<one or two sentences>", "response": "<your spoken reply>"}}"""),
+    ("user", """Question: {question}
+
+Expected Key Points:
+{expected_points}
+
+Candidate's Answer:
+{user_answer}""")
+])
+
+FALLBACK_RESPONSE = "I apologize, I'm having trouble processing that. Let's continue."
+
+# A sentence ends at . ! or ? followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.S)
+
+
+def split_sentences(buffer: str) -> Tuple[List[str], str]:
+    """
+    Split streamed text into complete sentences and the unfinished remainder.
+
+    Args:
+        buffer: Text received so far
+
+    Returns:
+        Tuple of (complete sentences, remainder still being generated)
+    """
+    parts = _SENTENCE_END.split(buffer)
+    sentences = [part.strip() for part in parts[:-1] if part.strip()]
+    return sentences, parts[-1]
+
+
+def decide_action(score: int) -> Tuple[str, str]:
+    """
+    Map an answer score to the interviewer's next action.
+
+    Args:
+        score: Answer score (0-10)
+
+    Returns:
+        Tuple of (action, instruction for the response prompt)
+    """
+    if score >= 7:
+        return (
+            "next_question",
+            "The candidate did well. Acknowledge their answer positively and indicate you'll move to the next question."
+        )
+    if score >= 4:
+        return (
+            "next_question",
+            "The candidate's answer was okay but could be improved. Provide the feedback and move on."
+        )
+    return (
+        "follow_up",
+        "The candidate struggled with this question. Provide a hint or ask a simpler follow-up to help them."
+    )
 
 
 class ResponseGeneratorTool(BaseTool):
     """
     Generates conversational AI responses based on evaluation results.
     Decides whether to ask follow-up questions or move to the next question.
+
+    With RESPONSE_GENERATOR_MODE=combined and a user_transcript, the answer is
+    scored and the reply written in a single LLM call (no AnswerEvaluatorTool
+    call needed); the follow-up/next-question decision is still made locally
+    from the score. Combined mode uses the same fast path (EVALUATOR_FAST_PATH)
+    and evaluation cache as AnswerEvaluatorTool.
     """
     name: str = "Response_Generator"
     args_schema: Type[BaseModel] = ResponseGeneratorInput
@@ -38,92 +152,287 @@ class ResponseGeneratorTool(BaseTool):
 
     def _execute(
         self,
-        evaluation_result: Dict,
+        evaluation_result: Dict = None,
         conversation_history: List[Dict] = None,
-        question_text: str = ""
+        question_text: str = "",
+        user_transcript: str = "",
+        expected_answer_points: str = ""
     ) -> Dict[str, Any]:
         """
         Execute the response generation logic.
-        
+
         Args:
             evaluation_result: Score, reasoning, feedback from evaluator
             conversation_history: Previous messages
             question_text: Current question
-            
+            user_transcript: The user's answer (combined mode only)
+            expected_answer_points: Expected key points (combined mode only)
+
         Returns:
-            Dictionary with response_text and action (follow_up or next_question)
+            Dictionary with response_text and action (follow_up or next_question);
+            in combined mode also the evaluation it produced
         """
         if conversation_history is None:
             conversation_history = []
-            
+
+        if self._use_combined(user_transcript):
+            return self._execute_combined(question_text, expected_answer_points, user_transcript)
+
         try:
-            # Get Krutrim API key
-            krutrim_api_key = self.get_tool_config('KRUTRIM_API_KEY')
-            if not krutrim_api_key:
+            chain = self._build_chain()
+            if chain is None:
                 return {
                     "error": "KRUTRIM_API_KEY not configured in environment"
                 }
-            
-            # Initialize LLM
-            llm = ChatOpenAI(
-                model="gpt-oss-120b",
-                base_url="https://cloud.olakrutrim.com/v1",
-                api_key=krutrim_api_key,
-                temperature=0.7  # Higher temperature for natural conversation
-            )
-            
-            score = evaluation_result.get('score', 0)
-            feedback = evaluation_result.get('feedback', '')
-            
-            # Determine action based on score
-            if score >= 7:
-                action = "next_question"
-                instruction = "The candidate did well. Acknowledge their answer positively and indicate you'll move to the next question."
-            elif score >= 4:
-                action = "next_question"
-                instruction = "The candidate's answer was okay but could be improved. Provide the feedback and move on."
-            else:
-                action = "follow_up"
-                instruction = "The candidate struggled with this question. Provide a hint or ask a simpler follow-up to help them."
-            
-            # Create response prompt
-            response_prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are a friendly AI technical interviewer conducting a voice interview.
-
-Guidelines:
-- Speak naturally as if in a real conversation
-- Keep responses concise (2-3 sentences max)
-- Don't use markdown formatting (no asterisks, underscores, etc.)
-- Be encouraging and constructive
-- Sound human, not robotic
-
-{instruction}"""),
-                ("user", """Question: {question}
 
-Evaluation Feedback: {feedback}
+            score, action, inputs = self._prepare(evaluation_result, question_text)
 
-Generate a natural spoken response:""")
-            ])
-            
             # Generate response
-            chain = response_prompt | llm
-            result = chain.invoke({
-                "question": question_text,
-                "feedback": feedback,
-                "instruction": instruction
-            })
-            
-            response_text = result.content.strip()
-            
+            result = chain.invoke(inputs)
+
             return {
-                "response_text": response_text,
+                "response_text": result.content.strip(),
                 "action": action,
                 "score": score
             }
-            
+
         except Exception as e:
+            return self._failed_response(e)
+
+    async def _aexecute(
+        self,
+        evaluation_result: Dict = None,
+        conversation_history: List[Dict] = None,
+        question_text: str = "",
+        user_transcript: str = "",
+        expected_answer_points: str = ""
+    ) -> Dict[str, Any]:
+        """Async version of _execute using the LLM's native ainvoke."""
+        if self._use_combined(user_transcript):
+            return await self._aexecute_combined(question_text, expected_answer_points, user_transcript)
+
+        try:
+            chain = self._build_chain()
+            if chain is None:
+                return {
+                    "error": "KRUTRIM_API_KEY not configured in environment"
+                }
+
+            score, action, inputs = self._prepare(evaluation_result, question_text)
+
+            result = await chain.ainvoke(inputs)
+
             return {
-                "error": f"Failed to generate response: {str(e)}",
-                "response_text": "I apologize, I'm having trouble processing that. Let's continue.",
-                "action": "next_question"
+                "response_text": result.content.strip(),
+                "action": action,
+                "score": score
             }
+
+        except Exception as e:
+            return self._failed_response(e)
+
+    def _build_chain(self):
+        """Return the response chain, or None if the API key is missing."""
+        # Get Krutrim API key
+        krutrim_api_key = self.get_tool_config('KRUTRIM_API_KEY')
+        if not krutrim_api_key:
+            return None
+
+        # Shared, connection-pooled LLM client
+        llm = get_chat_llm(
+            api_key=krutrim_api_key,
+            temperature=0.7  # Higher temperature for natural conversation
+        )
+        return RESPONSE_PROMPT | llm
+
+    @property
+    def mode(self) -> str:
+        return (self.get_tool_config('RESPONSE_GENERATOR_MODE') or "separate").lower()
+
+    def _use_combined(self, user_transcript: str) -> bool:
+        return self.mode == "combined" and bool(user_transcript)
+
+    def _execute_combined(self, question_text: str, expected_answer_points: str, user_transcript: str) -> Dict[str, Any]:
+        """Score the answer and write the reply with one LLM call."""
+        try:
+            evaluation = local_evaluation(user_transcript)
+            cache = get_evaluation_cache()
+            cache_key = self._combined_cache_key(question_text, expected_answer_points, user_transcript)
+            if evaluation is None:
+                evaluation = cache.get(cache_key)
+                if evaluation is not None:
+                    evaluation["cached"] = True
+            if evaluation is not None:
+                # Already scored, so only the reply needs the LLM
+                return {**self._execute(evaluation, question_text=question_text), "evaluation": evaluation}
+
+            chain = self._build_combined_chain()
+            if chain is None:
+                return self._failed_combined("KRUTRIM_API_KEY not configured in environment")
+
+            result = chain.invoke({
+                "question": question_text,
+                "expected_points": expected_answer_points,
+                "user_answer": user_transcript
+            })
+            response = self._parse_combined(result.content)
+            cache.set(cache_key, response["evaluation"])
+            return response
+
+        except Exception as e:
+            return self._failed_combined(e)
+
+    async def _aexecute_combined(self, question_text: str, expected_answer_points: str, user_transcript: str) -> Dict[str, Any]:
+        """Async version of _execute_combined."""
+        try:
+            evaluation = local_evaluation(user_transcript)
+            cache = get_evaluation_cache()
+            cache_key = self._combined_cache_key(question_text, expected_answer_points, user_transcript)
+            if evaluation is None:
+                evaluation = await cache.aget(cache_key)
+                if evaluation is not None:
+                    evaluation["cached"] = True
+            if evaluation is not None:
+                return {**await self._aexecute(evaluation, question_text=question_text), "evaluation": evaluation}
+
+            chain = self._build_combined_chain()
+            if chain is None:
+                return self._failed_combined("KRUTRIM_API_KEY not configured in environment")
+
+            result = await chain.ainvoke({
+                "question": question_text,
+                "expected_points": expected_answer_points,
+                "user_answer": user_transcript
+            })
+            response = self._parse_combined(result.content)
+            await cache.aset(cache_key, response["evaluation"])
+            return response
+
+        except Exception as e:
+            return self._failed_combined(e)
+
+    @staticmethod
+    def _combined_cache_key(question_text: str, expected_answer_points: str, user_transcript: str) -> str:
+        """Evaluation cache key for combined mode (its own prompt, so its own keys)."""
+        prompt_version = hashlib.sha256(repr(COMBINED_PROMPT.messages).encode("utf-8")).hexdigest()[:16]
+        return evaluation_cache_key(
+            f"combined:{prompt_version}",
+            question_text,
+            expected_answer_points,
+            user_transcript,
+        )
+
+    @classmethod
+    def _failed_combined(cls, error: Any) -> Dict[str, Any]:
+        # The turn is still saved with a failed evaluation (not a real 0),
+        # which the post-interview re-scoring replaces
+        return {**cls._failed_response(error), "evaluation": failed_evaluation(error)}
+
+    def _build_combined_chain(self):
+        """Return the combined evaluate+respond chain, or None if the API key is missing."""
+        krutrim_api_key = self.get_tool_config('KRUTRIM_API_KEY')
+        if not krutrim_api_key:
+            return None
+
+        # Scoring wants the evaluator's low temperature more than chatty variety
+        llm = get_chat_llm(
+            api_key=krutrim_api_key,
+            temperature=0.3
+        )
+        max_tokens = int(self.get_tool_config('RESPONSE_GENERATOR_MAX_TOKENS') or 300)
+        return COMBINED_PROMPT | llm.bind(max_tokens=max_tokens)
+
+    @staticmethod
+    def _parse_combined(raw_text: str) -> Dict[str, Any]:
+        """Split the combined JSON reply into the evaluation and the spoken response."""
+        match = _JSON_OBJECT.search(raw_text)
+        if not match:
+            raise ValueError("Combined response did not contain a JSON object")
+        data = json.loads(match.group(0))
+
+        score = max(0, min(10, int(data["score"])))
+        response_text = str(data.get("response", "")).strip() or FALLBACK_RESPONSE
+        # The model is told the thresholds, but the action is decided here
+        action, _ = decide_action(score)
+
+        return {
+            "response_text": response_text,
+            "action": action,
+            "score": score,
+            "evaluation": {
+                "score": score,
+                "reasoning": str(data.get("reasoning", "")).strip(),
+                "feedback": str(data.get("feedback", "")).strip(),
+                "raw_evaluation": raw_text,
+                "source": "combined",
+            },
+        }
+
+    @staticmethod
+    def _prepare(evaluation_result: Dict, question_text: str) -> Tuple[int, str, Dict[str, Any]]:
+        """Pick the next action and build the prompt inputs."""
+        evaluation_result = evaluation_result or {}
+        score = evaluation_result.get('score', 0)
+        feedback = evaluation_result.get('feedback', '')
+
+        # Determine action based on score
+        action, instruction = decide_action(score)
+
+        return score, action, {
+            "question": question_text,
+            "feedback": feedback,
+            "instruction": instruction
+        }
+
+    @staticmethod
+    def _failed_response(error: Exception) -> Dict[str, Any]:
+        return {
+            "error": f"Failed to generate response: {str(error)}",
+            "response_text": FALLBACK_RESPONSE,
+            "action": "next_question"
+        }
+
+    async def astream_response(
+        self,
+        evaluation_result: Dict,
+        question_text: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream the spoken response sentence by sentence.
+
+        Sentences are yielded as soon as the LLM finishes them, so text-to-speech
+        can start on the first one while the rest is still being generated.
+
+        Args:
+            evaluation_result: Score, reasoning, feedback from evaluator
+            question_text: Current question
+
+        Yields:
+            Sentence-sized chunks of the response text
+        """
+        spoken = False
+        try:
+            chain = self._build_chain()
+            if chain is None:
+                yield FALLBACK_RESPONSE
+                return
+
+            _, _, inputs = self._prepare(evaluation_result, question_text)
+
+            buffer = ""
+            async for chunk in chain.astream(inputs):
+                buffer += chunk.content
+                sentences, buffer = split_sentences(buffer)
+                for sentence in sentences:
+                    spoken = True
+                    yield sentence
+
+            if buffer.strip():
+                spoken = True
+                yield buffer.strip()
+
+        except Exception:
+            logger.exception("Streaming response failed after %s", "partial output" if spoken else "no output")
+            # Only apologise if the candidate has not heard anything yet
+            if not spoken:
+                yield FALLBACK_RESPONSE
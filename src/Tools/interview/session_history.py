@@ -0,0 +1,174 @@
+# src/Tools/interview/session_history.py
+"""
+Per-session "already asked" tracking for question selection.
+
+Each session keeps the set of question IDs it has seen (seeded once from
+InterviewTurn) and one lazily shuffled permutation per selection filter, so a
+fresh question is drawn uniformly from the remaining pool in O(1) amortized
+time without rescanning interview history on every pick.
+"""
+import os
+import sys
+import random
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Any
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+from src.Tools.interview.question_index import QuestionPool, BucketKey
+from src.Tools.interview.bootstrap import get_model
+
+
+class _PermutationCursor:
+    """
+    Lazy Fisher-Yates shuffle over a question pool.
+
+    Only the positions that have been swapped are stored, so creating a cursor
+    is O(1) and each draw is O(1) regardless of pool size.
+    """
+    __slots__ = ("pool", "position", "swaps")
+
+    def __init__(self, pool: QuestionPool):
+        self.pool = pool
+        self.position = 0
+        self.swaps: Dict[int, int] = {}
+
+    def draw(self) -> Optional[Dict[str, Any]]:
+        size = len(self.pool)
+        if self.position >= size:
+            return None
+        pick = random.randrange(self.position, size)
+        chosen = self.swaps.get(pick, pick)
+        self.swaps[pick] = self.swaps.pop(self.position, self.position)
+        self.position += 1
+        return self.pool.get(chosen)
+
+
+class _SessionState:
+    __slots__ = ("asked", "cursors")
+
+    def __init__(self, asked: Set[str]):
+        self.asked = asked
+        self.cursors: Dict[BucketKey, _PermutationCursor] = {}
+
+
+class SessionQuestionHistory:
+    """
+    In-memory record of the questions each session has already been asked.
+
+    At most QUESTION_HISTORY_MAX_SESSIONS sessions are kept; the least recently
+    used one is evicted and simply re-seeded from the database if it returns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, _SessionState]" = OrderedDict()
+
+    @property
+    def max_sessions(self) -> int:
+        return int(get_config("QUESTION_HISTORY_MAX_SESSIONS", 10000))
+
+    def _seed(self, session_id: str) -> Set[str]:
+        from django.core.exceptions import ValidationError
+        InterviewTurn = get_model('interviews.InterviewTurn')
+
+        try:
+            asked = (
+                InterviewTurn.objects
+                .filter(session_id=session_id, question_id__isnull=False)
+                .values_list("question_id", flat=True)
+            )
+            return {str(question_id) for question_id in asked}
+        except (ValidationError, ValueError):
+            # Not a valid session ID, so there is no history to seed from
+            return set()
+
+    def _state(self, session_id: str) -> _SessionState:
+        state = self._sessions.get(session_id)
+        if state is not None:
+            self._sessions.move_to_end(session_id)
+            return state
+
+        # Seed outside the lock so one slow query does not stall other sessions
+        self._lock.release()
+        try:
+            asked = self._seed(session_id)
+        finally:
+            self._lock.acquire()
+
+        state = self._sessions.setdefault(session_id, _SessionState(asked))
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        return state
+
+    def mark_asked(self, session_id: str, question_id: str) -> None:
+        """Record that a question was asked in a session."""
+        if not session_id or not question_id:
+            return
+        with self._lock:
+            self._state(session_id).asked.add(str(question_id))
+
+    def asked_ids(self, session_id: str) -> Set[str]:
+        """Return a copy of the question IDs a session has been asked."""
+        if not session_id:
+            return set()
+        with self._lock:
+            return set(self._state(session_id).asked)
+
+    def draw(self, session_id: str, pool: QuestionPool) -> Optional[Dict[str, Any]]:
+        """
+        Draw a question from the pool that the session has not been asked yet.
+
+        Args:
+            session_id: The interview session ID; empty disables repeat-avoidance
+            pool: Candidate questions from the question index
+
+        Returns:
+            The selected question (recorded as asked), or None if every
+            question in the pool has already been asked
+        """
+        if not session_id:
+            return pool.sample()
+
+        with self._lock:
+            state = self._state(session_id)
+            cursor = state.cursors.get(pool.key)
+            if cursor is None or cursor.pool.version != pool.version:
+                # The bank changed; restart the shuffle; asked IDs still apply
+                cursor = state.cursors[pool.key] = _PermutationCursor(pool)
+
+            while True:
+                question = cursor.draw()
+                if question is None:
+                    return None
+                if question["id"] not in state.asked:
+                    state.asked.add(question["id"])
+                    return question
+
+
+# Singleton instance
+_history_instance = None
+_history_lock = threading.Lock()
+
+
+def get_session_history() -> SessionQuestionHistory:
+    """
+    Get the process-wide session question history.
+
+    Returns:
+        SessionQuestionHistory instance
+    """
+    global _history_instance
+
+    if _history_instance is None:
+        with _history_lock:
+            if _history_instance is None:
+                _history_instance = SessionQuestionHistory()
+
+    return _history_instance
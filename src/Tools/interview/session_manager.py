@@ -1,9 +1,9 @@
 # src/Tools/interview/session_manager.py
 import os
 import sys
+import uuid
 from typing import Type, Dict, Any
 from pydantic import BaseModel, Field
-from datetime import datetime
 
 # Add project root to path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
@@ -11,14 +11,10 @@ if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
 from src.tool_framework.base_tool import BaseTool
-
-# Django setup
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-import django
-django.setup()
-
-from src.apps.interviews.models import InterviewSession, InterviewTurn, Question
-from src.apps.users.models import User
+from src.Tools.interview.bootstrap import ensure_django, get_model
+from src.Tools.interview.session_history import get_session_history
+from src.Tools.interview.difficulty_engine import get_difficulty_engine
+from src.Tools.interview.turn_writer import as_uuid, get_turn_buffer, write_behind_enabled
 
 
 class SessionManagerInput(BaseModel):
@@ -34,12 +30,14 @@ class SessionManagerInput(BaseModel):
     ai_message: str = Field(default="", description="AI's response (for save_turn)")
     score: int = Field(default=0, description="Answer score 0-10 (for save_turn)")
     feedback: str = Field(default="", description="Evaluation feedback (for save_turn)")
+    eval_latency_ms: float = Field(default=0.0, description="Evaluation time in ms, 0 if unknown (for save_turn)")
 
 
 class SessionManagerTool(BaseTool):
     """
     Manages interview sessions and turns in the Django database.
     Handles creation, updates, and persistence of interview data.
+    Completing a session queues its deep re-scoring and report on Celery.
     """
     name: str = "Session_Manager"
     args_schema: Type[BaseModel] = SessionManagerInput
@@ -57,7 +55,8 @@ class SessionManagerTool(BaseTool):
         user_transcript: str = "",
         ai_message: str = "",
         score: int = 0,
-        feedback: str = ""
+        feedback: str = "",
+        eval_latency_ms: float = 0.0
     ) -> Dict[str, Any]:
         """
         Execute session management actions.
@@ -71,17 +70,19 @@ class SessionManagerTool(BaseTool):
             ai_message: AI's response
             score: Answer score
             feedback: Evaluation feedback
+            eval_latency_ms: How long the evaluation took (QuestionStats)
             
         Returns:
             Dictionary with session_id, status, and action result
         """
         try:
+            ensure_django()
             if action == "create":
                 return self._create_session(user_id)
             elif action == "save_turn":
                 return self._save_turn(
                     session_id, question_id, user_transcript, 
-                    ai_message, score, feedback
+                    ai_message, score, feedback, eval_latency_ms
                 )
             elif action == "complete":
                 return self._complete_session(session_id)
@@ -91,8 +92,41 @@ class SessionManagerTool(BaseTool):
         except Exception as e:
             return {"error": f"Session management failed: {str(e)}"}
 
+    async def _aexecute(
+        self,
+        action: str,
+        user_id: str = "",
+        session_id: str = "",
+        question_id: str = "",
+        user_transcript: str = "",
+        ai_message: str = "",
+        score: int = 0,
+        feedback: str = "",
+        eval_latency_ms: float = 0.0
+    ) -> Dict[str, Any]:
+        """Async version of _execute using Django's async ORM."""
+        try:
+            ensure_django()
+            if action == "create":
+                return await self._acreate_session(user_id)
+            elif action == "save_turn":
+                return await self._asave_turn(
+                    session_id, question_id, user_transcript,
+                    ai_message, score, feedback, eval_latency_ms
+                )
+            elif action == "complete":
+                return await self._acomplete_session(session_id)
+            else:
+                return {"error": f"Unknown action: {action}"}
+
+        except Exception as e:
+            return {"error": f"Session management failed: {str(e)}"}
+
     def _create_session(self, user_id: str) -> Dict[str, Any]:
         """Create a new interview session."""
+        InterviewSession = get_model('interviews.InterviewSession')
+        User = get_model('users.User')
+
         try:
             # Get or create a default user if user_id not provided
             if not user_id:
@@ -125,52 +159,233 @@ class SessionManagerTool(BaseTool):
         user_transcript: str,
         ai_message: str,
         score: int,
-        feedback: str
+        feedback: str,
+        eval_latency_ms: float = 0.0
     ) -> Dict[str, Any]:
-        """Save a conversation turn to the database."""
+        """
+        Save a conversation turn to the database.
+
+        The turn insert, the session's running-score update and the
+        question's QuestionStats update share one transaction, and both
+        aggregates are folded in with F() expressions, so the cost does not
+        grow with the number of turns. With SESSION_WRITE_BEHIND enabled the
+        turn is buffered instead.
+        """
+        from django.db import transaction
+        InterviewSession = get_model('interviews.InterviewSession')
+        InterviewTurn = get_model('interviews.InterviewTurn')
+        Question = get_model('interviews.Question')
+        QuestionStats = get_model('interviews.QuestionStats')
+
+        if write_behind_enabled():
+            return self._queue_turn(
+                session_id, question_id, user_transcript,
+                ai_message, score, feedback, eval_latency_ms
+            )
+
         try:
-            session = InterviewSession.objects.get(id=session_id)
-            question = Question.objects.get(id=question_id) if question_id else None
-            
-            # Create turn
-            turn = InterviewTurn.objects.create(
-                session=session,
-                question=question,
-                ai_message=ai_message,
-                user_transcript=user_transcript,
-                score=score,
-                feedback=feedback
+            # Ids come from the LLM; a malformed or unknown one is stored as no question
+            question_uuid = as_uuid(question_id)
+            question = Question.objects.filter(id=question_uuid).first() if question_uuid else None
+
+            with transaction.atomic():
+                # Update session total score (running average of all turns)
+                if not InterviewSession.add_turn_scores(session_id, turns=1, score_sum=score):
+                    raise InterviewSession.DoesNotExist(
+                        "InterviewSession matching query does not exist."
+                    )
+
+                # Create turn
+                turn = InterviewTurn.objects.create(
+                    session_id=session_id,
+                    question=question,
+                    ai_message=ai_message,
+                    user_transcript=user_transcript,
+                    score=score,
+                    feedback=feedback,
+                    eval_latency_ms=round(eval_latency_ms) or None
+                )
+                if question is not None:
+                    QuestionStats.add_turns(
+                        QuestionStats.tally([(question.id, score, user_transcript)])
+                    )
+
+            get_session_history().mark_asked(session_id, question_id)
+            get_difficulty_engine().record(session_id, question_id, score)
+            total_score = (
+                InterviewSession.objects
+                .values_list('total_score', flat=True)
+                .get(id=session_id)
             )
             
-            # Update session total score (average of all turns)
-            turns = session.turns.all()
-            if turns:
-                avg_score = sum(t.score for t in turns) / len(turns)
-                session.total_score = avg_score
-                session.save()
-            
             return {
-                "session_id": str(session.id),
+                "session_id": str(session_id),
                 "turn_id": str(turn.id),
                 "status": "saved",
-                "total_score": session.total_score
+                "total_score": total_score
             }
         except Exception as e:
             return {"error": f"Failed to save turn: {str(e)}"}
 
+    def _queue_turn(
+        self,
+        session_id: str,
+        question_id: str,
+        user_transcript: str,
+        ai_message: str,
+        score: int,
+        feedback: str,
+        eval_latency_ms: float = 0.0
+    ) -> Dict[str, Any]:
+        """Buffer a turn for write-behind persistence (no database round-trip)."""
+        try:
+            if as_uuid(session_id) is None:
+                return {"error": f"Failed to queue turn: invalid session_id {session_id!r}"}
+            turn_id = uuid.uuid4()
+            get_turn_buffer().append({
+                "id": turn_id,
+                "session_id": session_id,
+                # Ids come from the LLM; a malformed one is stored as no question
+                "question_id": as_uuid(question_id),
+                "ai_message": ai_message,
+                "user_transcript": user_transcript,
+                "score": score,
+                "feedback": feedback,
+                "eval_latency_ms": round(eval_latency_ms) or None,
+            })
+            get_session_history().mark_asked(session_id, question_id)
+            get_difficulty_engine().record(session_id, question_id, score)
+
+            # total_score is only known once the buffer has been flushed
+            return {
+                "session_id": str(session_id),
+                "turn_id": str(turn_id),
+                "status": "queued",
+                "total_score": None
+            }
+        except Exception as e:
+            return {"error": f"Failed to queue turn: {str(e)}"}
+
     def _complete_session(self, session_id: str) -> Dict[str, Any]:
         """Mark a session as completed."""
+        from django.utils import timezone
+        InterviewSession = get_model('interviews.InterviewSession')
+
         try:
+            # Make buffered turns durable before reporting final totals
+            if write_behind_enabled():
+                get_turn_buffer().flush()
+
             session = InterviewSession.objects.get(id=session_id)
             session.status = 'COMPLETED'
-            session.end_time = datetime.now()
-            session.save()
+            session.end_time = timezone.now()
+            session.save(update_fields=['status', 'end_time'])
             
             return {
                 "session_id": str(session.id),
                 "status": "completed",
                 "total_score": session.total_score,
-                "total_turns": session.turns.count()
+                "total_turns": session.turn_count,
+                **self._queue_report(str(session.id))
+            }
+        except Exception as e:
+            return {"error": f"Failed to complete session: {str(e)}"}
+
+    def _queue_report(self, session_id: str) -> Dict[str, Any]:
+        """
+        Queue post-interview deep scoring on the Celery workers.
+
+        The task is sent by name (see apps/interviews/tasks.py), so the tools do
+        not import the Django app's task module. Disabled with
+        POST_INTERVIEW_SCORING=false; a broker failure never fails completion.
+        """
+        enabled = (self.get_tool_config('POST_INTERVIEW_SCORING') or "true").lower()
+        if enabled not in ("1", "true", "yes", "on"):
+            return {"report": "disabled"}
+
+        try:
+            from celery import current_app
+
+            current_app.send_task("interviews.score_session", args=[session_id])
+            return {"report": "queued"}
+        except Exception as e:
+            return {"report": "not_queued", "report_error": f"Failed to queue scoring: {str(e)}"}
+
+    async def _acreate_session(self, user_id: str) -> Dict[str, Any]:
+        """Async version of _create_session."""
+        InterviewSession = get_model('interviews.InterviewSession')
+        User = get_model('users.User')
+
+        try:
+            if not user_id:
+                user, _ = await User.objects.aget_or_create(
+                    username="test_user",
+                    defaults={"email": "test@example.com"}
+                )
+            else:
+                user = await User.objects.aget(id=user_id)
+
+            session = await InterviewSession.objects.acreate(
+                user=user,
+                status='STARTED',
+                total_score=0.0
+            )
+
+            return {
+                "session_id": str(session.id),
+                "status": "created",
+                "user_id": str(user.id)
+            }
+        except Exception as e:
+            return {"error": f"Failed to create session: {str(e)}"}
+
+    async def _asave_turn(
+        self,
+        session_id: str,
+        question_id: str,
+        user_transcript: str,
+        ai_message: str,
+        score: int,
+        feedback: str,
+        eval_latency_ms: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Async version of _save_turn.
+
+        Django's async ORM cannot open transactions yet, so the transactional
+        sync implementation is run through sync_to_async.
+        """
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(self._save_turn)(
+            session_id, question_id, user_transcript,
+            ai_message, score, feedback, eval_latency_ms
+        )
+
+    async def _acomplete_session(self, session_id: str) -> Dict[str, Any]:
+        """Async version of _complete_session."""
+        from asgiref.sync import sync_to_async
+        from django.utils import timezone
+        InterviewSession = get_model('interviews.InterviewSession')
+
+        try:
+            if write_behind_enabled():
+                await sync_to_async(get_turn_buffer().flush)()
+
+            session = await InterviewSession.objects.aget(id=session_id)
+            session.status = 'COMPLETED'
+            session.end_time = timezone.now()
+            await session.asave(update_fields=['status', 'end_time'])
+
+            # Publishing to the broker is blocking network I/O
+            report = await sync_to_async(self._queue_report)(str(session.id))
+
+            return {
+                "session_id": str(session.id),
+                "status": "completed",
+                "total_score": session.total_score,
+                "total_turns": session.turn_count,
+                **report
             }
         except Exception as e:
             return {"error": f"Failed to complete session: {str(e)}"}
@@ -0,0 +1,309 @@
+# src/Tools/interview/turn_orchestrator.py
+"""
+Per-turn orchestration that overlaps the interview stages.
+
+Serially, a turn is evaluate -> respond -> persist, and the candidate hears
+nothing until the second LLM call returns. The orchestrator instead:
+
+- speaks a short neutral acknowledgement as soon as the turn starts
+  (TURN_SPECULATIVE_ACK), so there is audio while the evaluator runs;
+- prefetches the next question alongside the evaluation;
+- streams the spoken response sentence by sentence;
+- persists the turn in the background after the response is out.
+
+Speech is best effort: a TTS failure is logged and the turn still completes
+and persists.
+
+With RESPONSE_GENERATOR_MODE=combined the evaluate and respond stages are a
+single LLM call (see ResponseGeneratorTool).
+
+Each stage's wall-clock time is reported in the result's "timings";
+"persist" is added to the same dict once the background save finishes (see
+drain()).
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import itertools
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+from src.Tools.interview.answer_evaluator import AnswerEvaluatorTool, failed_evaluation
+from src.Tools.interview.question_selector import QuestionSelectorTool
+from src.Tools.interview.response_generator import ResponseGeneratorTool, decide_action, FALLBACK_RESPONSE
+from src.Tools.interview.session_manager import SessionManagerTool
+
+logger = logging.getLogger(__name__)
+
+# Said before the score is known, so they must not imply a verdict
+NEUTRAL_ACKS = (
+    "Okay, thanks.",
+    "Alright, got it.",
+    "Thanks for that.",
+    "Okay.",
+)
+
+Speaker = Callable[[str], Awaitable[Any]]
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class TurnOrchestrator:
+    """
+    Runs one interview turn with evaluation, question prefetch and speech overlapped.
+
+    The prefetched question is kept per session until it is used: after a
+    follow-up turn it is served on the next call to next_question() instead of
+    being discarded (the selector has already recorded it as asked).
+    """
+
+    def __init__(
+        self,
+        evaluator: Optional[AnswerEvaluatorTool] = None,
+        responder: Optional[ResponseGeneratorTool] = None,
+        selector: Optional[QuestionSelectorTool] = None,
+        session_manager: Optional[SessionManagerTool] = None
+    ):
+        self.evaluator = evaluator or AnswerEvaluatorTool()
+        self.responder = responder or ResponseGeneratorTool()
+        self.selector = selector or QuestionSelectorTool()
+        self.session_manager = session_manager or SessionManagerTool()
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
+        self._persist_tasks: Set[asyncio.Task] = set()
+        self._acks = itertools.cycle(NEUTRAL_ACKS)
+
+    @property
+    def speculative_ack(self) -> bool:
+        return str(get_config("TURN_SPECULATIVE_ACK", "true")).lower() in ("1", "true", "yes", "on")
+
+    async def next_question(
+        self,
+        session_id: str,
+        difficulty: str = "MEDIUM",
+        topic: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Return the next question, using the prefetched one when available.
+
+        Args:
+            session_id: The interview session ID
+            difficulty: Question difficulty level
+            topic: Optional topic filter
+
+        Returns:
+            QuestionSelectorTool result dictionary
+        """
+        question = self._prefetched.pop(session_id, None)
+        if question is not None:
+            return question
+        return await self.selector._aexecute(session_id, difficulty, topic)
+
+    async def run_turn(
+        self,
+        session_id: str,
+        question: Dict[str, Any],
+        user_transcript: str,
+        difficulty: str = "MEDIUM",
+        topic: str = "",
+        speak: Optional[Speaker] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an answer, respond to it and persist the turn.
+
+        Args:
+            session_id: The interview session ID
+            question: The QuestionSelectorTool result that was asked
+            user_transcript: What the user said
+            difficulty: Difficulty for the prefetched next question
+            topic: Optional topic for the prefetched next question
+            speak: Optional coroutine that sends text to TTS; when given, the
+                acknowledgement and each response sentence are spoken as soon
+                as they are ready
+
+        Returns:
+            Dictionary with evaluation, response_text, action, next_question
+            (None after a follow-up) and per-stage timings in milliseconds
+        """
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        ack_task = None
+        if speak is not None and self.speculative_ack:
+            ack_task = asyncio.create_task(self._speak_ack(speak, started, timings))
+
+        if self.responder.mode == "combined":
+            # One LLM call scores the answer and writes the reply
+            response, _ = await asyncio.gather(
+                self._timed("evaluate_respond", timings, self.responder._aexecute(
+                    question_text=question.get("text", ""),
+                    user_transcript=user_transcript,
+                    expected_answer_points=question.get("expected_points", ""),
+                )),
+                self._prefetch(session_id, difficulty, topic, user_transcript, timings),
+            )
+            # A failed call is saved as a failed evaluation, not as a real 0
+            evaluation = response.get("evaluation") or failed_evaluation(
+                response.get("error", "no evaluation returned")
+            )
+            response.setdefault("response_text", FALLBACK_RESPONSE)
+            if ack_task is not None:
+                await ack_task
+            if speak is not None and await self._say(speak, response["response_text"]):
+                timings.setdefault("first_audio", _elapsed_ms(started))
+        else:
+            evaluation, _ = await asyncio.gather(
+                self._timed("evaluate", timings, self.evaluator._aexecute(
+                    user_transcript=user_transcript,
+                    expected_answer_points=question.get("expected_points", ""),
+                    question_text=question.get("text", ""),
+                )),
+                self._prefetch(session_id, difficulty, topic, user_transcript, timings),
+            )
+
+            if ack_task is not None:
+                # Never let the response overtake the acknowledgement
+                await ack_task
+
+            respond_started = time.perf_counter()
+            response = await self._respond(evaluation, question.get("text", ""), speak, started, timings)
+            timings["respond"] = _elapsed_ms(respond_started)
+
+        response.setdefault("response_text", FALLBACK_RESPONSE)
+        response.setdefault("action", "next_question")
+
+        next_question = None
+        if response["action"] == "next_question":
+            next_question = self._prefetched.pop(session_id, None)
+
+        # In combined mode the evaluation and the reply are one call
+        eval_latency_ms = timings.get("evaluate", timings.get("evaluate_respond", 0.0))
+        self._persist(
+            session_id, question, user_transcript, evaluation,
+            response["response_text"], eval_latency_ms, timings
+        )
+
+        timings["total"] = _elapsed_ms(started)
+        return {
+            "evaluation": evaluation,
+            "response_text": response["response_text"],
+            "action": response["action"],
+            "score": response.get("score", evaluation.get("score", 0)),
+            "next_question": next_question,
+            "timings": timings,
+        }
+
+    async def drain(self) -> None:
+        """Wait for every background persist to finish (e.g. before shutdown)."""
+        if self._persist_tasks:
+            await asyncio.gather(*self._persist_tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _timed(stage: str, timings: Dict[str, float], coro: Awaitable[Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = _elapsed_ms(started)
+
+    @staticmethod
+    async def _say(speak: Speaker, text: str) -> bool:
+        """Speak text; a failure is logged rather than aborting the turn."""
+        try:
+            await speak(text)
+            return True
+        except Exception:
+            logger.exception("Failed to speak %r", text[:40])
+            return False
+
+    async def _speak_ack(self, speak: Speaker, started: float, timings: Dict[str, float]) -> None:
+        if await self._say(speak, next(self._acks)):
+            timings.setdefault("first_audio", _elapsed_ms(started))
+
+    async def _prefetch(
+        self,
+        session_id: str,
+        difficulty: str,
+        topic: str,
+        user_transcript: str,
+        timings: Dict[str, float]
+    ) -> None:
+        if session_id in self._prefetched:
+            # Still holding the question prefetched before a follow-up
+            return
+        # In semantic mode the next question relates to what the candidate just said
+        result = await self._timed("prefetch", timings, self.selector._aexecute(
+            session_id, difficulty, topic, query=user_transcript
+        ))
+        if "error" not in result:
+            self._prefetched[session_id] = result
+
+    async def _respond(
+        self,
+        evaluation: Dict[str, Any],
+        question_text: str,
+        speak: Optional[Speaker],
+        started: float,
+        timings: Dict[str, float]
+    ) -> Dict[str, Any]:
+        if speak is None:
+            return await self.responder._aexecute(
+                evaluation_result=evaluation,
+                question_text=question_text,
+            )
+
+        score = evaluation.get("score", 0)
+        action, _ = decide_action(score)
+        sentences = []
+        async for sentence in self.responder.astream_response(evaluation, question_text):
+            timings.setdefault("first_response_sentence", _elapsed_ms(started))
+            sentences.append(sentence)
+            if await self._say(speak, sentence):
+                timings.setdefault("first_audio", _elapsed_ms(started))
+        return {"response_text": " ".join(sentences), "action": action, "score": score}
+
+    def _persist(
+        self,
+        session_id: str,
+        question: Dict[str, Any],
+        user_transcript: str,
+        evaluation: Dict[str, Any],
+        ai_message: str,
+        eval_latency_ms: float = 0.0,
+        timings: Optional[Dict[str, float]] = None
+    ) -> None:
+        started = time.perf_counter()
+        task = asyncio.create_task(self.session_manager._aexecute(
+            action="save_turn",
+            session_id=session_id,
+            question_id=question.get("question_id", ""),
+            user_transcript=user_transcript,
+            ai_message=ai_message,
+            score=evaluation.get("score", 0),
+            feedback=evaluation.get("feedback", ""),
+            eval_latency_ms=eval_latency_ms,
+        ))
+        self._persist_tasks.add(task)
+
+        def _done(done: asyncio.Task) -> None:
+            self._persist_tasks.discard(done)
+            if done.cancelled():
+                return
+            elapsed = _elapsed_ms(started)
+            if timings is not None:
+                timings["persist"] = elapsed
+            result = done.exception() or done.result()
+            if isinstance(result, Exception) or "error" in result:
+                logger.error("Failed to persist turn for session %s: %s", session_id, result)
+            else:
+                logger.debug("Persisted turn for session %s in %.1fms", session_id, elapsed)
+
+        task.add_done_callback(_done)
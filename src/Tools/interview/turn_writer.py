@@ -0,0 +1,217 @@
+# src/Tools/interview/turn_writer.py
+"""
+Write-behind persistence for interview turns.
+
+When SESSION_WRITE_BEHIND is enabled, SessionManagerTool appends turns to an
+in-process buffer instead of writing them inline. A background thread flushes
+the buffer every TURN_FLUSH_INTERVAL_MS (or as soon as TURN_FLUSH_BATCH_SIZE
+turns are pending) with one bulk_create plus one aggregate score update per
+session and one QuestionStats update per question, all in a single transaction. Pending turns are flushed when a session
+completes and at interpreter exit.
+"""
+import os
+import sys
+import atexit
+import uuid
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+from src.Tools.interview.bootstrap import ensure_django, get_model
+
+logger = logging.getLogger(__name__)
+
+
+def as_uuid(value: Any) -> Optional[uuid.UUID]:
+    """Parse a UUID (or its string form); None if it is empty or malformed."""
+    if not value:
+        return None
+    try:
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def write_behind_enabled() -> bool:
+    """Whether turns should be buffered instead of written inline."""
+    return str(get_config("SESSION_WRITE_BEHIND", "false")).lower() in ("1", "true", "yes", "on")
+
+
+class TurnWriteBuffer:
+    """
+    Buffers InterviewTurn rows and writes them to the database in batches.
+
+    Each buffered turn is a dict of InterviewTurn field values, using
+    session_id/question_id for the foreign keys and a pre-generated id.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Serializes flushes so the timer thread and explicit callers
+        # never write the same session's totals concurrently
+        self._flush_lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def flush_interval(self) -> float:
+        return int(get_config("TURN_FLUSH_INTERVAL_MS", 1000)) / 1000
+
+    @property
+    def batch_size(self) -> int:
+        return int(get_config("TURN_FLUSH_BATCH_SIZE", 500))
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def append(self, turn: Dict[str, Any]) -> None:
+        """Queue a turn for the next flush. Never touches the database."""
+        with self._lock:
+            self._pending.append(turn)
+            pending = len(self._pending)
+            if self._thread is None:
+                self._start()
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="turn-write-behind", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        from django.db import close_old_connections
+
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                close_old_connections()
+                self.flush()
+            except Exception:
+                # The batch was re-queued; try again on the next tick
+                logger.exception("Write-behind flush failed")
+
+    def flush(self) -> int:
+        """
+        Write every pending turn to the database.
+
+        Returns:
+            Number of turns written
+
+        Raises:
+            OperationalError (connection lost, database unavailable, lock
+            timeout), after putting the batch back at the head of the buffer
+            so no turn is lost. Any other error, IntegrityError included,
+            means the batch itself is bad and would fail every retry, so it
+            is logged and dropped.
+        """
+        from django.db import OperationalError
+
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            try:
+                return self._write(batch)
+            except OperationalError:
+                with self._lock:
+                    self._pending[:0] = batch
+                raise
+            except Exception:
+                logger.exception("Dropping %d buffered turn(s) that cannot be written", len(batch))
+                return 0
+
+    def shutdown(self) -> None:
+        """Stop the flush thread and write whatever is still buffered."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=max(self.flush_interval * 2, 5))
+        self.flush()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> int:
+        ensure_django()
+        from django.core.exceptions import ValidationError
+        from django.db import transaction
+        InterviewSession = get_model('interviews.InterviewSession')
+        InterviewTurn = get_model('interviews.InterviewTurn')
+        Question = get_model('interviews.Question')
+        QuestionStats = get_model('interviews.QuestionStats')
+
+        by_session: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for turn in batch:
+            by_session[str(turn["session_id"])].append(turn)
+
+        # One query to drop references to questions that no longer exist (or
+        # were never valid ids), which would otherwise fail the whole batch
+        question_ids = {as_uuid(turn.get("question_id")) for turn in batch} - {None}
+        known_questions = {
+            str(question_id)
+            for question_id in Question.objects.filter(id__in=question_ids).values_list("id", flat=True)
+        } if question_ids else set()
+
+        rows = []
+        with transaction.atomic():
+            for session_id, turns in by_session.items():
+                try:
+                    updated = InterviewSession.add_turn_scores(
+                        session_id,
+                        turns=len(turns),
+                        score_sum=sum(turn.get("score", 0) for turn in turns),
+                    )
+                except ValidationError:
+                    updated = 0
+                if not updated:
+                    logger.error(
+                        "Dropping %d buffered turn(s) for unknown session %s",
+                        len(turns), session_id,
+                    )
+                    continue
+
+                for turn in turns:
+                    if turn.get("question_id") and str(as_uuid(turn["question_id"])) not in known_questions:
+                        turn = {**turn, "question_id": None}
+                    rows.append(InterviewTurn(**turn))
+
+            InterviewTurn.objects.bulk_create(rows, batch_size=self.batch_size)
+            QuestionStats.add_turns(QuestionStats.tally(
+                (row.question_id, row.score, row.user_transcript) for row in rows
+            ))
+
+        return len(rows)
+
+
+# Singleton instance
+_buffer_instance = None
+_buffer_lock = threading.Lock()
+
+
+def get_turn_buffer() -> TurnWriteBuffer:
+    """
+    Get the process-wide turn write buffer.
+
+    Returns:
+        TurnWriteBuffer instance
+    """
+    global _buffer_instance
+
+    if _buffer_instance is None:
+        with _buffer_lock:
+            if _buffer_instance is None:
+                _buffer_instance = TurnWriteBuffer()
+
+    return _buffer_instance
@@ -0,0 +1,648 @@
+# src/Tools/interview/vector_index.py
+"""
+Semantic question retrieval over a local vector index.
+
+Every question is embedded (topic + text) on the CPU, and the unit vectors
+are stored as one float32 matrix. Small banks are searched exhaustively (one
+matrix-vector product and a partial sort). From QUESTION_VECTOR_IVF_MIN_ROWS
+questions on, a build also clusters the vectors (spherical k-means, about
+sqrt(n) lists) and stores them grouped by list, so a query scores only the
+QUESTION_VECTOR_NPROBE lists nearest to it: an IVF index. At 100k questions a
+query then reads about 5% of the vectors instead of all 100 MB.
+
+Builds are written to QUESTION_VECTOR_DIR as <dir>/<build>/vectors.npy plus
+rows.json, and <dir>/CURRENT names the live build, so a rebuild never tears a
+reader. The live build is memory-mapped (no copy, pages shared between bot
+processes) and reconciled with the database: new or edited questions are
+embedded into a small in-memory delta and deleted ones are masked out.
+Question signals keep the delta current afterwards. Loading (or building the
+first index) and the periodic re-sync run on a background thread, never in a
+search: until the first load finishes, searches return nothing and callers
+fall back to other selection.
+
+Embedding models (QUESTION_EMBEDDING_MODEL):
+- "hashing" (default): feature-hashed words and character trigrams, pure
+  NumPy, no download. "networking" still lands near "Network Engineering".
+- any sentence-transformers model name, e.g. "all-MiniLM-L6-v2", when the
+  sentence-transformers package is installed.
+
+Rebuild and compact with: python src/manage.py build_question_vectors
+"""
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import zlib
+import shutil
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.tool_framework.base_tool import get_config
+from src.Tools.interview.bootstrap import get_model
+
+logger = logging.getLogger(__name__)
+
+DIFFICULTY_CODES = {"EASY": 0, "MEDIUM": 1, "HARD": 2}
+KMEANS_ITERATIONS = 10
+# k-means trains on at most this many vectors per list
+KMEANS_SAMPLE_PER_LIST = 64
+# Builds kept on disk besides the live one, for readers still mapping them
+KEEP_OLD_BUILDS = 1
+EMBED_BATCH = 512
+
+_WORD = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by do does for from how i if in into is it its "
+    "of on or so that the then there these this to was we what when where which "
+    "who why will with you your".split()
+)
+
+
+def embedding_input(topic: str, text: str) -> str:
+    """The text embedded for a question."""
+    return f"{topic}. {text}"
+
+
+def content_key(topic: str, text: str) -> int:
+    """Cheap fingerprint of the embedded text, used to spot edited questions."""
+    return zlib.crc32(embedding_input(topic, text).encode("utf-8"))
+
+
+class HashingEmbedder:
+    """
+    Feature-hashed bag of words and character trigrams.
+
+    Each word and each trigram of "<word>" is hashed to one of dim signed
+    buckets, and the vector is L2-normalized. Trigrams make inflections and
+    compounds overlap ("networking" / "network"), which plain words miss.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str) -> Iterable[bytes]:
+        for word in _WORD.findall(text.lower()):
+            if word in _STOPWORDS:
+                continue
+            yield word.encode("utf-8")
+            padded = f"<{word}>"
+            for start in range(len(padded) - 2):
+                yield ("#" + padded[start:start + 3]).encode("utf-8")
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vector = vectors[row]
+            for feature in self._features(text):
+                h = zlib.crc32(feature)
+                # Low bits pick the bucket, bit 31 the sign
+                vector[h % self.dim] += -1.0 if h >> 31 else 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class SentenceTransformerEmbedder:
+    """A sentence-transformers model run on the CPU."""
+
+    def __init__(self, model_name: str):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise RuntimeError(
+                f"QUESTION_EMBEDDING_MODEL={model_name!r} needs the sentence-transformers package"
+            ) from e
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self._model.get_sentence_embedding_dimension()
+        self.name = model_name
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        return self._model.encode(
+            list(texts), batch_size=64, normalize_embeddings=True, convert_to_numpy=True
+        ).astype(np.float32, copy=False)
+
+
+def create_embedder():
+    """Build the embedder named by QUESTION_EMBEDDING_MODEL."""
+    model_name = get_config("QUESTION_EMBEDDING_MODEL", "hashing")
+    if model_name == "hashing":
+        return HashingEmbedder(int(get_config("QUESTION_EMBEDDING_DIM", 256)))
+    return SentenceTransformerEmbedder(model_name)
+
+
+def train_ivf(vectors: np.ndarray, nlist: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster unit vectors with spherical k-means.
+
+    Returns:
+        (centroids, assignment): nlist unit centroids, and the list of each vector
+    """
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * KMEANS_SAMPLE_PER_LIST)
+    sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))])
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+    for _ in range(KMEANS_ITERATIONS):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # An empty list keeps its previous centroid
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+    assignment = np.concatenate([
+        np.argmax(vectors[start:start + 8192] @ centroids.T, axis=1)
+        for start in range(0, len(vectors), 8192)
+    ])
+    return centroids.astype(np.float32), assignment
+
+
+class QuestionVectorIndex:
+    """
+    Memory-mapped base build plus an in-memory delta of later changes.
+
+    Rows are addressed as one sequence: base rows first, then delta rows.
+    Replaced and deleted questions stay in place but are masked out of
+    every search until the next rebuild compacts them away.
+    """
+
+    def __init__(self, directory: Optional[str] = None, embedder=None):
+        self.directory = directory or get_config(
+            "QUESTION_VECTOR_DIR", os.path.join(PROJECT_ROOT, "var", "question_vectors")
+        )
+        self._embedder = embedder
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._base: Optional[np.ndarray] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._keys: List[int] = []
+        self._difficulty = np.zeros(0, dtype=np.int8)
+        self._alive = np.zeros(0, dtype=bool)
+        self._rows: Dict[str, int] = {}
+        self._delta: List[np.ndarray] = []
+        self._delta_matrix: Optional[np.ndarray] = None
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            self._embedder = create_embedder()
+        return self._embedder
+
+    @property
+    def ttl_seconds(self) -> float:
+        return float(get_config("QUESTION_INDEX_TTL_SECONDS", 300))
+
+    @property
+    def nprobe(self) -> int:
+        return int(get_config("QUESTION_VECTOR_NPROBE", 16))
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # -------- LOADING --------
+
+    def ensure_loaded(self) -> None:
+        """Map the live build (building one if needed) and reconcile it with the database. Blocking."""
+        with self._lock:
+            if self._loaded_at is None and not self._map_current():
+                self.build()
+        self._sync()
+        self._loaded_at = time.monotonic()
+
+    def refresh(self) -> bool:
+        """
+        Start loading or re-syncing on a background thread when due.
+
+        The first load happens once; after that a re-sync every
+        QUESTION_INDEX_TTL_SECONDS picks up edits made by other processes,
+        which send us no signals.
+
+        Returns:
+            Whether the index can be searched right now
+        """
+        loaded_at = self._loaded_at
+        ttl = self.ttl_seconds
+        due = loaded_at is None or (ttl > 0 and time.monotonic() - loaded_at > ttl)
+        if due:
+            with self._refresh_lock:
+                start = not self._refreshing
+                self._refreshing = True
+            if start:
+                threading.Thread(target=self._refresh, name="question-vectors-refresh", daemon=True).start()
+        return loaded_at is not None
+
+    def _refresh(self) -> None:
+        from django.db import close_old_connections
+
+        try:
+            self.ensure_loaded()
+        except Exception:
+            logger.exception("Question vector index refresh failed")
+            if self._loaded_at is not None:
+                # Keep serving the current data; retry after another TTL
+                self._loaded_at = time.monotonic()
+        finally:
+            self._refreshing = False
+            close_old_connections()
+
+    def _current_build(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.directory, "CURRENT"), encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _map_current(self) -> bool:
+        """Memory-map the live build; False if there is none or it is unusable."""
+        build = self._current_build()
+        if build is None:
+            return False
+        path = os.path.join(self.directory, build)
+        try:
+            with open(os.path.join(path, "rows.json"), encoding="utf-8") as f:
+                rows = json.load(f)
+            base = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable question vector build {build}: {e}")
+            return False
+
+        if rows.get("model") != self.embedder.name or base.shape != (len(rows["ids"]), self.embedder.dim):
+            logger.info(f"Question vector build {build} is for another embedding model; rebuilding")
+            return False
+
+        self._reset()
+        self._base = base
+        if rows.get("offsets"):
+            self._centroids = np.load(os.path.join(path, "centroids.npy"))
+            self._offsets = np.array(rows["offsets"], dtype=np.int64)
+        self._ids = list(rows["ids"])
+        self._keys = list(rows["keys"])
+        self._difficulty = np.array(rows["difficulty"], dtype=np.int8)
+        self._alive = np.ones(len(self._ids), dtype=bool)
+        self._rows = {question_id: row for row, question_id in enumerate(self._ids)}
+        return True
+
+    def _sync(self) -> None:
+        """
+        Bring the index in line with the Question table.
+
+        The table scan and the embedding run without the lock, against a
+        snapshot; only applying the differences holds it, so searches keep
+        running meanwhile.
+        """
+        Question = get_model('interviews.Question')
+
+        with self._lock:
+            known = {
+                question_id: (self._keys[row], int(self._difficulty[row]))
+                for question_id, row in self._rows.items()
+            }
+
+        seen: Set[str] = set()
+        changed = []
+        recoded: Dict[str, int] = {}
+        rows = Question.objects.values_list("id", "topic", "text", "difficulty").iterator(chunk_size=2000)
+        for question_id, topic, text, difficulty in rows:
+            question_id = str(question_id)
+            seen.add(question_id)
+            code = DIFFICULTY_CODES.get(difficulty.upper(), -1)
+            current = known.get(question_id)
+            if current is None or current[0] != content_key(topic, text):
+                changed.append((question_id, topic, text, difficulty))
+            elif current[1] != code:
+                recoded[question_id] = code
+
+        embedded = [
+            (changed[start:start + EMBED_BATCH], self._embed_questions(changed[start:start + EMBED_BATCH]))
+            for start in range(0, len(changed), EMBED_BATCH)
+        ]
+
+        with self._lock:
+            for question_id in [question_id for question_id in known if question_id not in seen]:
+                self._remove(question_id)
+            for question_id, code in recoded.items():
+                row = self._rows.get(question_id)
+                if row is not None:
+                    self._difficulty[row] = code
+            for questions, vectors in embedded:
+                self._add_rows(questions, vectors)
+
+        if changed:
+            logger.info(f"Question vectors: {len(changed)} rows embedded since the last build")
+
+    # -------- BUILDING --------
+
+    def build(self) -> int:
+        """
+        Embed the whole question bank into a new build and make it live.
+
+        Returns:
+            Number of questions in the build
+        """
+        Question = get_model('interviews.Question')
+
+        with self._lock:
+            build = time.strftime("%Y%m%d%H%M%S") + "-" + uuid.uuid4().hex[:8]
+            path = os.path.join(self.directory, build)
+            os.makedirs(path)
+
+            ids, keys, difficulty, chunks = [], [], [], []
+            batch = []
+            rows = Question.objects.values_list("id", "topic", "text", "difficulty").iterator(chunk_size=2000)
+            for question_id, topic, text, level in rows:
+                ids.append(str(question_id))
+                keys.append(content_key(topic, text))
+                difficulty.append(DIFFICULTY_CODES.get(level.upper(), -1))
+                batch.append(embedding_input(topic, text))
+                if len(batch) >= EMBED_BATCH:
+                    chunks.append(self.embedder.embed(batch))
+                    batch = []
+            if batch:
+                chunks.append(self.embedder.embed(batch))
+
+            vectors = np.concatenate(chunks) if chunks else np.zeros((0, self.embedder.dim), dtype=np.float32)
+            offsets = []
+            if len(ids) >= int(get_config("QUESTION_VECTOR_IVF_MIN_ROWS", 20000)):
+                nlist = int(np.sqrt(len(ids)))
+                centroids, assignment = train_ivf(vectors, nlist)
+                # Store each list's rows contiguously so a probe is one slice
+                order = np.argsort(assignment, kind="stable")
+                offsets = np.searchsorted(assignment[order], np.arange(nlist + 1)).tolist()
+                vectors = vectors[order]
+                ids = [ids[row] for row in order]
+                keys = [keys[row] for row in order]
+                difficulty = [difficulty[row] for row in order]
+                np.save(os.path.join(path, "centroids.npy"), centroids)
+
+            np.save(os.path.join(path, "vectors.npy"), vectors)
+            with open(os.path.join(path, "rows.json"), "w", encoding="utf-8") as f:
+                json.dump({
+                    "model": self.embedder.name,
+                    "ids": ids,
+                    "keys": keys,
+                    "difficulty": difficulty,
+                    "offsets": offsets,
+                }, f)
+
+            # Publishing the build is one atomic rename
+            pointer = os.path.join(self.directory, f"CURRENT.{build}")
+            with open(pointer, "w", encoding="utf-8") as f:
+                f.write(build)
+            os.replace(pointer, os.path.join(self.directory, "CURRENT"))
+            self._remove_old_builds(build)
+
+            self._map_current()
+            self._loaded_at = time.monotonic()
+            return len(ids)
+
+    def _remove_old_builds(self, current: str) -> None:
+        builds = sorted(
+            (os.path.join(self.directory, name) for name in os.listdir(self.directory) if name != current),
+            key=os.path.getmtime,
+        )
+        builds = [path for path in builds if os.path.isdir(path)]
+        for path in builds[:max(0, len(builds) - KEEP_OLD_BUILDS)]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    # -------- INCREMENTAL UPDATES --------
+
+    def _embed_questions(self, questions: List[Tuple[str, str, str, str]]) -> np.ndarray:
+        return self.embedder.embed([embedding_input(topic, text) for _, topic, text, _ in questions])
+
+    def _upsert_many(self, questions: List[Tuple[str, str, str, str]]) -> None:
+        self._add_rows(questions, self._embed_questions(questions))
+
+    def _add_rows(self, questions: List[Tuple[str, str, str, str]], vectors: np.ndarray) -> None:
+        for (question_id, topic, text, difficulty), vector in zip(questions, vectors):
+            self._remove(question_id)
+            self._rows[question_id] = len(self._ids)
+            self._ids.append(question_id)
+            self._keys.append(content_key(topic, text))
+            self._delta.append(vector)
+        codes = [DIFFICULTY_CODES.get(difficulty.upper(), -1) for *_, difficulty in questions]
+        self._difficulty = np.concatenate([self._difficulty, np.array(codes, dtype=np.int8)])
+        self._alive = np.concatenate([self._alive, np.ones(len(questions), dtype=bool)])
+        self._delta_matrix = None
+
+    def _remove(self, question_id: str) -> None:
+        row = self._rows.pop(question_id, None)
+        if row is not None:
+            self._alive[row] = False
+
+    def upsert(self, question_id: str, topic: str, text: str, difficulty: str) -> None:
+        """Add or re-embed one question. No-op until the index is loaded."""
+        with self._lock:
+            if not self.is_loaded:
+                return
+            row = self._rows.get(question_id)
+            if row is not None and self._keys[row] == content_key(topic, text):
+                self._difficulty[row] = DIFFICULTY_CODES.get(difficulty.upper(), -1)
+                return
+            self._upsert_many([(question_id, topic, text, difficulty)])
+
+    def remove(self, question_id: str) -> None:
+        """Mask a deleted question. No-op until the index is loaded."""
+        with self._lock:
+            if self.is_loaded:
+                self._remove(question_id)
+
+    # -------- SEARCH --------
+
+    def search(
+        self,
+        query: str,
+        difficulty: str = "",
+        k: int = 5,
+        exclude: Optional[Set[str]] = None,
+        within: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank questions by cosine similarity to free text.
+
+        Never loads the index itself: see refresh().
+
+        Args:
+            query: A topic, or what the candidate just said
+            difficulty: Only return this difficulty; empty matches every level
+            k: Number of results
+            exclude: Question IDs to leave out (e.g. already asked)
+            within: Only rank these question IDs (e.g. a topic's pool)
+
+        Returns:
+            Up to k (question_id, similarity) pairs, most similar first; empty
+            while the index is still loading
+        """
+        if not self.refresh():
+            return []
+        vector = self.embedder.embed([query])[0]
+        exclude = exclude or set()
+        code = DIFFICULTY_CODES.get(difficulty.upper()) if difficulty else None
+
+        with self._lock:
+            if within is not None:
+                rows = np.fromiter(
+                    (self._rows[question_id] for question_id in within if question_id in self._rows),
+                    dtype=np.int64,
+                )
+                return self._rank(rows, self._row_scores(rows, vector), code, k, exclude)
+
+            nprobe = self.nprobe
+            while True:
+                results, exhaustive = self._search(vector, code, k, exclude, nprobe)
+                if len(results) >= k or exhaustive:
+                    return results
+                # The probed lists held too few matches (filters, exclusions)
+                nprobe *= 4
+
+    def _search(
+        self,
+        vector: np.ndarray,
+        code: Optional[int],
+        k: int,
+        exclude: Set[str],
+        nprobe: int
+    ) -> Tuple[List[Tuple[str, float]], bool]:
+        """One ranking pass; also says whether every row was scored."""
+        rows, scores, exhaustive = self._candidates(vector, nprobe)
+        return self._rank(rows, scores, code, k, exclude), exhaustive
+
+    def _rank(
+        self,
+        rows: np.ndarray,
+        scores: np.ndarray,
+        code: Optional[int],
+        k: int,
+        exclude: Set[str]
+    ) -> List[Tuple[str, float]]:
+        """The k best live rows of the given difficulty, minus exclusions."""
+        if not len(rows):
+            return []
+
+        mask = ~self._alive[rows]
+        if code is not None:
+            mask |= self._difficulty[rows] != code
+        scores[mask] = -np.inf
+
+        wanted = min(len(scores), k + len(exclude))
+        top = np.argpartition(-scores, wanted - 1)[:wanted]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for position in top:
+            if scores[position] == -np.inf:
+                break
+            question_id = self._ids[rows[position]]
+            if question_id in exclude:
+                continue
+            results.append((question_id, float(scores[position])))
+            if len(results) == k:
+                break
+        return results
+
+    def _row_scores(self, rows: np.ndarray, vector: np.ndarray) -> np.ndarray:
+        """Similarity of specific rows (base or delta) to a query vector."""
+        base_rows = 0 if self._base is None else len(self._base)
+        scores = np.empty(len(rows), dtype=np.float32)
+        in_base = rows < base_rows
+        if in_base.any():
+            scores[in_base] = self._base[rows[in_base]] @ vector
+        if not in_base.all():
+            if self._delta_matrix is None:
+                self._delta_matrix = np.stack(self._delta)
+            scores[~in_base] = self._delta_matrix[rows[~in_base] - base_rows] @ vector
+        return scores
+
+    def _candidates(self, vector: np.ndarray, nprobe: int) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """Score the base rows in the nprobe nearest lists (all rows if flat) plus the delta."""
+        row_parts, score_parts = [], []
+        base_rows = 0 if self._base is None else len(self._base)
+        exhaustive = True
+
+        if base_rows:
+            if self._centroids is not None and nprobe < len(self._centroids):
+                exhaustive = False
+                lists = np.argpartition(-(self._centroids @ vector), nprobe - 1)[:nprobe]
+                for start, end in zip(self._offsets[lists], self._offsets[lists + 1]):
+                    row_parts.append(np.arange(start, end))
+                    score_parts.append(self._base[start:end] @ vector)
+            else:
+                row_parts.append(np.arange(base_rows))
+                score_parts.append(self._base @ vector)
+
+        if self._delta:
+            if self._delta_matrix is None:
+                self._delta_matrix = np.stack(self._delta)
+            row_parts.append(np.arange(base_rows, base_rows + len(self._delta)))
+            score_parts.append(self._delta_matrix @ vector)
+
+        if not row_parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32), exhaustive
+        return np.concatenate(row_parts), np.concatenate(score_parts), exhaustive
+
+
+# Singleton instance
+_vector_index_instance = None
+_vector_index_lock = threading.Lock()
+
+
+def get_vector_index() -> QuestionVectorIndex:
+    """
+    Get the process-wide question vector index.
+
+    Returns:
+        QuestionVectorIndex instance (loaded in the background from the first search)
+    """
+    global _vector_index_instance
+
+    if _vector_index_instance is None:
+        with _vector_index_lock:
+            if _vector_index_instance is None:
+                _connect_signals()
+                _vector_index_instance = QuestionVectorIndex()
+
+    return _vector_index_instance
+
+
+def _on_question_saved(sender, instance, **kwargs):
+    get_vector_index().upsert(str(instance.pk), instance.topic, instance.text, instance.difficulty)
+
+
+def _on_question_deleted(sender, instance, **kwargs):
+    get_vector_index().remove(str(instance.pk))
+
+
+def _connect_signals() -> None:
+    from django.db.models.signals import post_save, post_delete
+
+    post_save.connect(
+        _on_question_saved,
+        sender="interviews.Question",
+        dispatch_uid="question_vectors_saved",
+    )
+    post_delete.connect(
+        _on_question_deleted,
+        sender="interviews.Question",
+        dispatch_uid="question_vectors_deleted",
+    )
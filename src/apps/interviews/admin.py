@@ -1,10 +1,40 @@
 from django.contrib import admin
-from .models import Question, InterviewSession, InterviewTurn
+from .models import Question, QuestionStats, InterviewSession, InterviewTurn
+
+class QuestionStatsInline(admin.StackedInline):
+    model = QuestionStats
+    can_delete = False
+    # Maintained from the turn history, never edited by hand
+    fields = readonly_fields = (
+        'attempts', 'mean_score', 'score_variance', 'mean_answer_length',
+        'eval_latency_p95_ms', 'updated_at', 'recomputed_at',
+    )
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 @admin.register(Question)
 class QuestionAdmin(admin.ModelAdmin):
-    list_display = ('topic', 'difficulty', 'text')
+    list_display = ('topic', 'difficulty', 'text', 'attempts', 'mean_score', 'eval_latency_p95')
     list_filter = ('difficulty', 'topic')
+    # Stats are read from QuestionStats (one join), not aggregated from turns
+    list_select_related = ('stats',)
+    inlines = [QuestionStatsInline]
+
+    @admin.display(ordering='stats__attempts')
+    def attempts(self, obj):
+        stats = getattr(obj, 'stats', None)
+        return stats.attempts if stats else 0
+
+    @admin.display(ordering='stats__mean_score')
+    def mean_score(self, obj):
+        stats = getattr(obj, 'stats', None)
+        return round(stats.mean_score, 2) if stats and stats.mean_score is not None else None
+
+    @admin.display(ordering='stats__eval_latency_p95_ms', description='p95 eval latency (ms)')
+    def eval_latency_p95(self, obj):
+        stats = getattr(obj, 'stats', None)
+        return round(stats.eval_latency_p95_ms) if stats and stats.eval_latency_p95_ms is not None else None
 
 @admin.register(InterviewSession)
 class SessionAdmin(admin.ModelAdmin):
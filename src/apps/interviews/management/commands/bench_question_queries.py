@@ -0,0 +1,183 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.interviews.models import Question, InterviewSession, InterviewTurn
+from apps.interviews.text import normalize_topic
+from apps.users.models import User
+
+TOPICS = [
+    "Network Engineering", "Algorithms", "Data Structures", "Operating Systems",
+    "Databases", "Distributed Systems", "Computer Architecture", "Security",
+    "Cloud Infrastructure", "Machine Learning", "Compilers", "Concurrency",
+    "System Design", "Web Development", "Mobile Development", "DevOps",
+    "Testing", "Networking Protocols", "Cryptography", "Data Engineering",
+]
+DIFFICULTIES = ["EASY", "MEDIUM", "HARD"]
+BENCH_USERNAME = "bench_user"
+
+
+class _Rollback(Exception):
+    """Raised to undo the temporary index drop."""
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a large question bank and turn history, then reports query "
+        "latencies with and without the interviews indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--questions", type=int, default=100_000)
+        parser.add_argument("--turns", type=int, default=1_000_000)
+        parser.add_argument("--sessions", type=int, default=10_000)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--repeat", type=int, default=50, help="Runs per query")
+        parser.add_argument(
+            "--skip-seed", action="store_true",
+            help="Benchmark the data already in the database",
+        )
+
+    def handle(self, *args, **options):
+        if not options["skip_seed"]:
+            self._seed(options)
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE interviews_question")
+                cursor.execute("ANALYZE interviews_interviewturn")
+
+        session_ids = list(
+            InterviewSession.objects.values_list("id", flat=True)[:options["repeat"]]
+        )
+        if not session_ids:
+            self.stderr.write("No sessions to benchmark; run without --skip-seed.")
+            return
+
+        after = self._measure(session_ids, options["repeat"])
+
+        # Drop the indexes inside a transaction, measure, then roll back so
+        # the schema is left untouched.
+        try:
+            with transaction.atomic():
+                self._drop_indexes()
+                before = self._measure(session_ids, options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("\n📊 Query latency (ms, p50 / p95)\n"))
+        self.stdout.write(f"{'query':<34}{'without indexes':>22}{'with indexes':>22}")
+        for name in after:
+            self.stdout.write(
+                f"{name:<34}"
+                f"{before[name][0]:>12.2f} / {before[name][1]:>7.2f}"
+                f"{after[name][0]:>12.2f} / {after[name][1]:>7.2f}"
+            )
+
+    # -------- SEEDING --------
+
+    def _seed(self, options):
+        batch_size = options["batch_size"]
+        user, _ = User.objects.get_or_create(
+            username=BENCH_USERNAME, defaults={"email": "bench@example.com"}
+        )
+
+        started = time.perf_counter()
+        self._bulk(
+            Question,
+            options["questions"],
+            batch_size,
+            lambda i: Question(
+                topic=(topic := TOPICS[i % len(TOPICS)]),
+                topic_slug=normalize_topic(topic),
+                text=f"Benchmark question {i}",
+                difficulty=DIFFICULTIES[i % len(DIFFICULTIES)],
+                expected_answer_points="- point one\n- point two",
+            ),
+        )
+        question_ids = list(Question.objects.values_list("id", flat=True))
+
+        session_ids = [uuid.uuid4() for _ in range(options["sessions"])]
+        self._bulk(
+            InterviewSession,
+            len(session_ids),
+            batch_size,
+            lambda i: InterviewSession(id=session_ids[i], user=user),
+        )
+
+        self._bulk(
+            InterviewTurn,
+            options["turns"],
+            batch_size,
+            lambda i: InterviewTurn(
+                session_id=session_ids[i % len(session_ids)],
+                question_id=random.choice(question_ids),
+                ai_message="Benchmark message",
+                user_transcript="Benchmark answer",
+                score=random.randint(0, 10),
+            ),
+        )
+        self.stdout.write(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+    def _bulk(self, model, total, batch_size, build):
+        name = model._meta.verbose_name_plural
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            model.objects.bulk_create([build(i) for i in range(start, end)])
+            self.stdout.write(f"\r  {name}: {end}/{total}", ending="")
+        self.stdout.write("")
+
+    # -------- MEASURING --------
+
+    def _queries(self, session_ids):
+        return {
+            "question difficulty+icontains": lambda i: list(
+                Question.objects
+                .filter(difficulty=DIFFICULTIES[i % 3], topic__icontains="network")
+                .values_list("id", flat=True)[:50]
+            ),
+            "question difficulty+topic_slug": lambda i: list(
+                Question.objects
+                .filter(difficulty=DIFFICULTIES[i % 3], topic_slug="algorithms")
+                .values_list("id", flat=True)[:50]
+            ),
+            "session turns by created_at": lambda i: list(
+                InterviewTurn.objects
+                .filter(session_id=session_ids[i % len(session_ids)])
+                .order_by("created_at")
+                .values_list("id", "score")
+            ),
+        }
+
+    def _measure(self, session_ids, repeat):
+        results = {}
+        for name, query in self._queries(session_ids).items():
+            timings = []
+            for i in range(repeat):
+                started = time.perf_counter()
+                query(i)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            results[name] = (statistics.median(timings), p95)
+        return results
+
+    def _drop_indexes(self):
+        """Drop every index this app adds on top of the initial schema."""
+        added = {index.name for model in (Question, InterviewTurn) for index in model._meta.indexes}
+        added.add("question_topic_trgm_idx")
+
+        with connection.cursor() as cursor:
+            for table in (Question._meta.db_table, InterviewTurn._meta.db_table):
+                constraints = connection.introspection.get_constraints(cursor, table)
+                for name, info in constraints.items():
+                    if info["primary_key"] or info["unique"] or not info["index"]:
+                        continue
+                    # topic_slug's db_index (and its LIKE twin on Postgres)
+                    if name in added or info["columns"] == ["topic_slug"]:
+                        cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
@@ -0,0 +1,58 @@
+import os
+import random
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.interviews.models import Question
+
+# Add project root to path (the vector index lives in src.Tools)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.Tools.interview.vector_index import QuestionVectorIndex  # noqa: E402
+
+
+class Command(BaseCommand):
+    help = (
+        "Embeds the whole question bank into a new vector index build and makes "
+        "it live (folding in every incremental change since the last build), "
+        "then optionally times semantic queries against it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bench-queries", type=int, default=200, help="Queries to time (0 to skip)")
+
+    def handle(self, *args, **options):
+        index = QuestionVectorIndex()
+
+        self.stdout.write(f"🧮 Embedding questions with {index.embedder.name}...")
+        started = time.perf_counter()
+        count = index.build()
+        elapsed = time.perf_counter() - started
+        layout = f"IVF, {len(index._centroids)} lists" if index._centroids is not None else "flat"
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Indexed {count:,} questions in {elapsed:.1f}s ({layout}) -> {index.directory}"
+        ))
+
+        if options["bench_queries"] and count:
+            self._bench(index, options["bench_queries"])
+
+    def _bench(self, index, queries):
+        # Question topics and texts make realistic queries
+        sample = list(Question.objects.order_by('?').values_list('topic', 'text')[:queries])
+        texts = [random.choice(pair) for pair in sample]
+        difficulties = ["", "EASY", "MEDIUM", "HARD"]
+
+        timings = []
+        for i, text in enumerate(texts):
+            started = time.perf_counter()
+            index.search(text, difficulties[i % len(difficulties)], k=5)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p50 = timings[len(timings) // 2]
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        self.stdout.write(f"⏱️ {len(timings)} queries: p50 {p50:.2f} ms, p99 {p99:.2f} ms")
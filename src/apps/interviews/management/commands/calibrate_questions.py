@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+# Add project root to path (the difficulty engine lives in src.Tools)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.Tools.interview.difficulty_engine import calibrate_question_difficulty  # noqa: E402
+
+
+class Command(BaseCommand):
+    help = (
+        "Refits every question's difficulty_rating from the interview turn "
+        "history (the same job celery beat runs nightly)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30, help="Newton iterations")
+        parser.add_argument(
+            "--regularization", type=float, default=1.0,
+            help="Pull towards the EASY/MEDIUM/HARD priors (higher = stronger)"
+        )
+        parser.add_argument(
+            "--min-attempts", type=int, default=5,
+            help="Scored turns a question needs before it is calibrated"
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("📐 Calibrating question difficulty...")
+        started = time.perf_counter()
+        result = calibrate_question_difficulty(
+            iterations=options["iterations"],
+            regularization=options["regularization"],
+            min_attempts=options["min_attempts"],
+        )
+        elapsed = time.perf_counter() - started
+
+        if not result["turns"]:
+            self.stdout.write(self.style.WARNING("⚠️ No scored turns yet, nothing to calibrate"))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Calibrated {result['questions_calibrated']:,} questions from {result['turns']:,} turns "
+            f"in {elapsed:.1f}s (mean change {result['mean_change']})"
+        ))
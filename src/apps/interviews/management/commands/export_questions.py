@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.interviews.models import Question
+from apps.interviews.question_io import FIELDS, FORMATS, detect_format, open_text, row_writer
+from apps.interviews.text import normalize_topic
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams the question bank to a JSONL or CSV file (the format "
+        "import_questions reads), reading the table in chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to write (.jsonl, .csv, optionally .gz; '-' for stdout)")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to the file extension")
+        parser.add_argument("--difficulty", choices=[choice for choice, _ in Question.DIFFICULTY_CHOICES])
+        parser.add_argument("--topic", help="Only export this topic (case and spacing are ignored)")
+        parser.add_argument("--chunk-size", type=int, default=2_000, help="Rows fetched per query")
+        parser.add_argument("--progress-every", type=int, default=50_000, help="Rows between progress lines")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        try:
+            fmt = detect_format(path, options["format"] or ("jsonl" if path == "-" else None))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        questions = Question.objects.all()
+        if options["difficulty"]:
+            questions = questions.filter(difficulty=options["difficulty"])
+        if options["topic"]:
+            questions = questions.filter(topic_slug=normalize_topic(options["topic"]))
+
+        # Progress must not end up in the exported data
+        log = self.stderr if path == "-" else self.stdout
+        started = time.perf_counter()
+        exported = 0
+        next_progress = options["progress_every"]
+
+        try:
+            with open_text(path, "w") as stream:
+                write = row_writer(stream, fmt)
+                rows = questions.order_by('pk').values(*FIELDS).iterator(chunk_size=options["chunk_size"])
+                for row in rows:
+                    write(row)
+                    exported += 1
+                    if exported >= next_progress:
+                        elapsed = time.perf_counter() - started
+                        log.write(f"  ... {exported:,} rows ({exported / elapsed:,.0f} rows/s)")
+                        next_progress += options["progress_every"]
+        except OSError as e:
+            raise CommandError(str(e))
+
+        elapsed = time.perf_counter() - started
+        log.write(self.style.SUCCESS(
+            f"✅ Exported {exported:,} questions in {elapsed:.1f}s "
+            f"({exported / max(elapsed, 1e-9):,.0f} rows/s)"
+        ))
@@ -0,0 +1,169 @@
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.interviews.models import Question
+from apps.interviews.question_io import FORMATS, detect_format, open_text, read_rows
+from apps.interviews.text import normalize_topic, text_hash
+
+DIFFICULTIES = {choice for choice, _ in Question.DIFFICULTY_CHOICES}
+TOPIC_MAX_LENGTH = Question._meta.get_field('topic').max_length
+UPDATE_FIELDS = ['topic', 'topic_slug', 'difficulty', 'expected_answer_points']
+# Invalid rows printed in full; the rest are only counted
+MAX_ERRORS_SHOWN = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams questions from a JSONL or CSV file into the question bank. "
+        "Rows are validated, deduplicated by normalized question text, and "
+        "written in chunks with bulk_create/bulk_update, one transaction per chunk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read (.jsonl, .csv, optionally .gz; '-' for stdin)")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to the file extension")
+        parser.add_argument("--chunk-size", type=int, default=2_000, help="Rows per transaction")
+        parser.add_argument(
+            "--update", action="store_true",
+            help="Overwrite topic, difficulty and expected points of questions that already exist",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Validate and count without writing")
+        parser.add_argument("--progress-every", type=int, default=50_000, help="Rows between progress lines")
+
+    def handle(self, *args, **options):
+        try:
+            fmt = detect_format(options["path"], options["format"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stats = dict.fromkeys(
+            ("read", "created", "updated", "existing", "duplicates", "invalid"), 0
+        )
+        self.errors_shown = 0
+        started = time.perf_counter()
+        next_progress = options["progress_every"]
+
+        try:
+            with open_text(options["path"], "r") as stream:
+                rows = self._valid_rows(read_rows(stream, fmt))
+                while True:
+                    chunk = list(islice(rows, options["chunk_size"]))
+                    if not chunk:
+                        break
+                    self._write_chunk(chunk, options["update"], options["dry_run"])
+
+                    if self.stats["read"] >= next_progress:
+                        elapsed = time.perf_counter() - started
+                        self.stdout.write(
+                            f"  ... {self.stats['read']:,} rows "
+                            f"({self.stats['read'] / elapsed:,.0f} rows/s)"
+                        )
+                        next_progress += options["progress_every"]
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        self._report(time.perf_counter() - started, options["dry_run"])
+
+    # -------- VALIDATION --------
+
+    def _valid_rows(self, records):
+        """Yield (hash, Question) for every valid record, counting the rest."""
+        for line_number, row, error in records:
+            self.stats["read"] += 1
+            question = None
+            if error is None:
+                question, error = self._build(row)
+            if error is not None:
+                self.stats["invalid"] += 1
+                if self.errors_shown < MAX_ERRORS_SHOWN:
+                    self.stderr.write(f"  line {line_number}: {error}")
+                    self.errors_shown += 1
+                continue
+            yield question.text_hash, question
+
+    @staticmethod
+    def _build(row):
+        """Return (Question, None) for a valid row, or (None, reason)."""
+        text = str(row.get("text") or "").strip()
+        topic = str(row.get("topic") or "").strip()
+        difficulty = str(row.get("difficulty") or "MEDIUM").strip().upper()
+        points = row.get("expected_answer_points") or ""
+        if isinstance(points, list):
+            points = "\n".join(f"- {point}" for point in points)
+        points = str(points).strip()
+
+        if not text:
+            return None, "missing text"
+        if not topic:
+            return None, "missing topic"
+        if len(topic) > TOPIC_MAX_LENGTH:
+            return None, f"topic longer than {TOPIC_MAX_LENGTH} characters"
+        if not points:
+            return None, "missing expected_answer_points"
+        if difficulty not in DIFFICULTIES:
+            return None, f"unknown difficulty {difficulty!r}"
+
+        # bulk_create skips save(), so the derived fields are filled in here
+        return Question(
+            topic=topic,
+            topic_slug=normalize_topic(topic),
+            text=text,
+            text_hash=text_hash(text),
+            difficulty=difficulty,
+            expected_answer_points=points,
+        ), None
+
+    # -------- WRITING --------
+
+    def _write_chunk(self, chunk, update, dry_run):
+        incoming = {}
+        for key, question in chunk:
+            if key in incoming:
+                self.stats["duplicates"] += 1
+            else:
+                incoming[key] = question
+
+        # Questions already in the bank (from earlier chunks or earlier imports)
+        existing = {
+            question.text_hash: question
+            for question in Question.objects.filter(text_hash__in=list(incoming)).only('id', 'text_hash', *UPDATE_FIELDS)
+        }
+
+        to_create = [question for key, question in incoming.items() if key not in existing]
+        to_update = []
+        for key, current in existing.items():
+            new = incoming[key]
+            if update and any(getattr(current, field) != getattr(new, field) for field in UPDATE_FIELDS):
+                for field in UPDATE_FIELDS:
+                    setattr(current, field, getattr(new, field))
+                to_update.append(current)
+            else:
+                self.stats["existing"] += 1
+
+        if not dry_run:
+            with transaction.atomic():
+                Question.objects.bulk_create(to_create, batch_size=len(chunk))
+                if to_update:
+                    Question.objects.bulk_update(to_update, UPDATE_FIELDS, batch_size=len(chunk))
+
+        self.stats["created"] += len(to_create)
+        self.stats["updated"] += len(to_update)
+
+    # -------- REPORTING --------
+
+    def _report(self, elapsed, dry_run):
+        stats = self.stats
+        verb = "Would import" if dry_run else "Imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅ {verb} {stats['read']:,} rows in {elapsed:.1f}s "
+            f"({stats['read'] / max(elapsed, 1e-9):,.0f} rows/s)"
+        ))
+        self.stdout.write(f"   created:            {stats['created']:,}")
+        self.stdout.write(f"   updated:            {stats['updated']:,}")
+        self.stdout.write(f"   already in bank:    {stats['existing']:,}")
+        self.stdout.write(f"   duplicates in file: {stats['duplicates']:,}")
+        if stats["invalid"]:
+            self.stdout.write(self.style.WARNING(f"   invalid:            {stats['invalid']:,}"))
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.interviews.question_stats import recompute_question_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the QuestionStats table (attempts, score mean/variance, answer "
+        "length, p95 evaluation latency) from the whole interview turn history."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5_000, help="Rows fetched per query")
+
+    def handle(self, *args, **options):
+        self.stdout.write("📊 Recomputing question stats...")
+        started = time.perf_counter()
+        result = recompute_question_stats(chunk_size=options["chunk_size"])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Stats for {result['questions']:,} questions from {result['turns']:,} turns "
+            f"in {elapsed:.1f}s ({result['removed']:,} stale rows removed)"
+        ))
@@ -0,0 +1,42 @@
+# Generated by Django 5.0.14 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_running_totals(apps, schema_editor):
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    InterviewTurn = apps.get_model('interviews', 'InterviewTurn')
+
+    totals = (
+        InterviewTurn.objects
+        .values('session_id')
+        .annotate(turns=Count('id'), scores=Sum('score'))
+        .order_by()
+    )
+    for row in totals.iterator():
+        InterviewSession.objects.filter(id=row['session_id']).update(
+            turn_count=row['turns'],
+            score_sum=row['scores'] or 0,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='turn_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='interviewsession',
+            name='score_sum',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_running_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.0.14 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+TRIGRAM_INDEX = 'question_topic_trgm_idx'
+
+
+def backfill_topic_slug(apps, schema_editor):
+    Question = apps.get_model('interviews', 'Question')
+
+    batch = []
+    for question in Question.objects.only('id', 'topic').iterator(chunk_size=2000):
+        # Same rule as apps.interviews.text.normalize_topic, frozen here
+        question.topic_slug = " ".join((question.topic or "").lower().split())
+        batch.append(question)
+        if len(batch) >= 2000:
+            Question.objects.bulk_update(batch, ['topic_slug'])
+            batch = []
+    if batch:
+        Question.objects.bulk_update(batch, ['topic_slug'])
+
+
+def create_topic_trigram_index(apps, schema_editor):
+    # topic__icontains compiles to UPPER("topic"::text) LIKE UPPER('%...%') on
+    # Postgres, so a trigram GIN index on that expression serves it directly.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX} ON interviews_question '
+        'USING gin (UPPER("topic"::text) gin_trgm_ops)'
+    )
+
+
+def drop_topic_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {TRIGRAM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0002_interviewsession_running_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='topic_slug',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(backfill_topic_slug, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['difficulty', 'topic'], name='question_difficulty_topic_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['difficulty', 'topic_slug'], name='question_difficulty_slug_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewturn',
+            index=models.Index(fields=['session', 'created_at'], name='turn_session_created_idx'),
+        ),
+        migrations.RunPython(create_topic_trigram_index, drop_topic_trigram_index),
+    ]
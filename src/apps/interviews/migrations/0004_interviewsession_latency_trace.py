@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0003_question_topic_slug_and_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='latency_trace',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0004_interviewsession_latency_trace'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='report',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='interviewturn',
+            name='evaluation',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
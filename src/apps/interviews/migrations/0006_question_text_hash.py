@@ -0,0 +1,40 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:30
+
+import hashlib
+import re
+
+from django.db import migrations, models
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def backfill_text_hash(apps, schema_editor):
+    Question = apps.get_model('interviews', 'Question')
+
+    batch = []
+    for question in Question.objects.only('id', 'text').iterator(chunk_size=2000):
+        # Same rule as apps.interviews.text.text_hash, frozen here
+        normalized = " ".join(_PUNCTUATION.sub(" ", (question.text or "").lower()).split())
+        question.text_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        batch.append(question)
+        if len(batch) >= 2000:
+            Question.objects.bulk_update(batch, ['text_hash'])
+            batch = []
+    if batch:
+        Question.objects.bulk_update(batch, ['text_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0005_interview_reports'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='text_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(backfill_text_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0006_question_text_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='difficulty_rating',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+    ]
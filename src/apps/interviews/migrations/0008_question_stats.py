@@ -0,0 +1,38 @@
+# Generated by Django 5.0.14 on 2026-10-18 14:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0007_question_difficulty_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewturn',
+            name='eval_latency_ms',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='QuestionStats',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='interviews.question')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.BigIntegerField(default=0)),
+                ('score_sq_sum', models.BigIntegerField(default=0)),
+                ('answer_length_sum', models.BigIntegerField(default=0)),
+                ('mean_score', models.FloatField(blank=True, null=True)),
+                ('score_variance', models.FloatField(blank=True, null=True)),
+                ('mean_answer_length', models.FloatField(blank=True, null=True)),
+                ('eval_latency_p95_ms', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('recomputed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'question stats',
+            },
+        ),
+    ]
@@ -1,7 +1,11 @@
 import uuid
 from django.db import models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, NullIf, Now, Power
 from django.conf import settings
 
+from .text import normalize_topic, text_hash
+
 class Question(models.Model):
     """
     Represents a technical question in the system.
@@ -15,16 +19,47 @@ class Question(models.Model):
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     topic = models.CharField(max_length=100)  # e.g., "Network Engineering"
+    # Normalized copy of topic ("network engineering") for indexed lookups
+    topic_slug = models.CharField(max_length=100, blank=True, editable=False, db_index=True)
     text = models.TextField()                 # The actual question
+    # Fingerprint of the normalized text; bulk imports deduplicate on it
+    text_hash = models.CharField(max_length=64, blank=True, editable=False, db_index=True)
     difficulty = models.CharField(max_length=10, choices=DIFFICULTY_CHOICES, default='MEDIUM')
     
     # TEACHER NOTE: 
     # We store "expected key points" so the AI knows how to grade the answer later.
     expected_answer_points = models.TextField(help_text="Bullet points the AI should look for.")
 
+    # TEACHER NOTE:
+    # Difficulty on the adaptive engine's logit scale (about -1 easy .. +1 hard),
+    # fitted from past answers by a nightly job. Empty until the question has
+    # enough attempts; the EASY/MEDIUM/HARD label is used until then.
+    difficulty_rating = models.FloatField(null=True, blank=True, editable=False)
+
+    class Meta:
+        # TEACHER NOTE:
+        # Questions are always filtered by difficulty first, then by topic.
+        # Substring search on topic is served by a trigram index on Postgres
+        # (created in migration 0003); topic_slug covers exact/prefix matches.
+        indexes = [
+            models.Index(fields=['difficulty', 'topic'], name='question_difficulty_topic_idx'),
+            models.Index(fields=['difficulty', 'topic_slug'], name='question_difficulty_slug_idx'),
+        ]
+
     def __str__(self):
         return f"{self.topic}: {self.text[:50]}..."
 
+    def save(self, *args, **kwargs):
+        self.topic_slug = normalize_topic(self.topic)
+        self.text_hash = text_hash(self.text)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            derived = {'topic': 'topic_slug', 'text': 'text_hash'}
+            extra = {derived[field] for field in update_fields if field in derived}
+            if extra:
+                kwargs['update_fields'] = {*update_fields, *extra}
+        super().save(*args, **kwargs)
+
 
 class InterviewSession(models.Model):
     """
@@ -48,9 +83,44 @@ class InterviewSession(models.Model):
     # Final consolidated score (0-100)
     total_score = models.FloatField(default=0.0)
 
+    # TEACHER NOTE:
+    # Running totals so the average can be updated in O(1) per turn,
+    # instead of re-reading every InterviewTurn of the session.
+    turn_count = models.PositiveIntegerField(default=0)
+    score_sum = models.IntegerField(default=0)
+
+    # TEACHER NOTE:
+    # Per-turn voice pipeline latencies (ms per stage), written by the bot's
+    # instrumentation when the interview ends. See apps/simulation/instrumentation.py.
+    latency_trace = models.JSONField(default=list, blank=True)
+
+    # TEACHER NOTE:
+    # Final report from the post-interview deep scoring (Celery, see
+    # apps/interviews/tasks.py). Empty until the workers have finished; once
+    # set, the session's turn scores are deep scores and it is never re-scored.
+    report = models.JSONField(default=dict, blank=True)
+
     def __str__(self):
         return f"{self.user.username} - {self.start_time.date()}"
 
+    @classmethod
+    def add_turn_scores(cls, session_id, turns: int, score_sum: int) -> int:
+        """
+        Atomically fold new turn scores into a session's running totals.
+        The whole update is one SQL statement using F() expressions, so
+        concurrent writers cannot lose updates.
+
+        Returns the number of rows updated (0 if the session does not exist).
+        """
+        return cls.objects.filter(id=session_id).update(
+            turn_count=F('turn_count') + turns,
+            score_sum=F('score_sum') + score_sum,
+            total_score=(
+                Cast(F('score_sum') + score_sum, FloatField())
+                / (F('turn_count') + turns)
+            ),
+        )
+
 
 class InterviewTurn(models.Model):
     """
@@ -74,7 +144,107 @@ class InterviewTurn(models.Model):
     score = models.IntegerField(default=0) # 0-10
     feedback = models.TextField(blank=True) # Text explanation of the score
 
+    # Point-by-point breakdown from the post-interview deep evaluation.
+    # 'score' and 'feedback' above are overwritten by it; the live score is kept here.
+    evaluation = models.JSONField(default=dict, blank=True)
+
+    # How long the live evaluation of this answer took (ms); empty if not measured
+    eval_latency_ms = models.PositiveIntegerField(null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['created_at'] # Keep the conversation in order
\ No newline at end of file
+        ordering = ['created_at'] # Keep the conversation in order
+        indexes = [
+            # Turns are always read per session in conversation order
+            models.Index(fields=['session', 'created_at'], name='turn_session_created_idx'),
+        ]
+
+
+class QuestionStats(models.Model):
+    """
+    Materialized per-question statistics over the InterviewTurn history.
+    Kept up to date as turns are saved and rebuilt by a nightly job
+    (see apps/interviews/question_stats.py).
+    """
+    question = models.OneToOneField(
+        Question, on_delete=models.CASCADE, primary_key=True, related_name='stats'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+
+    # TEACHER NOTE:
+    # Running sums, so a new turn is folded in with one UPDATE instead of
+    # re-reading every turn of the question. The means and the variance
+    # below are derived from them in the same statement.
+    score_sum = models.BigIntegerField(default=0)
+    score_sq_sum = models.BigIntegerField(default=0)
+    answer_length_sum = models.BigIntegerField(default=0)  # characters
+
+    mean_score = models.FloatField(null=True, blank=True)  # 0-10
+    score_variance = models.FloatField(null=True, blank=True)
+    mean_answer_length = models.FloatField(null=True, blank=True)
+
+    # TEACHER NOTE:
+    # A percentile cannot be updated from running sums, so this one is only
+    # refreshed by the nightly recompute.
+    eval_latency_p95_ms = models.FloatField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(null=True, blank=True)
+    recomputed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "question stats"
+
+    def __str__(self):
+        return f"{self.question_id}: {self.attempts} attempts"
+
+    @staticmethod
+    def tally(turns) -> dict:
+        """Build add_turns totals from (question_id, score, user_transcript) tuples."""
+        totals = {}
+        for question_id, score, transcript in turns:
+            if not question_id:
+                continue
+            attempts, score_sum, score_sq_sum, length_sum = totals.get(question_id, (0, 0, 0, 0))
+            totals[question_id] = (
+                attempts + 1,
+                score_sum + score,
+                score_sq_sum + score * score,
+                length_sum + len(transcript or ""),
+            )
+        return totals
+
+    @classmethod
+    def add_turns(cls, totals: dict) -> None:
+        """
+        Fold new (or re-scored) turns into the statistics of their questions.
+
+        Args:
+            totals: {question_id: (attempts, score_sum, score_sq_sum, answer_length_sum)}
+                to add; a re-score adds 0 attempts and the score differences
+
+        Each question is one UPDATE using F() expressions, like
+        InterviewSession.add_turn_scores, so concurrent writers cannot lose
+        updates. Rows are updated in question order to avoid deadlocks.
+        """
+        if not totals:
+            return
+        cls.objects.bulk_create(
+            [cls(question_id=question_id) for question_id in totals], ignore_conflicts=True
+        )
+        for question_id in sorted(totals, key=str):
+            attempts, score_sum, score_sq_sum, length_sum = totals[question_id]
+            count = NullIf(F('attempts') + attempts, 0)
+            mean = Cast(F('score_sum') + score_sum, FloatField()) / count
+            cls.objects.filter(question_id=question_id).update(
+                attempts=F('attempts') + attempts,
+                score_sum=F('score_sum') + score_sum,
+                score_sq_sum=F('score_sq_sum') + score_sq_sum,
+                answer_length_sum=F('answer_length_sum') + length_sum,
+                mean_score=mean,
+                score_variance=(
+                    Cast(F('score_sq_sum') + score_sq_sum, FloatField()) / count - Power(mean, 2)
+                ),
+                mean_answer_length=Cast(F('answer_length_sum') + length_sum, FloatField()) / count,
+                updated_at=Now(),
+            )
@@ -0,0 +1,90 @@
+# src/apps/interviews/question_io.py
+"""
+Streaming JSONL/CSV readers and writers for the question bank, shared by the
+import_questions and export_questions commands.
+
+Rows are read and written one at a time, so memory use does not grow with the
+file. Files ending in .gz are (de)compressed on the fly; "-" means stdin/stdout.
+"""
+import csv
+import gzip
+import io
+import json
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+FIELDS = ("topic", "difficulty", "text", "expected_answer_points")
+FORMATS = ("jsonl", "csv")
+
+_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl", ".csv": "csv"}
+
+# Expected answer points can be long; the csv module's default cap is 128 KiB
+csv.field_size_limit(16 * 1024 * 1024)
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """Return the explicit format, or infer it from the file extension."""
+    if fmt:
+        return fmt
+    name = path[:-3] if path.endswith(".gz") else path
+    for extension, detected in _EXTENSIONS.items():
+        if name.endswith(extension):
+            return detected
+    raise ValueError(f"Cannot tell the format of {path!r}; pass --format jsonl or csv")
+
+
+@contextmanager
+def open_text(path: str, mode: str):
+    """Open a path ("-" for stdin/stdout, *.gz compressed) as UTF-8 text."""
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+    elif path.endswith(".gz"):
+        with gzip.open(path, mode + "t", encoding="utf-8", newline="") as stream:
+            yield stream
+    else:
+        with open(path, mode, encoding="utf-8", newline="") as stream:
+            yield stream
+
+
+def read_rows(stream: io.TextIOBase, fmt: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """
+    Yield (line number, row, error) for each record; row is None when the
+    record could not be parsed.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        missing = [field for field in ("topic", "text", "expected_answer_points")
+                   if field not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"CSV header is missing columns: {', '.join(missing)}")
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"invalid JSON ({e})"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "expected a JSON object"
+            continue
+        yield line_number, row, None
+
+
+def row_writer(stream: io.TextIOBase, fmt: str) -> Callable[[Dict], None]:
+    """Return a function that writes one row (a dict of FIELDS) to the stream."""
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        return writer.writerow
+
+    def write_jsonl(row: Dict) -> None:
+        stream.write(json.dumps({field: row[field] for field in FIELDS}, ensure_ascii=False))
+        stream.write("\n")
+
+    return write_jsonl
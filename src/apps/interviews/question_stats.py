@@ -0,0 +1,110 @@
+# src/apps/interviews/question_stats.py
+"""
+Full rebuild of the QuestionStats table from the InterviewTurn history.
+
+QuestionStats is maintained incrementally as turns are saved (and when the
+post-interview scoring changes a score), but turns deleted or edited by hand
+are never seen, and the p95 evaluation latency cannot be maintained from
+running sums at all. recompute_question_stats() rebuilds every row from the
+source of truth; celery beat runs it nightly and recompute_question_stats
+(the command) runs it on demand, e.g. right after migrating.
+"""
+import math
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import Count, F, Sum, Value
+from django.db.models.functions import Coalesce, Length
+from django.utils import timezone
+
+from .models import InterviewTurn, QuestionStats
+
+LATENCY_PERCENTILE = 0.95
+BULK_BATCH = 2000
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    # Nearest-rank percentile of an ascending list
+    return float(sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)])
+
+
+def recompute_question_stats(chunk_size: int = 5000) -> dict:
+    """
+    Rebuild every QuestionStats row from InterviewTurn.
+
+    Sums are aggregated by the database in one GROUP BY query; the latency
+    percentile is computed from a stream of (question, latency) pairs sorted
+    by the database, one question at a time. Turns saved while this runs are
+    included or not depending on timing; the next run counts them either way.
+
+    Returns:
+        Dictionary with questions, turns and removed (rows of questions that
+        no longer have any turns)
+    """
+    turns = InterviewTurn.objects.filter(question__isnull=False)
+    totals = (
+        turns.order_by()
+        .values('question_id')
+        .annotate(
+            attempts=Count('id'),
+            score_sum=Sum('score'),
+            score_sq_sum=Sum(F('score') * F('score')),
+            answer_length_sum=Sum(Coalesce(Length('user_transcript'), Value(0))),
+        )
+    )
+
+    now = timezone.now()
+    stats = {}
+    for row in totals.iterator(chunk_size=chunk_size):
+        attempts = row['attempts']
+        mean = row['score_sum'] / attempts
+        stats[row['question_id']] = QuestionStats(
+            question_id=row['question_id'],
+            attempts=attempts,
+            score_sum=row['score_sum'],
+            score_sq_sum=row['score_sq_sum'],
+            answer_length_sum=row['answer_length_sum'],
+            mean_score=mean,
+            score_variance=row['score_sq_sum'] / attempts - mean * mean,
+            mean_answer_length=row['answer_length_sum'] / attempts,
+            updated_at=now,
+            recomputed_at=now,
+        )
+
+    latencies = (
+        turns.filter(eval_latency_ms__isnull=False)
+        .order_by('question_id', 'eval_latency_ms')
+        .values_list('question_id', 'eval_latency_ms')
+        .iterator(chunk_size=chunk_size)
+    )
+    for question_id, rows in groupby(latencies, key=lambda row: row[0]):
+        if question_id in stats:
+            values = [latency for _, latency in rows]
+            stats[question_id].eval_latency_p95_ms = _percentile(values, LATENCY_PERCENTILE)
+
+    stale = [
+        question_id
+        for question_id in QuestionStats.objects.values_list('question_id', flat=True).iterator()
+        if question_id not in stats
+    ]
+
+    with transaction.atomic():
+        for start in range(0, len(stale), BULK_BATCH):
+            QuestionStats.objects.filter(question_id__in=stale[start:start + BULK_BATCH]).delete()
+        QuestionStats.objects.bulk_create(
+            stats.values(),
+            batch_size=BULK_BATCH,
+            update_conflicts=True,
+            unique_fields=['question'],
+            update_fields=[
+                'attempts', 'score_sum', 'score_sq_sum', 'answer_length_sum',
+                'mean_score', 'score_variance', 'mean_answer_length',
+                'eval_latency_p95_ms', 'updated_at', 'recomputed_at',
+            ],
+        )
+
+    return {
+        "questions": len(stats),
+        "turns": sum(s.attempts for s in stats.values()),
+        "removed": len(stale),
+    }
@@ -0,0 +1,241 @@
+# src/apps/interviews/tasks.py
+"""
+Post-interview scoring, run by Celery workers (see config/celery.py).
+
+When SessionManagerTool completes a session it enqueues score_session, which
+fans out one reevaluate_turn per InterviewTurn as a chord:
+
+    score_session ──> reevaluate_turn (x N, in parallel on any worker)
+                  └─> build_session_report (once all N are done)
+
+reevaluate_turn only reads and calls the LLM; build_session_report writes
+every turn back with one bulk_update and stores the session report, so the
+database sees a handful of statements per session however many workers ran.
+
+calibrate_difficulty refits question difficulties for the adaptive selector
+and recompute_question_stats rebuilds QuestionStats; celery beat runs both
+nightly (CELERY_BEAT_SCHEDULE in settings).
+"""
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+
+from celery import chord, group, shared_task
+from celery.exceptions import MaxRetriesExceededError
+from celery.utils.log import get_task_logger
+from django.db import transaction
+
+from .models import InterviewSession, InterviewTurn, QuestionStats
+from .question_stats import recompute_question_stats as _recompute_question_stats
+
+# Add project root to path (for the evaluator in src.Tools)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+logger = get_task_logger(__name__)
+
+# Points listed per report section; the full lists stay on each turn
+MAX_REPORT_POINTS = 10
+BULK_UPDATE_BATCH = 500
+
+
+@shared_task(name="interviews.score_session")
+def score_session(session_id: str) -> dict:
+    """
+    Fan out deep re-evaluation of every turn of a completed session.
+
+    A session that already has a report has been deep-scored: its turn
+    scores are deep scores now, and scoring again would treat them as live
+    ones, so it is skipped.
+    """
+    if InterviewSession.objects.filter(id=session_id).exclude(report={}).exists():
+        logger.info(f"Session {session_id} already has a report; not scoring it again")
+        return {"session_id": session_id, "turns": 0, "skipped": True}
+
+    turn_ids = [
+        str(turn_id)
+        for turn_id in InterviewTurn.objects.filter(session_id=session_id).values_list('id', flat=True)
+    ]
+    callback = build_session_report.s(session_id)
+    if not turn_ids:
+        callback.delay([])
+    else:
+        chord(group(reevaluate_turn.s(turn_id) for turn_id in turn_ids))(callback)
+
+    logger.info(f"Scoring session {session_id}: {len(turn_ids)} turns queued")
+    return {"session_id": session_id, "turns": len(turn_ids)}
+
+
+@shared_task(name="interviews.reevaluate_turn", bind=True, max_retries=3)
+def reevaluate_turn(self, turn_id: str) -> dict:
+    """
+    Deep-evaluate one turn. Never raises: a turn that cannot be scored keeps
+    its live score and is reported with an "error", so one bad turn does not
+    sink the session's report.
+    """
+    from src.Tools.interview.deep_evaluator import DeepAnswerEvaluatorTool
+
+    turn = InterviewTurn.objects.select_related('question').filter(id=turn_id).first()
+    if turn is None:
+        return {"turn_id": turn_id, "error": "Turn no longer exists"}
+
+    result = {
+        "turn_id": turn_id,
+        "question": turn.question.text if turn.question else turn.ai_message,
+        "topic": turn.question.topic if turn.question else "",
+        "live_score": turn.score,
+    }
+    if turn.question is None or not (turn.user_transcript or "").strip():
+        # Nothing to grade against, or nothing was said
+        return {**result, "error": "No question or transcript to evaluate"}
+
+    evaluation = DeepAnswerEvaluatorTool()._execute(
+        user_transcript=turn.user_transcript,
+        expected_answer_points=turn.question.expected_answer_points,
+        question_text=turn.question.text,
+    )
+
+    if "error" in evaluation and "score" not in evaluation:
+        # Configuration problem (no API key): retrying will not help
+        return {**result, "error": evaluation["error"]}
+
+    # An unparseable reply comes back as a default score with a "warning";
+    # that is not a real score, so it fails like an error
+    failure = evaluation.get("error") or evaluation.get("warning")
+    if failure:
+        try:
+            raise self.retry(countdown=2 ** self.request.retries * 5)
+        except MaxRetriesExceededError:
+            logger.warning(f"Giving up on turn {turn_id}: {failure}")
+            return {**result, "error": failure}
+
+    return {
+        **result,
+        "score": evaluation["score"],
+        "feedback": evaluation.get("feedback", ""),
+        "reasoning": evaluation.get("reasoning", ""),
+        "covered_points": evaluation.get("covered_points", []),
+        "missed_points": evaluation.get("missed_points", []),
+        "inaccuracies": evaluation.get("inaccuracies", []),
+    }
+
+
+@shared_task(name="interviews.build_session_report")
+def build_session_report(results: list, session_id: str) -> dict:
+    """Write deep scores back in bulk and store the aggregated session report."""
+    scored = {r["turn_id"]: r for r in results if "error" not in r}
+
+    turns = list(InterviewTurn.objects.filter(id__in=list(scored)))
+    # Score changes per question, so QuestionStats follows the new scores
+    rescored = defaultdict(lambda: (0, 0, 0, 0))
+    for turn in turns:
+        deep = scored[str(turn.id)]
+        if turn.question_id and deep["score"] != turn.score:
+            _, score_sum, score_sq_sum, _ = rescored[turn.question_id]
+            rescored[turn.question_id] = (
+                0,
+                score_sum + deep["score"] - turn.score,
+                score_sq_sum + deep["score"] ** 2 - turn.score ** 2,
+                0,
+            )
+        turn.score = deep["score"]
+        turn.feedback = deep["feedback"]
+        turn.evaluation = {
+            key: deep[key]
+            for key in ("live_score", "reasoning", "covered_points", "missed_points", "inaccuracies")
+        }
+
+    # Turns that could not be re-scored still count, with their live score
+    final_scores = [r.get("score", r.get("live_score", 0)) for r in results if "live_score" in r]
+    score_sum = sum(final_scores)
+    report = _aggregate(results, final_scores)
+
+    with transaction.atomic():
+        session = InterviewSession.objects.select_for_update().filter(id=session_id).first()
+        if session is None or session.report:
+            # Deleted, or another scoring run finished first: its scores stand
+            logger.warning(f"Session {session_id} missing or already reported; discarding this run")
+            return {"session_id": session_id, "skipped": True}
+        InterviewTurn.objects.bulk_update(
+            turns, ['score', 'feedback', 'evaluation'], batch_size=BULK_UPDATE_BATCH
+        )
+        InterviewSession.objects.filter(id=session_id).update(
+            report=report,
+            turn_count=len(final_scores),
+            score_sum=score_sum,
+            total_score=report["total_score"],
+        )
+        QuestionStats.add_turns(dict(rescored))
+
+    logger.info(
+        f"Session {session_id} report: {report['total_score']} "
+        f"({len(turns)} turns re-scored, {report['turns_failed']} failed)"
+    )
+    return {"session_id": session_id, "total_score": report["total_score"]}
+
+
+def _aggregate(results: list, final_scores: list) -> dict:
+    """Build the session report from the per-turn results."""
+    by_topic = defaultdict(list)
+    strengths, gaps, inaccuracies = [], [], []
+    for r in results:
+        if "live_score" not in r:
+            continue
+        by_topic[r["topic"] or "General"].append(r.get("score", r["live_score"]))
+        strengths.extend(r.get("covered_points", []))
+        gaps.extend(r.get("missed_points", []))
+        inaccuracies.extend(r.get("inaccuracies", []))
+
+    live_scores = [r["live_score"] for r in results if "live_score" in r]
+    failed = sum(1 for r in results if "error" in r)
+    return {
+        "status": "partial" if failed else "complete",
+        "generated_at": datetime.now().isoformat(),
+        "total_score": round(sum(final_scores) / len(final_scores), 2) if final_scores else 0.0,
+        "live_total_score": round(sum(live_scores) / len(live_scores), 2) if live_scores else 0.0,
+        "turns_evaluated": len(results) - failed,
+        "turns_failed": failed,
+        "by_topic": {
+            topic: {"turns": len(scores), "mean_score": round(sum(scores) / len(scores), 2)}
+            for topic, scores in by_topic.items()
+        },
+        "strengths": strengths[:MAX_REPORT_POINTS],
+        "gaps": gaps[:MAX_REPORT_POINTS],
+        "inaccuracies": inaccuracies[:MAX_REPORT_POINTS],
+        "turns": [
+            {
+                "turn_id": r["turn_id"],
+                "question": r.get("question", ""),
+                "live_score": r.get("live_score"),
+                "score": r.get("score"),
+                "error": r.get("error"),
+            }
+            for r in results
+        ],
+    }
+
+
+@shared_task(name="interviews.calibrate_difficulty")
+def calibrate_difficulty() -> dict:
+    """Refit every question's difficulty_rating from the turn history (nightly)."""
+    from src.Tools.interview.difficulty_engine import calibrate_question_difficulty
+
+    result = calibrate_question_difficulty()
+    logger.info(
+        f"Calibrated {result['questions_calibrated']} questions from {result['turns']} turns "
+        f"(mean change {result['mean_change']})"
+    )
+    return result
+
+
+@shared_task(name="interviews.recompute_question_stats")
+def recompute_question_stats() -> dict:
+    """Rebuild QuestionStats from the whole turn history (nightly)."""
+    result = _recompute_question_stats()
+    logger.info(
+        f"Recomputed stats for {result['questions']} questions from {result['turns']} turns "
+        f"({result['removed']} stale rows removed)"
+    )
+    return result
@@ -0,0 +1,24 @@
+# src/apps/interviews/text.py
+"""
+Text normalization shared by the interviews models and the question tools.
+Kept free of Django imports so it is cheap to import anywhere.
+"""
+import hashlib
+import re
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_topic(topic: str) -> str:
+    """Lowercase and collapse whitespace so topic lookups ignore formatting."""
+    return " ".join((topic or "").lower().split())
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace, so case and formatting differences match."""
+    return " ".join(_PUNCTUATION.sub(" ", (text or "").lower()).split())
+
+
+def text_hash(text: str) -> str:
+    """Stable fingerprint of a question's normalized text, used to spot duplicates."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
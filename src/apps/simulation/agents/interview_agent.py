@@ -15,6 +15,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
 from src.Tools.interview.interview_toolkit import InterviewToolkit
+from src.Tools.interview.llm_clients import get_chat_llm
 from src.apps.simulation.agents.tool_converter import to_langchain_tools
 from src.apps.simulation.agents.prompts import initialize_langfuse
 
@@ -68,7 +69,7 @@ class InterviewAgent:
         Create the LLM instance using Krutrim's OpenAI-compatible endpoint.
         
         Returns:
-            ChatOpenAI instance configured for Krutrim
+            Shared ChatOpenAI instance configured for Krutrim
         """
         krutrim_api_key = os.getenv("KRUTRIM_API_KEY")
         
@@ -78,9 +79,7 @@ class InterviewAgent:
                 "Please set it in your .env file."
             )
         
-        return ChatOpenAI(
-            model="gpt-oss-120b",
-            base_url="https://cloud.olakrutrim.com/v1",
+        return get_chat_llm(
             api_key=krutrim_api_key,
             temperature=0.7  # Balanced for natural conversation
         )
@@ -21,7 +21,9 @@ def to_langchain_tools(tool_list: List[BaseTool]) -> List[StructuredTool]:
     Convert BaseTool instances to LangChain StructuredTool objects.
     
     This allows our custom tools to be used with LangGraph's ToolNode
-    and other LangChain components.
+    and other LangChain components. Both the sync and async entry points
+    are wired, so async graphs can run tools concurrently without
+    blocking the event loop.
     
     Args:
         tool_list: List of BaseTool instances
@@ -42,6 +44,7 @@ def to_langchain_tools(tool_list: List[BaseTool]) -> List[StructuredTool]:
             name=tool.name,
             description=tool.description,
             func=tool._execute,
+            coroutine=tool._aexecute,
             args_schema=tool.args_schema,
         )
         lc_tools.append(lc_tool)
@@ -0,0 +1,135 @@
+# src\apps\simulation\audio_buffers.py
+"""
+Preallocated PCM buffers for the LiveKit audio bridge.
+
+Every 10-20 ms frame of every session used to allocate a new array or bytes
+object. These helpers copy samples into fixed int16 storage instead, so the
+steady state allocates no sample buffers at all:
+
+- PcmRingBuffer: fixed-capacity ring of int16 samples.
+- Decimator: integer-ratio downsampling (e.g. 48 kHz -> 16 kHz) into a
+  reused output buffer.
+- FrameChunker: re-slices a ring into fixed-size chunks (the STT's
+  preferred frame size) from a small rotating pool of arrays; chunks are
+  only valid until the pool wraps around, so consumers that queue them copy.
+"""
+from typing import Iterator, Union
+
+import numpy as np
+
+Samples = Union[np.ndarray, memoryview, bytes, bytearray]
+
+
+def as_int16(data: Samples) -> np.ndarray:
+    """View PCM data as int16 samples without copying."""
+    if isinstance(data, np.ndarray):
+        return data
+    return np.frombuffer(data, dtype=np.int16)
+
+
+class PcmRingBuffer:
+    """Fixed-capacity ring buffer of int16 samples; the oldest audio is dropped on overflow."""
+
+    def __init__(self, capacity: int):
+        self._buf = np.zeros(capacity, dtype=np.int16)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self.dropped = 0
+
+    @property
+    def available(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write(self, data: Samples) -> None:
+        samples = as_int16(data)
+        count = len(samples)
+        if count >= self._capacity:
+            # Only the newest capacity's worth can be kept
+            self.dropped += self._size + count - self._capacity
+            samples = samples[-self._capacity:]
+            self._start, self._size, count = 0, 0, self._capacity
+
+        overflow = self._size + count - self._capacity
+        if overflow > 0:
+            self.drop(overflow)
+            self.dropped += overflow
+
+        end = (self._start + self._size) % self._capacity
+        first = min(count, self._capacity - end)
+        self._buf[end:end + first] = samples[:first]
+        if first < count:
+            self._buf[:count - first] = samples[first:]
+        self._size += count
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Move up to len(out) samples into out; returns how many were read."""
+        count = min(len(out), self._size)
+        first = min(count, self._capacity - self._start)
+        out[:first] = self._buf[self._start:self._start + first]
+        if first < count:
+            out[first:count] = self._buf[:count - first]
+        self.drop(count)
+        return count
+
+    def drop(self, count: int) -> int:
+        """Discard up to count of the oldest samples; returns how many were dropped."""
+        count = min(count, self._size)
+        self._start = (self._start + count) % self._capacity
+        self._size -= count
+        if self._size == 0:
+            self._start = 0
+        return count
+
+    def clear(self) -> int:
+        return self.drop(self._size)
+
+
+class Decimator:
+    """Downsamples by an integer ratio, averaging each group of input samples."""
+
+    def __init__(self, ratio: int, max_input: int):
+        if ratio < 1:
+            raise ValueError(f"Decimation ratio must be a positive integer, got {ratio}")
+        self.ratio = ratio
+        self._sums = np.zeros(max_input // ratio, dtype=np.int32)
+        self._out = np.zeros(max_input // ratio, dtype=np.int16)
+
+    def process(self, data: Samples) -> np.ndarray:
+        """Return a view of the reused output buffer (valid until the next call)."""
+        samples = as_int16(data)
+        if self.ratio == 1:
+            return samples
+        count = len(samples) // self.ratio
+        if count > len(self._out):
+            raise ValueError(f"Frame of {len(samples)} samples exceeds the decimator's max input")
+        sums = self._sums[:count]
+        np.sum(samples[:count * self.ratio].reshape(count, self.ratio), axis=1, dtype=np.int32, out=sums)
+        np.floor_divide(sums, self.ratio, out=sums)
+        out = self._out[:count]
+        out[:] = sums
+        return out
+
+
+class FrameChunker:
+    """Cuts a ring buffer into fixed-size chunks using a rotating pool of arrays."""
+
+    def __init__(self, ring: PcmRingBuffer, chunk_samples: int, pool_size: int = 16):
+        self.ring = ring
+        self.chunk_samples = chunk_samples
+        # A chunk's array is reused pool_size chunks later. Anything that may
+        # hold on to a chunk longer (e.g. a pipeline queue) must copy it.
+        self._pool = [np.zeros(chunk_samples, dtype=np.int16) for _ in range(pool_size)]
+        self._next = 0
+
+    def chunks(self) -> Iterator[np.ndarray]:
+        """Yield every complete chunk currently buffered."""
+        while self.ring.available >= self.chunk_samples:
+            chunk = self._pool[self._next]
+            self._next = (self._next + 1) % len(self._pool)
+            self.ring.read_into(chunk)
+            yield chunk
@@ -0,0 +1,174 @@
+# src\apps\simulation\audio_scheduler.py
+"""
+Paced outbound audio for the LiveKit bridge.
+
+TTS produces audio in bursts; handing it to LiveKit as fast as it arrives
+either stalls the pipeline or plays back unevenly when many sessions share a
+CPU. OutboundAudioScheduler puts a bounded jitter buffer in between:
+
+- put() waits while the buffer is full (backpressure), so nothing queued is
+  ever dropped for lack of room; a producer on another thread blocks on it
+  through asyncio.run_coroutine_threadsafe (see livekit_adapter);
+- playback starts once OUTPUT_JITTER_MS of audio is buffered, then one frame
+  is sent per frame interval against a monotonic clock, so a late tick is
+  caught up instead of drifting;
+- a short tail left at the end of an utterance is padded and flushed;
+- interrupt() drops everything buffered when the candidate barges in.
+
+metrics() reports buffer depth, underruns and trimmed audio (overflow_ms
+stays 0 unless something writes to the ring buffer directly).
+"""
+import os
+import time
+import asyncio
+from typing import Awaitable, Callable, Dict
+
+import numpy as np
+
+from apps.simulation.audio_buffers import PcmRingBuffer, Samples, as_int16
+
+# Running dry and resuming within this long counts as an underrun, not a pause
+UNDERRUN_GAP_SECONDS = 0.25
+
+
+class OutboundAudioScheduler:
+    """Bounded jitter buffer that feeds a sink one frame per frame interval."""
+
+    def __init__(
+        self,
+        sink: Callable[[np.ndarray], Awaitable[None]],
+        sample_rate: int = 16000,
+        frame_ms: int = 10,
+        jitter_ms: int = None,
+        max_buffer_ms: int = None
+    ):
+        self._sink = sink
+        self.sample_rate = sample_rate
+        self.frame_samples = sample_rate * frame_ms // 1000
+        self.frame_seconds = frame_ms / 1000
+        jitter_ms = jitter_ms or int(os.getenv("OUTPUT_JITTER_MS", "60"))
+        max_buffer_ms = max_buffer_ms or int(os.getenv("OUTPUT_BUFFER_MS", "2000"))
+        self.jitter_samples = sample_rate * jitter_ms // 1000
+
+        self._buffer = PcmRingBuffer(sample_rate * max_buffer_ms // 1000)
+        self._frame = np.zeros(self.frame_samples, dtype=np.int16)
+        self._has_audio = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._playing = False
+        self._dry_since = None
+        self._task = None
+
+        self._underruns = 0
+        self._late_frames = 0
+        self._frames_sent = 0
+        self._trimmed = 0
+        self._max_depth = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def put(self, data: Samples) -> None:
+        """Queue audio, waiting while the jitter buffer is full."""
+        samples = as_int16(data)
+        while len(samples):
+            free = self._buffer.capacity - self._buffer.available
+            if free == 0:
+                self._has_space.clear()
+                await self._has_space.wait()
+                continue
+            self._buffer.write(samples[:free])
+            samples = samples[free:]
+            self._max_depth = max(self._max_depth, self._buffer.available)
+            self._has_audio.set()
+
+    def interrupt(self) -> int:
+        """Drop all buffered audio (barge-in); returns the milliseconds trimmed."""
+        trimmed = self._buffer.clear()
+        self._trimmed += trimmed
+        self._playing = False
+        self._dry_since = None
+        self._has_space.set()
+        return trimmed * 1000 // self.sample_rate
+
+    def metrics(self) -> Dict[str, float]:
+        to_ms = 1000 / self.sample_rate
+        return {
+            "depth_ms": self._buffer.available * to_ms,
+            "max_depth_ms": self._max_depth * to_ms,
+            "underruns": self._underruns,
+            "late_frames": self._late_frames,
+            "frames_sent": self._frames_sent,
+            "overflow_ms": self._buffer.dropped * to_ms,
+            "trimmed_ms": self._trimmed * to_ms,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            if not self._playing:
+                await self._wait_for_prebuffer()
+                if self._dry_since is not None and loop.time() - self._dry_since < UNDERRUN_GAP_SECONDS:
+                    # Audio came back right after running dry: a gap mid-utterance
+                    self._underruns += 1
+                self._dry_since = None
+                self._playing = True
+                deadline = loop.time()
+
+            if 0 < self._buffer.available < self.frame_samples:
+                # Give the producer one frame interval before treating it as a tail
+                self._has_audio.clear()
+                try:
+                    await asyncio.wait_for(self._has_audio.wait(), self.frame_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+            if self._buffer.available >= self.frame_samples:
+                self._buffer.read_into(self._frame)
+            elif self._buffer.available:
+                # End of an utterance: pad the tail instead of holding it back
+                count = self._buffer.read_into(self._frame)
+                self._frame[count:] = 0
+            else:
+                self._playing = False
+                self._dry_since = loop.time()
+                continue
+
+            self._has_space.set()
+            await self._sink(self._frame)
+            self._frames_sent += 1
+
+            deadline += self.frame_seconds
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -self.frame_seconds * 5:
+                # Too far behind to catch up smoothly; restart the clock
+                self._late_frames += 1
+                deadline = loop.time()
+
+    async def _wait_for_prebuffer(self) -> None:
+        # Wait for the first audio, then up to one jitter window for the buffer to fill
+        while not self._buffer.available:
+            self._has_audio.clear()
+            await self._has_audio.wait()
+
+        deadline = time.monotonic() + self.jitter_samples / self.sample_rate
+        while self._buffer.available < self.jitter_samples:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                # A short utterance that will never fill the jitter buffer
+                return
+            self._has_audio.clear()
+            try:
+                await asyncio.wait_for(self._has_audio.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
@@ -0,0 +1,115 @@
+# src\apps\simulation\bench_audio.py
+"""
+Microbenchmark for the LiveKit audio bridge.
+
+Pushes 10 ms inbound frames and 20 ms outbound TTS chunks through N
+concurrent streams, once the old way (np.frombuffer per inbound frame,
+tobytes() per outbound frame) and once through the preallocated ring buffers,
+and reports frames/sec and allocations/sec. Run from the project root:
+
+    python -m src.apps.simulation.bench_audio --streams 50
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.apps.simulation.audio_buffers import FrameChunker, PcmRingBuffer
+
+SAMPLE_RATE = 16000
+IN_FRAME = SAMPLE_RATE // 100    # 10 ms from LiveKit
+STT_CHUNK = SAMPLE_RATE // 50    # 20 ms to STT
+TTS_CHUNK = SAMPLE_RATE // 50    # 20 ms from TTS
+OUT_FRAME = SAMPLE_RATE // 100   # 10 ms to LiveKit
+
+
+class LegacyStream:
+    """The per-frame allocating bridge this replaces."""
+
+    def __init__(self):
+        self.inbound = memoryview(np.zeros(IN_FRAME, dtype=np.int16).tobytes())
+
+    def step(self, tts: np.ndarray):
+        pcm = np.frombuffer(self.inbound, dtype=np.int16)
+        frames = [tts[i:i + OUT_FRAME].tobytes() for i in range(0, len(tts), OUT_FRAME)]
+        return pcm, frames
+
+
+class RingStream:
+    def __init__(self):
+        self.inbound = memoryview(np.zeros(IN_FRAME, dtype=np.int16).tobytes())
+        self.chunker = FrameChunker(PcmRingBuffer(SAMPLE_RATE * 2), STT_CHUNK)
+        self.outbound = PcmRingBuffer(SAMPLE_RATE * 2)
+        self.out_frame = np.zeros(OUT_FRAME, dtype=np.int16)
+
+    def step(self, tts: np.ndarray):
+        self.chunker.ring.write(self.inbound)
+        chunk = None
+        for chunk in self.chunker.chunks():
+            pass
+        self.outbound.write(tts)
+        while self.outbound.available >= OUT_FRAME:
+            self.outbound.read_into(self.out_frame)
+        return chunk, self.out_frame
+
+
+def throughput(streams, tts: np.ndarray, seconds: float) -> float:
+    """Inbound plus outbound frames per second across all streams."""
+    frames_per_step = 1 + len(tts) // OUT_FRAME
+    steps = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for stream in streams:
+            stream.step(tts)
+        steps += len(streams)
+    return steps * frames_per_step / (time.perf_counter() - started)
+
+
+def allocations_per_frame(streams, tts: np.ndarray, rounds: int) -> float:
+    """
+    Memory blocks allocated per frame for output handed downstream.
+
+    Everything each step returns is kept alive, so buffers that would
+    normally be freed right after use still show up in the snapshot diff.
+    """
+    frames_per_step = 1 + len(tts) // OUT_FRAME
+    kept = [None] * (rounds * len(streams))
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignore)
+    i = 0
+    for _ in range(rounds):
+        for stream in streams:
+            kept[i] = stream.step(tts)
+            i += 1
+    after = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.stop()
+
+    blocks = sum(max(0, stat.count_diff) for stat in after.compare_to(before, "filename"))
+    return blocks / (len(kept) * frames_per_step)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--streams", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each throughput run")
+    parser.add_argument("--rounds", type=int, default=200, help="Steps per stream when counting allocations")
+    args = parser.parse_args()
+
+    tts = np.zeros(TTS_CHUNK, dtype=np.int16)
+    print(f"{args.streams} streams, {IN_FRAME}-sample inbound / {TTS_CHUNK}-sample TTS frames\n")
+    print(f"{'bridge':<10}{'frames/sec':>14}{'allocs/frame':>16}{'allocs/sec':>14}")
+    for name, factory in (("legacy", LegacyStream), ("ring", RingStream)):
+        streams = [factory() for _ in range(args.streams)]
+        # Warm up so ring buffers reach their steady state
+        throughput(streams, tts, 0.2)
+        rate = throughput(streams, tts, args.seconds)
+        per_frame = allocations_per_frame(streams, tts, args.rounds)
+        print(f"{name:<10}{rate:>14,.0f}{per_frame:>16.2f}{rate * per_frame:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# src\apps\simulation\bench_fakes.py
+"""
+Local stand-ins for Krutrim, Deepgram and LiveKit, used by bench_interview.
+
+Each fake follows a deterministic latency model instead of calling out:
+
+- FakeChatModel: LangChain chat model. It waits ttft_ms, then emits one
+  word per 1/tokens_per_sec, replying in whatever format the calling
+  prompt asks for (evaluation JSON or text, combined JSON, plain speech).
+- FakeSTTService: turns the end of user speech into the expected
+  transcript after latency_ms.
+- FakeTTSService: answers each text frame after ttfb_ms with silent audio
+  lasting as long as the text takes to say at chars_per_sec.
+- ToolTurnProcessor: the bot's interview-tools stage, fed transcripts directly.
+- TurnBarrier: pipeline tail that signals when a turn's response is complete.
+"""
+import re
+import time
+import zlib
+import asyncio
+import json
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from pipecat.frames.frames import (
+    Frame,
+    InputAudioRawFrame,
+    LLMFullResponseEndFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from apps.simulation.interview_turns import InterviewTurnProcessor
+
+SAMPLE_RATE = 16000
+# TTS audio is emitted in 20 ms frames
+TTS_FRAME_BYTES = SAMPLE_RATE // 50 * 2
+
+_TOKEN = re.compile(r"\S+\s*")
+
+
+class FakeChatModel(BaseChatModel):
+    """Deterministic LLM stand-in with a time-to-first-token and token-rate model."""
+
+    ttft_ms: float = 300.0
+    tokens_per_sec: float = 60.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-interview"
+
+    def _reply(self, messages: List[BaseMessage]) -> str:
+        system = " ".join(str(m.content) for m in messages if m.type == "system")
+        user = str(messages[-1].content) if messages else ""
+        # Same answer, same score
+        score = zlib.crc32(user.encode("utf-8")) % 11
+
+        if '"response"' in system:
+            return json.dumps({
+                "score": score,
+                "reasoning": "The answer covers some of the expected points.",
+                "feedback": "Try to explain the trade-offs in more depth.",
+                "response": "Thanks for walking me through that. Let's move on to the next question.",
+            })
+        if "JSON object" in system:
+            return json.dumps({
+                "score": score,
+                "reasoning": "The answer covers some of the expected points.",
+                "feedback": "Try to explain the trade-offs in more depth.",
+            })
+        if "SCORE:" in user:
+            return (
+                f"SCORE: {score}\n"
+                "REASONING: The answer covers some of the expected points.\n"
+                "FEEDBACK: Try to explain the trade-offs in more depth."
+            )
+        return "Thanks for walking me through that. Let's move on to the next question."
+
+    def _tokens(self, text: str) -> List[str]:
+        return _TOKEN.findall(text)
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        text = self._reply(messages)
+        time.sleep((self.ttft_ms / 1000) + len(self._tokens(text)) / self.tokens_per_sec)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        text = self._reply(messages)
+        await asyncio.sleep((self.ttft_ms / 1000) + len(self._tokens(text)) / self.tokens_per_sec)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    async def _astream(
+        self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        text = self._reply(messages)
+        await asyncio.sleep(self.ttft_ms / 1000)
+        for token in self._tokens(text):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+            await asyncio.sleep(1 / self.tokens_per_sec)
+
+
+class FakeSTTService(FrameProcessor):
+    """Consumes audio and emits the expected transcript latency_ms after speech ends."""
+
+    def __init__(self, latency_ms: float = 150.0, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency_ms / 1000
+        self.transcript = ""
+        self.audio_bytes = 0
+
+    def expect(self, transcript: str) -> None:
+        self.transcript = transcript
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InputAudioRawFrame):
+            # Audio stops here, like a real STT service
+            self.audio_bytes += len(frame.audio)
+            return
+
+        await self.push_frame(frame, direction)
+        if isinstance(frame, UserStoppedSpeakingFrame):
+            await asyncio.sleep(self.latency)
+            await self.push_frame(
+                TranscriptionFrame(text=self.transcript, user_id="bench", timestamp=str(time.time()))
+            )
+
+
+class FakeTTSService(FrameProcessor):
+    """Turns each text frame into silent 16 kHz audio after a time-to-first-byte."""
+
+    def __init__(self, ttfb_ms: float = 120.0, chars_per_sec: float = 15.0, **kwargs):
+        super().__init__(**kwargs)
+        self.ttfb = ttfb_ms / 1000
+        self.chars_per_sec = chars_per_sec
+        self._silence = bytes(TTS_FRAME_BYTES)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, TextFrame) and not isinstance(frame, TranscriptionFrame):
+            await self.push_frame(frame, direction)
+            await asyncio.sleep(self.ttfb)
+            frames = max(1, int(len(frame.text) / self.chars_per_sec * 50))
+            for _ in range(frames):
+                await self.push_frame(TTSAudioRawFrame(audio=self._silence, sample_rate=SAMPLE_RATE, num_channels=1))
+            return
+
+        await self.push_frame(frame, direction)
+
+
+class TurnBarrier(FrameProcessor):
+    """Pipeline tail that lets the driver wait for the end of each AI response."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._done = asyncio.Event()
+        self.audio_frames = 0
+
+    def reset(self) -> None:
+        self._done.clear()
+
+    async def wait(self, timeout: Optional[float] = None) -> None:
+        await asyncio.wait_for(self._done.wait(), timeout)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TTSAudioRawFrame):
+            self.audio_frames += 1
+            return
+        if isinstance(frame, LLMFullResponseEndFrame):
+            self._done.set()
+        await self.push_frame(frame, direction)
+
+
+class ToolTurnProcessor(InterviewTurnProcessor):
+    """
+    The bot's InterviewTurnProcessor, taking each final transcript as a turn.
+
+    The benchmark pipeline has no user context aggregator (turn detection is
+    the driver's UserStoppedSpeakingFrame), so turns are TranscriptionFrames.
+    """
+
+    def transcript(self, frame: Frame) -> Optional[str]:
+        return frame.text if isinstance(frame, TranscriptionFrame) else None
@@ -1,11 +1,13 @@
 # src\apps\simulation\bot.py
 import os
+import sys
+import asyncio
 from loguru import logger
 
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
-from pipecat.frames.frames import TextFrame, LLMMessagesFrame
+from pipecat.frames.frames import TextFrame, LLMMessagesFrame, TTSSpeakFrame
 from pipecat.transports.livekit.transport import LiveKitTransport, LiveKitParams
 
 from pipecat.services.deepgram.stt import DeepgramSTTService
@@ -22,13 +24,39 @@ from pipecat.turns.user_turn_strategies import UserTurnStrategies
 from pipecat.turns.user_stop.turn_analyzer_user_turn_stop_strategy import (
     TurnAnalyzerUserTurnStopStrategy,
 )
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import (
-    LocalSmartTurnAnalyzerV3,
-)
-
 
-async def run_ai_bot(room_url: str, token: str, room_name: str):
-    """Main entry point for the AI interviewer bot"""
+from apps.simulation.turn_analyzer import create_turn_analyzer
+from apps.simulation.context_window import ContextWindowProcessor
+from apps.simulation.instrumentation import LatencyProbe, TurnLatencyTracker
+from apps.simulation.interview_turns import InterviewTurnProcessor
+
+# Add project root to path (the interview tools import as src.Tools)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+
+
+async def run_ai_bot(
+    room_url: str,
+    token: str,
+    room_name: str,
+    handle_sigint: bool = True,
+    session_id: str = None,
+):
+    """
+    Main entry point for the AI interviewer bot.
+
+    Safe to run many times concurrently in one event loop (see
+    apps.simulation.worker): the Smart Turn model is shared process-wide, and
+    cancelling the coroutine cancels the pipeline before re-raising.
+
+    Stage latencies are recorded per turn and, when session_id is given,
+    saved to that InterviewSession's latency_trace at the end, after the
+    session is completed (which queues post-interview scoring).
+
+    With a session_id the interview is run by the interview tools
+    (TurnOrchestrator: questions from the bank, evaluated and saved turns,
+    replies spoken sentence by sentence); BOT_RESPONDER=llm keeps the
+    free-form LLM interviewer, which is also used without a session.
+    """
     logger.info(f"🤖 AI connecting to room: {room_name}")
 
     # -------- SERVICES --------
@@ -74,6 +102,8 @@ async def run_ai_bot(room_url: str, token: str, room_name: str):
     ]
     
     context = LLMContext(messages)
+    # Keeps each LLM call to the system prompt, a summary and the recent turns
+    context_window = ContextWindowProcessor(context)
 
     user_aggr, assistant_aggr = LLMContextAggregatorPair(
         context,
@@ -81,21 +111,45 @@ async def run_ai_bot(room_url: str, token: str, room_name: str):
             user_turn_strategies=UserTurnStrategies(
                 stop=[
                     TurnAnalyzerUserTurnStopStrategy(
-                        turn_analyzer=LocalSmartTurnAnalyzerV3()
+                        turn_analyzer=create_turn_analyzer()
                     )
                 ]
             )
         ),
     )
 
+    # -------- INSTRUMENTATION --------
+    latency = TurnLatencyTracker(session_id)
+
+    # -------- RESPONDER --------
+    orchestrator = None
+    session_manager = None
+    responder = llm
+    if session_id:
+        if PROJECT_ROOT not in sys.path:
+            sys.path.append(PROJECT_ROOT)
+        from src.Tools.interview.session_manager import SessionManagerTool
+
+        session_manager = SessionManagerTool()
+        if os.getenv("BOT_RESPONDER", "tools").lower() == "tools":
+            from src.Tools.interview.turn_orchestrator import TurnOrchestrator
+
+            orchestrator = TurnOrchestrator(session_manager=session_manager)
+            responder = InterviewTurnProcessor(orchestrator, session_id)
+
     # -------- PIPELINE --------
     pipeline = Pipeline([
         transport.input(),
         stt,
+        LatencyProbe(latency, "stt"),
         user_aggr,
-        llm,
+        context_window,
+        responder,
+        LatencyProbe(latency, "llm"),
         tts,
+        LatencyProbe(latency, "tts"),
         transport.output(),
+        LatencyProbe(latency, "output"),
         assistant_aggr,
     ])
 
@@ -105,6 +159,10 @@ async def run_ai_bot(room_url: str, token: str, room_name: str):
     @transport.event_handler("on_first_participant_joined")
     async def on_first_participant_joined(transport, participant):
         logger.success(f"👤 User joined: {participant}")
+        if orchestrator is not None:
+            # The first question comes from the question bank
+            await task.queue_frames([TTSSpeakFrame(await responder.start_interview())])
+            return
         # Greet the user and start the interview
         messages.append({
             "role": "system",
@@ -118,5 +176,26 @@ async def run_ai_bot(room_url: str, token: str, room_name: str):
         await task.cancel()
 
     # -------- RUN --------
-    runner = PipelineRunner()
-    await runner.run(task)
+    runner = PipelineRunner(handle_sigint=handle_sigint)
+    try:
+        await runner.run(task)
+    except asyncio.CancelledError:
+        logger.info(f"🛑 Stopping AI in room: {room_name}")
+        await task.cancel()
+        raise
+    finally:
+        if orchestrator is not None:
+            # Turns still being saved in the background
+            await asyncio.shield(orchestrator.drain())
+        if session_manager is not None:
+            # Completing the session is what queues post-interview scoring
+            await asyncio.shield(_complete_session(session_manager, session_id))
+        await asyncio.shield(latency.save())
+
+
+async def _complete_session(session_manager, session_id: str) -> None:
+    result = await session_manager._aexecute(action="complete", session_id=session_id)
+    if "error" in result:
+        logger.error(f"❌ Could not complete session {session_id}: {result['error']}")
+    else:
+        logger.info(f"🏁 Session {session_id} completed")
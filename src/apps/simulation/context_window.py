@@ -0,0 +1,150 @@
+# src\apps\simulation\context_window.py
+"""
+Bounded LLM context for the voice bot.
+
+Without trimming, every LLM call re-sends the whole interview, so latency and
+token cost grow with its length. ContextWindowProcessor sits between the user
+aggregator and the LLM and, before each call, rewrites the context to:
+
+    system prompt + running summary + last CONTEXT_KEEP_TURNS turns
+
+Older turns are dropped from the hot path immediately and folded into the
+summary by a background task; the summary shows up from the next call on.
+The whole window is kept under CONTEXT_TOKEN_BUDGET (default: four times
+MAX_TOOL_TOKEN_LIMIT), dropping further turns if K turns do not fit.
+"""
+import os
+import sys
+import asyncio
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from pipecat.frames.frames import Frame, LLMContextFrame
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+# Add project root to path (for the shared LLM clients in src.Tools)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+SUMMARY_PREFIX = "Summary of the interview so far:\n"
+
+SUMMARY_INSTRUCTION = (
+    "You keep a running summary of a technical interview for the interviewer. "
+    "Update the summary with the new exchanges below. Keep which questions were "
+    "asked, how well the candidate answered each, and anything the interviewer "
+    "promised to come back to. Reply with the updated summary only, in at most "
+    "{max_words} words."
+)
+
+
+def estimate_tokens(messages: List[Dict]) -> int:
+    """Rough token count (about four characters per token)."""
+    return sum(len(str(message.get("content", ""))) // 4 + 4 for message in messages)
+
+
+def split_turns(messages: List[Dict]) -> List[List[Dict]]:
+    """Group messages into turns, each starting at a user message."""
+    turns: List[List[Dict]] = []
+    for message in messages:
+        if message.get("role") == "user" or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+class ContextWindowProcessor(FrameProcessor):
+    """Keeps an LLMContext to the system prompt, a summary and the recent turns."""
+
+    def __init__(
+        self,
+        context: LLMContext,
+        keep_turns: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self._context = context
+        self._keep_turns = keep_turns or int(os.getenv("CONTEXT_KEEP_TURNS", "6"))
+        self._token_budget = token_budget or int(os.getenv(
+            "CONTEXT_TOKEN_BUDGET",
+            4 * int(os.getenv("MAX_TOOL_TOKEN_LIMIT", "800")),
+        ))
+        self._summary = {"role": "system", "content": ""}
+        self._summarizing: Optional[asyncio.Task] = None
+        self._unsummarized: List[Dict] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, LLMContextFrame):
+            self.trim()
+
+        await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        if self._summarizing is not None:
+            self._summarizing.cancel()
+
+    def trim(self) -> None:
+        """Rewrite the context to the bounded window (cheap; no I/O)."""
+        messages = self._context.get_messages()
+        if not messages:
+            return
+
+        head = [messages[0]] if messages[0].get("role") == "system" else []
+        rest = [m for m in messages[len(head):] if m is not self._summary]
+        turns = split_turns(rest)
+
+        keep = turns[-self._keep_turns:]
+        folded = turns[:-self._keep_turns] if len(turns) > self._keep_turns else []
+        summary = [self._summary] if self._summary["content"] else []
+        while len(keep) > 1 and estimate_tokens(head + summary + [m for t in keep for m in t]) > self._token_budget:
+            folded.append(keep.pop(0))
+
+        summary_placed = not summary or any(m is self._summary for m in messages)
+        if not folded and summary_placed:
+            return
+
+        self._context.set_messages(head + summary + [m for turn in keep for m in turn])
+        self._unsummarized.extend(m for turn in folded for m in turn)
+        if self._summarizing is None or self._summarizing.done():
+            self._summarizing = asyncio.create_task(self._summarize())
+
+    async def _summarize(self) -> None:
+        # Loop so turns folded while a summary was in flight are picked up too
+        while self._unsummarized:
+            batch, self._unsummarized = self._unsummarized, []
+            try:
+                text = await self._update_summary(self._summary["content"], batch)
+            except Exception:
+                # Those turns are already out of the context: put them back so
+                # the next fold retries them, rather than losing them for good
+                logger.exception("Context summarization failed; will retry with the next fold")
+                self._unsummarized[:0] = batch
+                return
+            # The summary dict is shared with the context, so this applies in place
+            self._summary["content"] = SUMMARY_PREFIX + text
+
+    async def _update_summary(self, summary: str, messages: List[Dict]) -> str:
+        max_words = max(50, self._token_budget // 8)
+        exchanges = "\n".join(f"{m.get('role')}: {m.get('content', '')}" for m in messages)
+        summary = summary[len(SUMMARY_PREFIX):] if summary.startswith(SUMMARY_PREFIX) else summary
+
+        api_key = os.getenv("KRUTRIM_API_KEY")
+        if not api_key:
+            # No LLM available: keep a truncated transcript instead
+            words = f"{summary}\n{exchanges}".split()
+            return " ".join(words[-max_words:])
+
+        from src.Tools.interview.llm_clients import get_chat_llm
+
+        llm = get_chat_llm(api_key=api_key, temperature=0.2)
+        result = await llm.ainvoke([
+            ("system", SUMMARY_INSTRUCTION.format(max_words=max_words)),
+            ("user", f"Current summary:\n{summary or '(none yet)'}\n\nNew exchanges:\n{exchanges}"),
+        ])
+        return result.content.strip()
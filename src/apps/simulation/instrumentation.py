@@ -0,0 +1,190 @@
+# src\apps\simulation\instrumentation.py
+"""
+Latency instrumentation for the voice pipeline.
+
+LatencyProbe processors are dropped in at stage boundaries and report what
+they see to one TurnLatencyTracker per session:
+
+    transport.input() -> stt -> [probe "stt"] -> user_aggr -> llm -> [probe "llm"]
+        -> tts -> [probe "tts"] -> transport.output() -> [probe "output"]
+
+The output transport forwards audio frames once they have been written, so
+the "output" probe sees the moment audio actually leaves the bot.
+
+Each turn yields four stage latencies (milliseconds):
+
+    stt_final       end of speech -> final transcription
+    llm_first_token final transcription -> first LLM token
+    tts_first_byte  first LLM token -> first TTS audio
+    first_audio_out first TTS audio -> first audio written by the transport
+
+They are observed into Prometheus histograms (when prometheus_client is
+installed) and collected into a per-session trace, saved to
+InterviewSession.latency_trace when the pipeline ends (run_ai_bot calls
+TurnLatencyTracker.save()).
+"""
+import time
+from typing import Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    LLMTextFrame,
+    OutputAudioRawFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+    VADUserStartedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+try:
+    from prometheus_client import Histogram, start_http_server
+except ImportError:  # metrics are optional; the JSON trace still works
+    Histogram = None
+    start_http_server = None
+
+STAGES = ("stt_final", "llm_first_token", "tts_first_byte", "first_audio_out")
+# (stage, mark it starts from, mark it ends at)
+_INTERVALS = (
+    ("stt_final", "end_of_speech", "transcription"),
+    ("llm_first_token", "transcription", "llm_first_token"),
+    ("tts_first_byte", "llm_first_token", "tts_first_byte"),
+    ("first_audio_out", "tts_first_byte", "audio_out"),
+)
+
+STAGE_LATENCY = None
+if Histogram is not None:
+    STAGE_LATENCY = Histogram(
+        "codevoice_voice_stage_latency_seconds",
+        "Per-turn latency of each voice pipeline stage",
+        ["stage"],
+        buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0),
+    )
+    TURN_LATENCY = Histogram(
+        "codevoice_voice_turn_latency_seconds",
+        "End of candidate speech to first AI audio out",
+        buckets=(0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0),
+    )
+
+_metrics_server_started = False
+
+
+def start_metrics_server(port: int) -> None:
+    """Expose the histograms on http://0.0.0.0:<port>/metrics (once per process)."""
+    global _metrics_server_started
+    if start_http_server is None:
+        logger.warning("prometheus_client is not installed; metrics server not started")
+        return
+    if not _metrics_server_started:
+        start_http_server(port)
+        _metrics_server_started = True
+
+
+class TurnLatencyTracker:
+    """Collects stage timestamps for one session and turns them into per-turn metrics."""
+
+    def __init__(self, session_id: Optional[str] = None):
+        self.session_id = session_id
+        self.trace: List[Dict] = []
+        self._marks: Dict[str, float] = {}
+        self._saved = False
+
+    def mark(self, name: str, first_only: bool = True) -> None:
+        if first_only and name in self._marks:
+            return
+        self._marks[name] = time.perf_counter()
+
+    def has_mark(self, name: str) -> bool:
+        return name in self._marks
+
+    def user_started_speaking(self) -> None:
+        # Barge-in or a new answer: whatever was in flight no longer counts
+        self._marks.clear()
+
+    def end_of_speech(self) -> None:
+        # VAD and the turn analyzer can both report it; the first one wins
+        self.mark("end_of_speech")
+
+    def transcription(self) -> None:
+        # The last final transcript before the LLM starts is the one that counts
+        if "end_of_speech" in self._marks and "llm_first_token" not in self._marks:
+            self.mark("transcription", first_only=False)
+
+    def audio_out(self) -> None:
+        if "audio_out" in self._marks or "end_of_speech" not in self._marks:
+            return
+        self.mark("audio_out")
+        self._finish_turn()
+
+    def _finish_turn(self) -> None:
+        marks = self._marks
+        turn = {"turn": len(self.trace) + 1}
+        for stage, start, end in _INTERVALS:
+            if start in marks and end in marks:
+                turn[stage] = round((marks[end] - marks[start]) * 1000, 1)
+        turn["total"] = round((marks["audio_out"] - marks["end_of_speech"]) * 1000, 1)
+        self.trace.append(turn)
+
+        if STAGE_LATENCY is not None:
+            for stage in STAGES:
+                if stage in turn:
+                    STAGE_LATENCY.labels(stage=stage).observe(turn[stage] / 1000)
+            TURN_LATENCY.observe(turn["total"] / 1000)
+        logger.debug(f"⏱️ Turn latency: {turn}")
+
+    async def save(self) -> None:
+        """Store the trace on the InterviewSession (once, at the end of the pipeline)."""
+        if self._saved or not self.trace:
+            return
+        self._saved = True
+        if not self.session_id:
+            logger.info(f"⏱️ Latency trace ({len(self.trace)} turns): {self.trace}")
+            return
+
+        from apps.interviews.models import InterviewSession
+
+        try:
+            await sync_to_async(
+                InterviewSession.objects.filter(id=self.session_id).update
+            )(latency_trace=self.trace)
+        except Exception:
+            logger.exception(f"Could not save the latency trace for session {self.session_id}")
+
+
+class LatencyProbe(FrameProcessor):
+    """Pass-through processor that timestamps the frames marking a stage boundary."""
+
+    def __init__(self, tracker: TurnLatencyTracker, stage: str, **kwargs):
+        super().__init__(**kwargs)
+        if stage not in ("stt", "llm", "tts", "output"):
+            raise ValueError(f"Unknown latency probe stage: {stage}")
+        self._tracker = tracker
+        self._stage = stage
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        self._observe(frame)
+        await self.push_frame(frame, direction)
+
+    def _observe(self, frame: Frame) -> None:
+        tracker = self._tracker
+        if self._stage == "stt":
+            if isinstance(frame, (UserStartedSpeakingFrame, VADUserStartedSpeakingFrame)):
+                tracker.user_started_speaking()
+            elif isinstance(frame, (UserStoppedSpeakingFrame, VADUserStoppedSpeakingFrame)):
+                tracker.end_of_speech()
+            elif isinstance(frame, TranscriptionFrame):
+                tracker.transcription()
+        elif self._stage == "llm":
+            if isinstance(frame, LLMTextFrame) and tracker.has_mark("transcription"):
+                tracker.mark("llm_first_token")
+        elif self._stage == "tts":
+            if isinstance(frame, TTSAudioRawFrame):
+                tracker.mark("tts_first_byte")
+        elif isinstance(frame, OutputAudioRawFrame):
+            tracker.audio_out()
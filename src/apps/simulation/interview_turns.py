@@ -0,0 +1,114 @@
+# src\apps\simulation\interview_turns.py
+"""
+The interview tools as the pipeline's "LLM" stage.
+
+Instead of letting a free-form LLM run the interview, InterviewTurnProcessor
+hands each finished user turn to TurnOrchestrator: the answer is evaluated
+and persisted, and everything the orchestrator speaks (acknowledgement,
+then the reply sentence by sentence, then the next question) is pushed
+downstream as LLM text, bracketed by LLMFullResponseStart/EndFrame, so TTS
+starts on the first sentence.
+"""
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    LLMContextFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+OPENING_LINE = "Hi, thanks for joining. Let's get started with the first question."
+
+
+class InterviewTurnProcessor(FrameProcessor):
+    """
+    Runs each user turn through TurnOrchestrator.
+
+    In the bot it sits after the user context aggregator, so a turn is the
+    LLMContextFrame emitted once Smart Turn decides the user has finished.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        session_id: str,
+        question: Optional[Dict[str, Any]] = None,
+        difficulty: str = "MEDIUM",
+        topic: str = "",
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.orchestrator = orchestrator
+        self.session_id = session_id
+        self.question = question
+        self.difficulty = difficulty
+        self.topic = topic
+        self.results: List[Dict[str, Any]] = []
+
+    async def start_interview(self) -> str:
+        """Pick the first question and return the opening line that asks it."""
+        self.question = await self.orchestrator.next_question(self.session_id, self.difficulty, self.topic)
+        if "error" in self.question:
+            raise RuntimeError(self.question["error"])
+        return f"{OPENING_LINE} {self.question['text']}"
+
+    def transcript(self, frame: Frame) -> Optional[str]:
+        """The user's answer if this frame ends a user turn, else None."""
+        if not isinstance(frame, LLMContextFrame):
+            return None
+        for message in reversed(frame.context.get_messages()):
+            if message.get("role") != "user":
+                continue
+            content = message.get("content", "")
+            if isinstance(content, list):
+                content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+            return content.strip()
+        return None
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        text = self.transcript(frame) if direction == FrameDirection.DOWNSTREAM else None
+        if text is None:
+            await self.push_frame(frame, direction)
+            return
+        if not text or self.question is None:
+            # Nothing said, or the interview has not started yet
+            return
+
+        await self.push_frame(LLMFullResponseStartFrame())
+        try:
+            await self._run_turn(text)
+        finally:
+            await self.push_frame(LLMFullResponseEndFrame())
+
+    async def _run_turn(self, text: str) -> None:
+        result = await self.orchestrator.run_turn(
+            self.session_id,
+            self.question,
+            text,
+            difficulty=self.difficulty,
+            topic=self.topic,
+            speak=self._speak,
+        )
+        self.results.append(result)
+
+        if result["action"] != "next_question":
+            # The reply was a follow-up on the same question
+            return
+        next_question = result.get("next_question") or await self.orchestrator.next_question(
+            self.session_id, self.difficulty, self.topic
+        )
+        if "error" in next_question:
+            logger.error(f"❌ No next question for session {self.session_id}: {next_question['error']}")
+            return
+        self.question = next_question
+        await self._speak(next_question["text"])
+
+    async def _speak(self, text: str) -> None:
+        await self.push_frame(LLMTextFrame(text))
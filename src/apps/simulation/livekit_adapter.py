@@ -1,29 +1,61 @@
 # src\apps\simulation\livekit_adapter.py
 import asyncio
+import threading
+from collections import deque
+
 import numpy as np
 
 from livekit import rtc
+from loguru import logger
+from pipecat.frames.frames import Frame, UserStartedSpeakingFrame
 from pipecat.processors.audio.audio_input import AudioInput
 from pipecat.processors.audio.audio_output import AudioOutput
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from apps.simulation.audio_buffers import Decimator, FrameChunker, PcmRingBuffer, as_int16
+from apps.simulation.audio_scheduler import OutboundAudioScheduler
+
+SAMPLE_RATE = 16000
+# STT consumes 20 ms chunks; LiveKit gets 10 ms frames
+INPUT_CHUNK_SAMPLES = SAMPLE_RATE // 50
+OUTPUT_CHUNK_SAMPLES = SAMPLE_RATE // 100
+# Two seconds of headroom in each direction
+RING_CAPACITY = SAMPLE_RATE * 2
+# Largest inbound frame accepted: 100 ms at 48 kHz
+MAX_INPUT_FRAME = 4800
 
 
 class LiveKitAudioAdapter:
+    """
+    Bridges LiveKit tracks and the pipecat audio processors.
+
+    Audio moves through preallocated ring buffers (see audio_buffers) in both
+    directions, and the outbound rtc.AudioFrame is reused. The only per-frame
+    allocation is the 20 ms chunk handed to the pipeline, which must own it.
+
+    Outbound audio is paced through a bounded jitter buffer (see
+    audio_scheduler) and never dropped: a producer on another thread blocks
+    until there is room, and audio arriving on the event loop waits in an
+    in-order backlog. Put self.barge_in in the pipeline after the user turn
+    detection so queued AI audio is dropped when the candidate barges in.
+    """
+
     def __init__(self, room: rtc.Room):
         self.room = room
 
         self.audio_input = AudioInput(
-            sample_rate=16000,
+            sample_rate=SAMPLE_RATE,
             channels=1,
         )
 
         self.audio_output = AudioOutput(
             callback=self._send_audio_to_livekit,
-            sample_rate=16000,
+            sample_rate=SAMPLE_RATE,
             channels=1,
         )
 
         self._audio_source = rtc.AudioSource(
-            sample_rate=16000,
+            sample_rate=SAMPLE_RATE,
             channels=1,
         )
 
@@ -32,25 +64,119 @@ class LiveKitAudioAdapter:
             self._audio_source,
         )
 
+        self._inbound = FrameChunker(PcmRingBuffer(RING_CAPACITY), INPUT_CHUNK_SAMPLES)
+        self._decimators = {}
+
+        self._out_frame = rtc.AudioFrame.create(SAMPLE_RATE, 1, OUTPUT_CHUNK_SAMPLES)
+        self._out_samples = np.frombuffer(self._out_frame.data, dtype=np.int16)
+        self.scheduler = OutboundAudioScheduler(
+            self._capture,
+            sample_rate=SAMPLE_RATE,
+            frame_ms=1000 * OUTPUT_CHUNK_SAMPLES // SAMPLE_RATE,
+        )
+        self.barge_in = BargeInProcessor(self)
+        self._loop = None
+        self._loop_thread = None
+        # Audio produced on the event loop, waiting for room in the jitter buffer
+        self._backlog = deque()
+        self._backlog_ready = asyncio.Event()
+        self._feeder = None
+
     async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
         await self.room.local_participant.publish_track(
             self._local_track
         )
+        self.scheduler.start()
+        self._feeder = asyncio.create_task(self._feed())
 
         @self.room.on("track_subscribed")
-        async def on_track(track, publication, participant):
+        def on_track(track, publication, participant):
             if track.kind != rtc.TrackKind.KIND_AUDIO:
                 return
+            asyncio.ensure_future(self._read_track(track))
+
+    async def stop(self):
+        if self._feeder is not None:
+            self._feeder.cancel()
+            await asyncio.gather(self._feeder, return_exceptions=True)
+            self._feeder = None
+        await self.scheduler.stop()
+        logger.info(f"🔈 Outbound audio: {self.scheduler.metrics()}")
+        # Release a producer thread still waiting for room in the buffer
+        self.scheduler.interrupt()
+
+    def interrupt(self) -> int:
+        """Drop queued AI audio when the candidate starts talking; returns ms trimmed."""
+        backlog = sum(len(pcm) for pcm in self._backlog)
+        self._backlog.clear()
+        trimmed = self.scheduler.interrupt() + backlog * 1000 // SAMPLE_RATE
+        if trimmed:
+            logger.debug(f"Barge-in: dropped {trimmed} ms of queued AI audio")
+        return trimmed
 
-            async for frame in track:
-                pcm = np.frombuffer(frame.data, dtype=np.int16)
-                self.audio_input.push(pcm)
+    async def _read_track(self, track: rtc.Track):
+        # Ask LiveKit for 16 kHz mono so it resamples natively
+        stream = rtc.AudioStream(track, sample_rate=SAMPLE_RATE, num_channels=1)
+        async for event in stream:
+            self._receive_frame(event.frame)
+
+    def _receive_frame(self, frame: rtc.AudioFrame):
+        samples = frame.data
+        if frame.sample_rate != SAMPLE_RATE:
+            samples = self._decimator(frame.sample_rate).process(samples)
+
+        self._inbound.ring.write(samples)
+        for chunk in self._inbound.chunks():
+            # The chunker reuses its arrays after 16 chunks (320 ms), and the
+            # pipeline may keep queued audio longer, so hand over a copy
+            self.audio_input.push(chunk.copy())
+
+    def _decimator(self, sample_rate: int) -> Decimator:
+        decimator = self._decimators.get(sample_rate)
+        if decimator is None:
+            if sample_rate % SAMPLE_RATE:
+                raise ValueError(f"Cannot downsample {sample_rate} Hz to {SAMPLE_RATE} Hz")
+            decimator = self._decimators[sample_rate] = Decimator(
+                sample_rate // SAMPLE_RATE, MAX_INPUT_FRAME
+            )
+        return decimator
 
     def _send_audio_to_livekit(self, pcm: np.ndarray):
-        frame = rtc.AudioFrame(
-            data=pcm.tobytes(),
-            sample_rate=16000,
-            channels=1,
-            samples_per_channel=len(pcm),
-        )
-        self._audio_source.capture_frame(frame)
+        # AudioOutput calls this synchronously, so it must not return a coroutine
+        pcm = as_int16(pcm).copy()
+        if self._loop is None or threading.get_ident() == self._loop_thread:
+            # Blocking here would stall the loop that drains the buffer
+            self._backlog.append(pcm)
+            self._backlog_ready.set()
+        else:
+            # Backpressure: the producer thread waits until the audio is queued
+            asyncio.run_coroutine_threadsafe(self.scheduler.put(pcm), self._loop).result()
+
+    async def _feed(self):
+        # Moves backlogged audio into the jitter buffer in order, waiting for room
+        while True:
+            while not self._backlog:
+                self._backlog_ready.clear()
+                await self._backlog_ready.wait()
+            await self.scheduler.put(self._backlog.popleft())
+
+    async def _capture(self, frame: np.ndarray):
+        self._out_samples[:] = frame
+        # capture_frame copies the samples, so the frame can be refilled afterwards
+        await self._audio_source.capture_frame(self._out_frame)
+
+
+class BargeInProcessor(FrameProcessor):
+    """Trims the adapter's queued AI audio as soon as the candidate starts speaking."""
+
+    def __init__(self, adapter: LiveKitAudioAdapter):
+        super().__init__()
+        self._adapter = adapter
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, UserStartedSpeakingFrame):
+            self._adapter.interrupt()
+        await self.push_frame(frame, direction)
@@ -0,0 +1,280 @@
+import asyncio
+import os
+import resource
+import sys
+import time
+import wave
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from pipecat.frames.frames import (
+    EndFrame,
+    InputAudioRawFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+
+from apps.interviews.models import InterviewSession, InterviewTurn, Question, QuestionStats
+from apps.simulation.bench_fakes import (
+    SAMPLE_RATE,
+    FakeChatModel,
+    FakeSTTService,
+    FakeTTSService,
+    ToolTurnProcessor,
+    TurnBarrier,
+)
+from apps.simulation.instrumentation import LatencyProbe, TurnLatencyTracker
+
+# Add project root to path (the interview tools import as src.Tools)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.Tools.interview.llm_clients import set_chat_llm_factory  # noqa: E402
+from src.Tools.interview.session_manager import SessionManagerTool  # noqa: E402
+from src.Tools.interview.turn_orchestrator import TurnOrchestrator  # noqa: E402
+
+# 20 ms of 16 kHz mono audio per input frame
+AUDIO_FRAME_BYTES = SAMPLE_RATE // 50 * 2
+VOICE_STAGES = ("stt_final", "llm_first_token", "tts_first_byte", "first_audio_out", "total")
+# Every answer must reach the (fake) LLM evaluator: no keyword fast path and
+# no cached scores, in-process or in Redis
+EVALUATOR_OVERRIDES = {
+    "EVALUATOR_FAST_PATH": "false",
+    "EVALUATION_CACHE_SIZE": "0",
+    "EVALUATION_CACHE_REDIS_URL": "",
+}
+TOOL_STAGES = ("evaluate", "prefetch", "respond", "evaluate_respond", "first_audio", "total", "persist")
+
+
+class Fixture:
+    """One recorded (or synthesized) candidate answer."""
+
+    def __init__(self, transcript, audio: bytes):
+        self.transcript = transcript
+        self.audio = audio
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Replays candidate answers through the interview tools and a pipecat "
+        "pipeline with local fake STT/LLM/TTS, and reports throughput, "
+        "per-stage latency percentiles and memory per session. The sessions "
+        "it creates are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sessions", type=int, default=20)
+        parser.add_argument("--concurrency", type=int, default=10)
+        parser.add_argument("--turns", type=int, default=5, help="Answers per session")
+        parser.add_argument(
+            "--fixtures",
+            help="Directory of <name>.txt transcripts, each with an optional <name>.wav "
+                 "(16 kHz mono); answers are synthesized from the questions if omitted",
+        )
+        parser.add_argument("--answer-seconds", type=float, default=3.0, help="Audio length of synthesized answers")
+        parser.add_argument("--realtime", action="store_true", help="Feed answer audio at real-time pace")
+        parser.add_argument("--stt-latency-ms", type=float, default=150.0)
+        parser.add_argument("--llm-ttft-ms", type=float, default=300.0)
+        parser.add_argument("--llm-tokens-per-sec", type=float, default=60.0)
+        parser.add_argument("--tts-ttfb-ms", type=float, default=120.0)
+        parser.add_argument("--tts-chars-per-sec", type=float, default=15.0)
+
+    def handle(self, *args, **options):
+        if not Question.objects.exists():
+            self.stderr.write("No questions in the database; add some before benchmarking.")
+            return
+
+        # The tools refuse to run without a key; the fakes never use it
+        os.environ.setdefault("KRUTRIM_API_KEY", "bench-fake-key")
+        # Benchmark sessions are not worth a post-interview report
+        os.environ.setdefault("POST_INTERVIEW_SCORING", "false")
+        saved_env = {key: os.environ.get(key) for key in EVALUATOR_OVERRIDES}
+        os.environ.update(EVALUATOR_OVERRIDES)
+        set_chat_llm_factory(lambda **kwargs: FakeChatModel(
+            ttft_ms=options["llm_ttft_ms"],
+            tokens_per_sec=options["llm_tokens_per_sec"],
+        ))
+        self._session_ids = []
+        try:
+            asyncio.run(self._bench(options))
+        finally:
+            set_chat_llm_factory(None)
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            self._delete_sessions()
+
+    # -------- FIXTURES --------
+
+    def _load_fixtures(self, options):
+        if not options["fixtures"]:
+            return None
+
+        fixtures = []
+        for transcript_path in sorted(Path(options["fixtures"]).glob("*.txt")):
+            wav_path = transcript_path.with_suffix(".wav")
+            audio = self._read_wav(wav_path) if wav_path.exists() else self._silence(options)
+            fixtures.append(Fixture(transcript_path.read_text().strip(), audio))
+        if not fixtures:
+            raise ValueError(f"No *.txt transcripts in {options['fixtures']}")
+        return fixtures
+
+    @staticmethod
+    def _read_wav(path):
+        with wave.open(str(path), "rb") as wav:
+            if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                raise ValueError(f"{path} must be 16 kHz mono 16-bit PCM")
+            return wav.readframes(wav.getnframes())
+
+    @staticmethod
+    def _silence(options):
+        return bytes(int(SAMPLE_RATE * options["answer_seconds"]) * 2)
+
+    @staticmethod
+    def _synthesize(question, turn):
+        # Rotate strong, partial and weak answers (all scored by the LLM evaluator)
+        points = [line.strip("-*• ") for line in question.get("expected_points", "").splitlines() if line.strip()]
+        if turn % 3 == 0:
+            return " ".join(points) or "I would start by describing the basic idea."
+        if turn % 3 == 1:
+            return " ".join(points[: max(1, len(points) // 2)]) + " and I think that is mostly it."
+        return "I'm honestly not sure, I haven't worked with that before."
+
+    # -------- RUNNING --------
+
+    async def _bench(self, options):
+        fixtures = self._load_fixtures(options)
+        slots = asyncio.Semaphore(options["concurrency"])
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        async def limited(index):
+            async with slots:
+                return await self._run_session(index, fixtures, options)
+
+        started = time.perf_counter()
+        sessions = await asyncio.gather(*(limited(i) for i in range(options["sessions"])))
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        self._report(sessions, elapsed, rss_after - rss_before, options)
+
+    async def _run_session(self, index, fixtures, options):
+        session_manager = SessionManagerTool()
+        orchestrator = TurnOrchestrator(session_manager=session_manager)
+
+        session = await session_manager._aexecute(action="create")
+        if "error" in session:
+            raise RuntimeError(session["error"])
+        session_id = session["session_id"]
+        self._session_ids.append(session_id)
+        question = await orchestrator.next_question(session_id)
+
+        tracker = TurnLatencyTracker()
+        stt = FakeSTTService(latency_ms=options["stt_latency_ms"])
+        tools = ToolTurnProcessor(orchestrator, session_id, question)
+        barrier = TurnBarrier()
+        pipeline = Pipeline([
+            stt,
+            LatencyProbe(tracker, "stt"),
+            tools,
+            LatencyProbe(tracker, "llm"),
+            FakeTTSService(ttfb_ms=options["tts_ttfb_ms"], chars_per_sec=options["tts_chars_per_sec"]),
+            LatencyProbe(tracker, "tts"),
+            LatencyProbe(tracker, "output"),
+            barrier,
+        ])
+        task = PipelineTask(pipeline)
+        runner = asyncio.create_task(PipelineRunner(handle_sigint=False).run(task))
+
+        for turn in range(options["turns"]):
+            if fixtures:
+                fixture = fixtures[(index + turn) % len(fixtures)]
+            else:
+                fixture = Fixture(self._synthesize(tools.question, turn), self._silence(options))
+
+            stt.expect(fixture.transcript)
+            barrier.reset()
+            await task.queue_frame(UserStartedSpeakingFrame())
+            await self._feed_audio(task, fixture.audio, options["realtime"])
+            await task.queue_frame(UserStoppedSpeakingFrame())
+            await barrier.wait(timeout=60)
+
+        await task.queue_frame(EndFrame())
+        await runner
+        await orchestrator.drain()
+        await session_manager._aexecute(action="complete", session_id=session_id)
+
+        return {
+            "voice": tracker.trace,
+            "tools": [result["timings"] for result in tools.results],
+        }
+
+    @staticmethod
+    async def _feed_audio(task, audio, realtime):
+        for offset in range(0, len(audio), AUDIO_FRAME_BYTES):
+            await task.queue_frame(InputAudioRawFrame(
+                audio=audio[offset:offset + AUDIO_FRAME_BYTES],
+                sample_rate=SAMPLE_RATE,
+                num_channels=1,
+            ))
+            if realtime:
+                await asyncio.sleep(0.02)
+
+    # -------- CLEANUP --------
+
+    def _delete_sessions(self):
+        if not self._session_ids:
+            return
+        # Take the benchmark's turns back out of the question stats before deleting them
+        turns = InterviewTurn.objects.filter(session_id__in=self._session_ids).values_list(
+            "question_id", "score", "user_transcript"
+        )
+        totals = QuestionStats.tally(turns)
+        with transaction.atomic():
+            QuestionStats.add_turns({
+                question_id: tuple(-value for value in total) for question_id, total in totals.items()
+            })
+            deleted, _ = InterviewSession.objects.filter(id__in=self._session_ids).delete()
+        self.stdout.write(f"🧹 Deleted {len(self._session_ids)} benchmark sessions ({deleted} rows)")
+
+    # -------- REPORTING --------
+
+    def _report(self, sessions, elapsed, rss_growth_kb, options):
+        turns = sum(len(session["tools"]) for session in sessions)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n📊 {len(sessions)} sessions x {options['turns']} turns "
+            f"at concurrency {options['concurrency']}\n"
+        ))
+        self.stdout.write(f"Throughput: {turns / elapsed:.2f} turns/sec ({turns} turns in {elapsed:.1f}s)")
+        self.stdout.write(
+            f"Memory:     {rss_growth_kb / 1024 / max(1, options['concurrency']):.2f} MiB "
+            f"peak RSS growth per concurrent session"
+        )
+
+        self.stdout.write(f"\n{'stage (ms)':<28}{'p50':>10}{'p95':>10}{'p99':>10}{'n':>8}")
+        for group, stages in (("voice", VOICE_STAGES), ("tools", TOOL_STAGES)):
+            for stage in stages:
+                values = [
+                    turn[stage] for session in sessions for turn in session[group] if stage in turn
+                ]
+                if not values:
+                    continue
+                self.stdout.write(
+                    f"{group + '.' + stage:<28}"
+                    f"{percentile(values, 50):>10.1f}{percentile(values, 95):>10.1f}"
+                    f"{percentile(values, 99):>10.1f}{len(values):>8}"
+                )
@@ -5,9 +5,12 @@ from livekit import api
 class Command(BaseCommand):
     help = 'Generates a token for a HUMAN user to join the interview room.'
 
+    def add_arguments(self, parser):
+        parser.add_argument("--room", default="interview-room-1", help="Must match the Bot's room")
+
     def handle(self, *args, **options):
         # 1. Config
-        ROOM_NAME = "interview-room-1"  # Must match the Bot's room
+        ROOM_NAME = options["room"]  # Must match the Bot's room
         USER_IDENTITY = "human-candidate"
         
         # 2. Create Token
@@ -1,34 +1,52 @@
 import asyncio
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from livekit import api
 from apps.simulation.bot import run_ai_bot
+from apps.simulation.instrumentation import start_metrics_server
+from apps.simulation.worker import BotWorker, bot_token
 
 
 
 class Command(BaseCommand):
     help = "Starts the CodeVoice AI (LiveKit)"
 
+    def add_arguments(self, parser):
+        parser.add_argument("--room", default="interview-room-1", help="Room to join (single-room mode)")
+        parser.add_argument(
+            "--worker", action="store_true",
+            help="Host many rooms, taking assignments from the bot queue",
+        )
+        parser.add_argument(
+            "--max-rooms", type=int, default=settings.BOT_MAX_ROOMS,
+            help="Concurrent rooms in worker mode",
+        )
+        parser.add_argument(
+            "--metrics-port", type=int, default=None,
+            help="Serve Prometheus latency metrics on this port",
+        )
+        parser.add_argument("--session-id", default=None, help="InterviewSession to store the latency trace on")
+
     def handle(self, *args, **options):
-        ROOM_NAME = "interview-room-1"
-        BOT_ID = "ai-interviewer"
-
-        token = api.AccessToken(
-            settings.LIVEKIT_API_KEY,
-            settings.LIVEKIT_API_SECRET,
-        ).with_identity(BOT_ID) \
-         .with_name("AI Interviewer") \
-         .with_grants(api.VideoGrants(
-            room_join=True,
-            room=ROOM_NAME,
-         )).to_jwt()
+        if options["metrics_port"]:
+            start_metrics_server(options["metrics_port"])
+
+        if options["worker"]:
+            self.stdout.write(self.style.SUCCESS(f"🚀 LiveKit AI worker starting ({options['max_rooms']} rooms)"))
+            try:
+                asyncio.run(BotWorker(options["max_rooms"]).run())
+            except KeyboardInterrupt:
+                self.stdout.write("👋 Worker stopped")
+            return
+
+        ROOM_NAME = options["room"]
 
         self.stdout.write(self.style.SUCCESS("🚀 LiveKit AI starting"))
 
         asyncio.run(
             run_ai_bot(
                 settings.LIVEKIT_API_URL,
-                token,
+                bot_token(ROOM_NAME),
                 ROOM_NAME,
+                session_id=options["session_id"],
             )
         )
@@ -0,0 +1,39 @@
+# src\apps\simulation\room_queue.py
+"""
+Redis side of the bot workers' room assignments (see apps.simulation.worker).
+
+Only redis and settings are imported here, so Django views can queue rooms
+without loading the voice pipeline (pipecat, livekit, the turn model).
+"""
+import json
+from typing import Optional
+
+import redis
+from django.conf import settings
+
+ROOM_QUEUE_KEY = "codevoice:bot:rooms"
+CONTROL_CHANNEL = "codevoice:bot:control"
+ACTIVE_ROOMS_KEY = "codevoice:bot:active"
+
+
+def request_room(room_name: str, action: str = "start", session_id: Optional[str] = None) -> None:
+    """
+    Queue a start/stop assignment for the bot workers (sync, for Django views).
+
+    A start may carry the InterviewSession the room belongs to, so the bot
+    stores its latency trace on it.
+    """
+    client = redis.Redis.from_url(settings.BOT_QUEUE_URL)
+    message = {"action": action, "room": room_name}
+    if session_id:
+        message["session_id"] = session_id
+    if action == "stop":
+        client.publish(CONTROL_CHANNEL, json.dumps(message))
+    else:
+        client.rpush(ROOM_QUEUE_KEY, json.dumps(message))
+
+
+def active_rooms() -> list:
+    """Rooms currently hosted by any bot worker."""
+    client = redis.Redis.from_url(settings.BOT_QUEUE_URL)
+    return sorted(room.decode() for room in client.smembers(ACTIVE_ROOMS_KEY))
@@ -0,0 +1,184 @@
+# src\apps\simulation\turn_analyzer.py
+"""
+Process-wide Smart Turn inference shared by every interview in a worker.
+
+LocalSmartTurnAnalyzerV3 loads its ONNX model per instance. Each pipeline
+still needs its own analyzer (it buffers that room's audio), so
+SharedSmartTurnAnalyzer keeps the per-room buffering from BaseSmartTurn but
+sends inference to one model that is loaded once per process.
+
+Requests from concurrent rooms are micro-batched: the first request opens a
+window of SMART_TURN_BATCH_WINDOW_MS, and everything that arrives within it
+(up to SMART_TURN_MAX_BATCH) runs through the model as one batch.
+
+Batching calls into LocalSmartTurnAnalyzerV3 internals (_feature_extractor,
+_session, _predict_endpoint), which is why pipecat-ai is pinned. If they are
+missing, create_turn_analyzer() hands out the stock per-room analyzer.
+"""
+import os
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+
+SAMPLE_RATE = 16000
+# Smart Turn v3 looks at the last 8 seconds of audio
+MAX_SECONDS = 8
+
+# LocalSmartTurnAnalyzerV3 internals the batcher relies on
+SHARED_INFERENCE_ATTRS = ("_feature_extractor", "_session", "_predict_endpoint")
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_turn_model() -> LocalSmartTurnAnalyzerV3:
+    """
+    Get the process-wide Smart Turn model, loading it on first use.
+
+    Returns:
+        LocalSmartTurnAnalyzerV3 used only for its inference session
+    """
+    global _model
+
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                logger.info("🧠 Loading Smart Turn model (shared)")
+                _model = LocalSmartTurnAnalyzerV3()
+
+    return _model
+
+
+def supports_shared_inference(model: Any) -> bool:
+    """Whether this pipecat's Smart Turn model exposes what the batcher uses."""
+    return all(hasattr(model, attr) for attr in SHARED_INFERENCE_ATTRS)
+
+
+class TurnInferenceBatcher:
+    """Collects end-of-turn requests from many rooms and runs them in batches."""
+
+    def __init__(self, window_ms: float, max_batch: int):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._requests: "queue.Queue[Tuple[np.ndarray, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="smart-turn-batcher", daemon=True)
+        self._thread.start()
+
+    def predict(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        """Queue one room's audio and wait for its prediction (blocking)."""
+        future: Future = Future()
+        self._requests.put((audio_array, future))
+        return future.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._requests.get()]
+            # Other rooms can join for one window, counted from the first request
+            deadline = time.monotonic() + self.window
+            try:
+                while len(batch) < self.max_batch:
+                    batch.append(self._requests.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                pass
+
+            try:
+                results = self._infer([audio for audio, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    @staticmethod
+    def _features(model: LocalSmartTurnAnalyzerV3, audio_array: np.ndarray) -> np.ndarray:
+        audio_array = audio_array[-MAX_SECONDS * SAMPLE_RATE:]
+        inputs = model._feature_extractor(
+            audio_array,
+            sampling_rate=SAMPLE_RATE,
+            return_tensors="np",
+            padding="max_length",
+            max_length=MAX_SECONDS * SAMPLE_RATE,
+            truncation=True,
+            do_normalize=True,
+        )
+        return inputs.input_features.squeeze(0).astype(np.float32)
+
+    def _infer(self, audio_arrays: List[np.ndarray]) -> List[Dict[str, Any]]:
+        model = get_turn_model()
+        if len(audio_arrays) == 1:
+            return [model._predict_endpoint(audio_arrays[0])]
+
+        try:
+            features = np.stack([self._features(model, audio) for audio in audio_arrays])
+            outputs = model._session.run(None, {"input_features": features})
+            probabilities = np.asarray(outputs[0]).reshape(len(audio_arrays), -1)[:, 0]
+        except Exception:
+            # e.g. a model exported with a fixed batch size of 1
+            logger.opt(exception=True).debug("Batched Smart Turn inference failed; running one by one")
+            return [model._predict_endpoint(audio) for audio in audio_arrays]
+
+        return [
+            {"prediction": 1 if probability > 0.5 else 0, "probability": float(probability)}
+            for probability in probabilities
+        ]
+
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_turn_batcher() -> TurnInferenceBatcher:
+    """
+    Get the process-wide Smart Turn batcher.
+
+    Returns:
+        TurnInferenceBatcher instance
+    """
+    global _batcher
+
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                _batcher = TurnInferenceBatcher(
+                    window_ms=float(os.getenv("SMART_TURN_BATCH_WINDOW_MS", "10")),
+                    max_batch=int(os.getenv("SMART_TURN_MAX_BATCH", "16")),
+                )
+
+    return _batcher
+
+
+class SharedSmartTurnAnalyzer(BaseSmartTurn):
+    """Per-room turn analyzer backed by the shared, batched Smart Turn model."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Load eagerly so the first candidate turn does not pay for it
+        get_turn_model()
+
+    def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        # Called from BaseSmartTurn's executor thread, so blocking here is fine
+        return get_turn_batcher().predict(audio_array)
+
+
+def create_turn_analyzer(**kwargs) -> BaseSmartTurn:
+    """
+    Build the turn analyzer for one room.
+
+    Returns:
+        SharedSmartTurnAnalyzer, or a stock LocalSmartTurnAnalyzerV3 when the
+        installed pipecat does not have the internals batching needs
+    """
+    if supports_shared_inference(get_turn_model()):
+        return SharedSmartTurnAnalyzer(**kwargs)
+
+    logger.warning("⚠️ Smart Turn internals changed in this pipecat version; using per-room analyzers")
+    return LocalSmartTurnAnalyzerV3(**kwargs)
@@ -0,0 +1,41 @@
+# src\apps\simulation\views.py
+import json
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+# Redis only: the web process never imports the voice pipeline
+from apps.simulation.room_queue import active_rooms, request_room
+
+
+@staff_member_required
+def bot_rooms(request):
+    """
+    Admin API for the bot workers.
+
+    GET lists the rooms being hosted. POST {"room": "...", "action": "start" | "stop"}
+    assigns a room to the next free worker, or stops it wherever it runs; a
+    start may add "session_id" to store the room's latency trace on.
+
+    Authenticated by the staff session cookie, so POSTs must carry the CSRF
+    token (X-CSRFToken header) like any other form on the site.
+    """
+    if request.method == "GET":
+        return JsonResponse({"rooms": active_rooms()})
+
+    if request.method != "POST":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+
+    try:
+        payload = json.loads(request.body or b"{}")
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    room_name = str(payload.get("room", "")).strip()
+    action = payload.get("action", "start")
+    if not room_name or action not in ("start", "stop"):
+        return JsonResponse({"error": "Expected a room and action 'start' or 'stop'"}, status=400)
+
+    session_id = str(payload.get("session_id") or "").strip() or None
+    request_room(room_name, action, session_id=session_id)
+    return JsonResponse({"room": room_name, "action": action, "status": "queued"}, status=202)
@@ -0,0 +1,158 @@
+# src\apps\simulation\worker.py
+"""
+Multi-room bot worker: hosts many interviews in one process.
+
+Room assignments are pushed by the admin API (apps.simulation.views) or any
+other producer via apps.simulation.room_queue.request_room():
+
+- "start" goes on a Redis list (ROOM_QUEUE_KEY). Workers only pop from it while
+  they have a free slot, so with several workers the rooms spread across them.
+- "stop" is published on CONTROL_CHANNEL, so it reaches whichever worker
+  hosts the room.
+
+Each room runs run_ai_bot as a task in the worker's event loop, at most
+max_rooms at a time; a start that names a session_id gets its latency trace
+stored on that InterviewSession. Hosted rooms are mirrored in the
+ACTIVE_ROOMS_KEY set so the admin API can list them.
+"""
+import json
+import asyncio
+from typing import Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+from django.conf import settings
+from livekit import api
+from loguru import logger
+
+from apps.simulation.bot import run_ai_bot
+from apps.simulation.room_queue import ACTIVE_ROOMS_KEY, CONTROL_CHANNEL, ROOM_QUEUE_KEY
+from apps.simulation.turn_analyzer import get_turn_model
+
+BOT_ID = "ai-interviewer"
+
+
+def bot_token(room_name: str) -> str:
+    """LiveKit access token for the AI interviewer in a room."""
+    return api.AccessToken(
+        settings.LIVEKIT_API_KEY,
+        settings.LIVEKIT_API_SECRET,
+    ).with_identity(BOT_ID) \
+     .with_name("AI Interviewer") \
+     .with_grants(api.VideoGrants(
+        room_join=True,
+        room=room_name,
+     )).to_jwt()
+
+
+class BotWorker:
+    """Runs up to max_rooms interview pipelines concurrently in one event loop."""
+
+    def __init__(self, max_rooms: int, queue_url: Optional[str] = None):
+        self.max_rooms = max_rooms
+        self.queue_url = queue_url or settings.BOT_QUEUE_URL
+        self._slots = asyncio.Semaphore(max_rooms)
+        self._rooms: Dict[str, asyncio.Task] = {}
+        self._redis = None
+
+    async def run(self) -> None:
+        """Consume room assignments until cancelled, then stop every room."""
+        self._redis = aioredis.Redis.from_url(self.queue_url)
+        # Load the shared models before the first room needs them
+        await asyncio.to_thread(get_turn_model)
+        logger.success(f"🚀 Bot worker ready (max {self.max_rooms} rooms)")
+
+        control = asyncio.create_task(self._listen_for_stops())
+        try:
+            while True:
+                # Only take an assignment when it can start right away
+                await self._slots.acquire()
+                item = None
+                try:
+                    item = await self._redis.blpop(ROOM_QUEUE_KEY, timeout=5)
+                finally:
+                    if item is None:
+                        self._slots.release()
+                if item is None:
+                    continue
+
+                room_name, session_id = self._parse(item[1])
+                if room_name is None or room_name in self._rooms:
+                    self._slots.release()
+                    continue
+                await self._start_room(room_name, session_id)
+        finally:
+            control.cancel()
+            await asyncio.gather(control, return_exceptions=True)
+            await self.shutdown()
+
+    @staticmethod
+    def _parse(raw) -> Tuple[Optional[str], Optional[str]]:
+        """(room, session_id or None) of an assignment; room is None if malformed."""
+        try:
+            message = json.loads(raw)
+            return message["room"], message.get("session_id")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning(f"Ignoring malformed room assignment: {raw!r}")
+            return None, None
+
+    async def _listen_for_stops(self) -> None:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(CONTROL_CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                room_name, _ = self._parse(message["data"])
+                if room_name is not None:
+                    await self.stop_room(room_name)
+        finally:
+            await pubsub.aclose()
+
+    async def _start_room(self, room_name: str, session_id: Optional[str] = None) -> None:
+        """Start hosting a room; the caller holds a slot for it."""
+        task = asyncio.create_task(self._host(room_name, session_id), name=f"room:{room_name}")
+        self._rooms[room_name] = task
+        await self._redis.sadd(ACTIVE_ROOMS_KEY, room_name)
+        logger.info(f"Room started: {room_name} ({len(self._rooms)} active)")
+
+    async def stop_room(self, room_name: str) -> None:
+        """Stop hosting a room and wait for its pipeline to shut down."""
+        task = self._rooms.get(room_name)
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Stop every room and close the queue connection."""
+        rooms = list(self._rooms)
+        if rooms:
+            logger.info(f"🛑 Stopping {len(rooms)} rooms")
+        await asyncio.gather(*(self.stop_room(room) for room in rooms), return_exceptions=True)
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _host(self, room_name: str, session_id: Optional[str] = None) -> None:
+        try:
+            await run_ai_bot(
+                settings.LIVEKIT_API_URL,
+                bot_token(room_name),
+                room_name,
+                handle_sigint=False,
+                session_id=session_id,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # One failing room must not take the others down
+            logger.exception(f"Room crashed: {room_name}")
+        finally:
+            self._rooms.pop(room_name, None)
+            self._slots.release()
+            if self._redis is not None:
+                try:
+                    await self._redis.srem(ACTIVE_ROOMS_KEY, room_name)
+                except Exception:
+                    logger.warning(f"Could not unregister room: {room_name}")
+            logger.info(f"Room finished: {room_name} ({len(self._rooms)} active)")
@@ -0,0 +1,20 @@
+"""
+CELERY APPLICATION FOR CODEVOICE
+RUNS SLOW WORK (POST-INTERVIEW SCORING, REPORTS) OFF THE LIVE CALL
+
+Start a worker from the src/ directory (add more workers to scale out):
+    celery -A config worker -l info
+"""
+
+import os
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('codevoice')
+
+# Every CELERY_* entry in settings.py configures the app
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Picks up tasks.py in every installed app
+app.autodiscover_tasks()
@@ -4,6 +4,7 @@ Django settings for CodeVoice project.
 
 from pathlib import Path
 import os
+from celery.schedules import crontab
 import environ # This comes from 'django-environ' in your requirements.txt
 
 # --- 1. SETUP ENV READER ---
@@ -145,10 +146,33 @@ LIVEKIT_API_URL = env('LIVEKIT_URL', default='ws://localhost:7880')
 LIVEKIT_API_KEY = env('LIVEKIT_API_KEY')
 LIVEKIT_API_SECRET = env('LIVEKIT_API_SECRET')
 
+# Bot workers (one process hosts up to BOT_MAX_ROOMS interviews)
+BOT_MAX_ROOMS = env.int('BOT_MAX_ROOMS', default=20)
+BOT_QUEUE_URL = env('REDIS_URL', default='redis://localhost:6379/0')
+
 # AI Services
 KRUTRIM_API_KEY = env('KRUTRIM_API_KEY', default='')
 DEEPGRAM_API_KEY = env('DEEPGRAM_API_KEY', default='')
 
 # Celery (Async Tasks)
 CELERY_BROKER_URL = env('REDIS_URL', default='redis://localhost:6379/0')
-CELERY_RESULT_BACKEND = env('REDIS_URL', default='redis://localhost:6379/0')
\ No newline at end of file
+CELERY_RESULT_BACKEND = env('REDIS_URL', default='redis://localhost:6379/0')
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+# Scoring tasks are long LLM calls: take one at a time, and only ack once done
+# so a crashed worker's turns are picked up again by another worker
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+CELERY_RESULT_EXPIRES = 60 * 60 * 24
+# Periodic jobs, run by: celery -A config beat
+CELERY_BEAT_SCHEDULE = {
+    'calibrate-question-difficulty': {
+        'task': 'interviews.calibrate_difficulty',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    'recompute-question-stats': {
+        'task': 'interviews.recompute_question_stats',
+        'schedule': crontab(hour=3, minute=30),
+    },
+}
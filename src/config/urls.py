@@ -10,6 +10,8 @@ from django.contrib import admin
 from django.urls import path
 from django.shortcuts import render
 
+from apps.simulation.views import bot_rooms
+
 # Simple view function to render the HTML
 def test_view(request):
     return render(request, 'test_room.html')
@@ -17,4 +19,5 @@ def test_view(request):
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('test/', test_view),  # <--- New Route
+    path('bots/rooms/', bot_rooms),  # Assign rooms to the bot workers
 ]
\ No newline at end of file
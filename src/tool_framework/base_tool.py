@@ -1,7 +1,10 @@
 # src/tool_framework/base_tool.py
 import os
+import asyncio
+import threading
 from abc import abstractmethod, ABC
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, partial
 from inspect import signature
 from typing import Type, Callable, Any, Union, Dict, Tuple, Optional
 from pydantic import BaseModel, create_model, validate_arguments, Extra
@@ -47,6 +50,26 @@ def get_config(key, default=None):
     return os.getenv(key, default)
 
 
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """
+    Shared, bounded thread pool used to run synchronous tool logic off the event loop.
+    Its size comes from TOOL_THREAD_POOL_SIZE (default 8).
+    """
+    global _tool_executor
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                _tool_executor = ThreadPoolExecutor(
+                    max_workers=int(get_config("TOOL_THREAD_POOL_SIZE", 8)),
+                    thread_name_prefix="tool-worker",
+                )
+    return _tool_executor
+
+
 class BaseTool(BaseModel, ABC):
     """Abstract Base Class for all Tools."""
     name: str
@@ -85,6 +108,17 @@ class BaseTool(BaseModel, ABC):
         """
         pass
 
+    async def _aexecute(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Async version of _execute. Subclasses with native async I/O should override it;
+        the default runs the synchronous _execute in the shared tool thread pool so
+        it never blocks the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_tool_executor(), partial(self._execute, *args, **kwargs)
+        )
+
     def _to_args_and_kwargs(self, tool_input: Union[str, Dict]) -> Tuple[Tuple, Dict]:
         """Helper to parse input into positional and keyword arguments."""
         if isinstance(tool_input, str):
@@ -105,6 +139,17 @@ class BaseTool(BaseModel, ABC):
         except Exception as e:
             # Proper error handling is important for agent stability
             return f"Error in tool '{self.name}': {e}"
+
+    async def aexecute(self, tool_input: Union[str, Dict], **kwargs: Any) -> Any:
+        """
+        Async counterpart of execute, for callers running inside an event loop.
+        """
+        try:
+            tool_args, tool_kwargs = self._to_args_and_kwargs(tool_input)
+            all_kwargs = {**tool_kwargs, **kwargs}
+            return await self._aexecute(*tool_args, **all_kwargs)
+        except Exception as e:
+            return f"Error in tool '{self.name}': {e}"
             
     def get_tool_config(self, key: str) -> Optional[str]:
         """Convenience method to get a configuration value for this tool."""
@@ -0,0 +1,47 @@
+# tests/test_answer_prescorer.py
+import pytest
+
+from src.Tools.interview.answer_prescorer import is_non_answer, local_evaluation, prescore
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "Um... I don't know.",
+    "I have no idea, sorry",
+    "Sorry, no idea, pass",
+    "Honestly I can’t remember",
+    "next question",
+    "idk",
+])
+def test_non_answers(text):
+    assert is_non_answer(text)
+
+
+@pytest.mark.parametrize("text", [
+    "C",
+    "Go",
+    "O(1)",
+    "No.",
+    "Yes",
+    "pass by reference",
+    "TCP isn't reliable",
+    "I don't know the exact name, but it's a hash map",
+])
+def test_short_or_partial_answers_go_to_the_llm(text):
+    assert not is_non_answer(text)
+    assert prescore(text) is None
+
+
+def test_prescore_scores_non_answers_zero():
+    result = prescore("I don't know")
+    assert result["score"] == 0
+    assert result["feedback"]
+
+
+def test_local_evaluation_is_tagged_and_switchable(monkeypatch):
+    assert local_evaluation("pass")["source"] == "fast_path"
+    assert local_evaluation("O(n log n)") is None
+
+    monkeypatch.setenv("EVALUATOR_FAST_PATH", "false")
+    assert local_evaluation("pass") is None
@@ -0,0 +1,99 @@
+# tests/test_audio_buffers.py
+import numpy as np
+import pytest
+
+from apps.simulation.audio_buffers import Decimator, FrameChunker, PcmRingBuffer, as_int16
+
+
+def samples(start, count):
+    return np.arange(start, start + count, dtype=np.int16)
+
+
+def test_as_int16_views_bytes():
+    data = samples(0, 4)
+    assert np.array_equal(as_int16(data.tobytes()), data)
+
+
+def test_ring_buffer_reads_in_order_across_wraparound():
+    ring = PcmRingBuffer(8)
+    out = np.zeros(8, dtype=np.int16)
+
+    ring.write(samples(0, 6))
+    assert ring.read_into(out[:4]) == 4
+    ring.write(samples(6, 5))  # wraps around the end of the storage
+
+    assert ring.available == 7
+    assert ring.read_into(out) == 7
+    assert np.array_equal(out[:7], samples(4, 7))
+    assert ring.dropped == 0
+
+
+def test_ring_buffer_drops_oldest_on_overflow():
+    ring = PcmRingBuffer(8)
+    out = np.zeros(8, dtype=np.int16)
+
+    ring.write(samples(0, 6))
+    ring.write(samples(6, 5))
+
+    assert ring.dropped == 3
+    assert ring.read_into(out) == 8
+    assert np.array_equal(out, samples(3, 8))
+
+
+def test_ring_buffer_keeps_newest_of_an_oversized_write():
+    ring = PcmRingBuffer(4)
+    out = np.zeros(4, dtype=np.int16)
+
+    ring.write(samples(0, 2))
+    ring.write(samples(2, 10))
+
+    assert ring.dropped == 8
+    ring.read_into(out)
+    assert np.array_equal(out, samples(8, 4))
+
+
+def test_ring_buffer_clear():
+    ring = PcmRingBuffer(8)
+    ring.write(samples(0, 5))
+    assert ring.clear() == 5
+    assert ring.available == 0
+
+
+def test_decimator_averages_groups():
+    decimator = Decimator(3, max_input=12)
+    out = decimator.process(np.array([0, 3, 6, 9, 9, 9, -3, -3, -3], dtype=np.int16))
+    assert out.tolist() == [3, 9, -3]
+
+
+def test_decimator_ratio_one_is_passthrough():
+    data = samples(0, 5)
+    assert Decimator(1, max_input=5).process(data) is data
+
+
+def test_decimator_rejects_oversized_frames():
+    with pytest.raises(ValueError):
+        Decimator(2, max_input=4).process(samples(0, 6))
+    with pytest.raises(ValueError):
+        Decimator(0, max_input=4)
+
+
+def test_frame_chunker_yields_only_complete_chunks():
+    ring = PcmRingBuffer(64)
+    chunker = FrameChunker(ring, chunk_samples=4, pool_size=2)
+
+    ring.write(samples(0, 10))
+    chunks = [chunk.copy() for chunk in chunker.chunks()]
+
+    assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert ring.available == 2
+
+
+def test_frame_chunker_reuses_its_pool():
+    ring = PcmRingBuffer(64)
+    chunker = FrameChunker(ring, chunk_samples=4, pool_size=2)
+
+    ring.write(samples(0, 12))
+    chunks = list(chunker.chunks())
+
+    assert chunks[0] is chunks[2]
+    assert chunks[0] is not chunks[1]
@@ -0,0 +1,111 @@
+# tests/test_audio_scheduler.py
+import asyncio
+import threading
+
+import numpy as np
+
+from apps.simulation.audio_scheduler import OutboundAudioScheduler
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 160  # 10 ms
+
+
+def make_scheduler(sent, max_buffer_ms=50, jitter_ms=20):
+    async def sink(frame):
+        sent.append(frame.copy())
+
+    return OutboundAudioScheduler(
+        sink, sample_rate=SAMPLE_RATE, frame_ms=10, jitter_ms=jitter_ms, max_buffer_ms=max_buffer_ms
+    )
+
+
+async def wait_for_frames(sent, count, timeout=5.0):
+    async def poll():
+        while len(sent) < count:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_put_waits_for_room_instead_of_dropping():
+    # 300 ms of audio through a 50 ms buffer
+    audio = (np.arange(FRAME_SAMPLES * 30) % 30000).astype(np.int16)
+    sent = []
+
+    async def main():
+        scheduler = make_scheduler(sent)
+        scheduler.start()
+        await scheduler.put(audio)
+        await wait_for_frames(sent, 30)
+        await scheduler.stop()
+        return scheduler.metrics()
+
+    metrics = asyncio.run(main())
+
+    assert np.array_equal(np.concatenate(sent), audio)
+    assert metrics["overflow_ms"] == 0
+    assert metrics["max_depth_ms"] <= 50
+    assert metrics["frames_sent"] == 30
+
+
+def test_producer_thread_gets_backpressure():
+    # The LiveKit adapter's path: a non-loop thread blocks on run_coroutine_threadsafe
+    chunks = [np.full(FRAME_SAMPLES * 4, i, dtype=np.int16) for i in range(10)]
+    sent = []
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        scheduler = make_scheduler(sent)
+        scheduler.start()
+
+        def produce():
+            for chunk in chunks:
+                asyncio.run_coroutine_threadsafe(scheduler.put(chunk), loop).result()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        await wait_for_frames(sent, 40)
+        await asyncio.to_thread(producer.join)
+        await scheduler.stop()
+        return scheduler.metrics()
+
+    metrics = asyncio.run(main())
+
+    assert np.array_equal(np.concatenate(sent), np.concatenate(chunks))
+    assert metrics["overflow_ms"] == 0
+
+
+def test_short_tail_is_padded_and_flushed():
+    sent = []
+
+    async def main():
+        scheduler = make_scheduler(sent)
+        scheduler.start()
+        await scheduler.put(np.ones(FRAME_SAMPLES + 40, dtype=np.int16))
+        await wait_for_frames(sent, 2)
+        await scheduler.stop()
+
+    asyncio.run(main())
+
+    assert sent[1][:40].tolist() == [1] * 40
+    assert not sent[1][40:].any()
+
+
+def test_interrupt_drops_audio_and_releases_blocked_put():
+    async def main():
+        scheduler = make_scheduler([])  # never started, so nothing drains
+        await scheduler.put(np.ones(FRAME_SAMPLES * 5, dtype=np.int16))
+
+        blocked = asyncio.create_task(scheduler.put(np.ones(FRAME_SAMPLES, dtype=np.int16)))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        trimmed_ms = scheduler.interrupt()
+        await asyncio.wait_for(blocked, 1.0)
+        return trimmed_ms, scheduler.metrics()
+
+    trimmed_ms, metrics = asyncio.run(main())
+
+    assert trimmed_ms == 50
+    assert metrics["trimmed_ms"] == 50
+    # The released put went into the emptied buffer
+    assert metrics["depth_ms"] == 10
@@ -0,0 +1,87 @@
+# tests/test_difficulty_engine.py
+import numpy as np
+import pytest
+
+from src.Tools.interview.difficulty_engine import (
+    BIN_RANGE,
+    LABEL_PRIOR,
+    MIN_STATS_ATTEMPTS,
+    _Ability,
+    difficulty_label,
+    expected_score,
+    fit_difficulties,
+    question_difficulty,
+)
+
+
+def test_expected_score_is_one_half_at_matching_difficulty():
+    assert expected_score(0.7, 0.7) == pytest.approx(0.5)
+    assert expected_score(2.0, 0.0) > 0.5 > expected_score(-2.0, 0.0)
+
+
+def test_question_difficulty_prefers_rating_then_stats_then_label():
+    assert question_difficulty({"difficulty_rating": 1.5, "difficulty": "EASY"}) == 1.5
+    # Mean score 5/10 is what an average candidate gets on a b = 0 question
+    assert question_difficulty(
+        {"difficulty": "HARD", "mean_score": 5.0, "attempts": MIN_STATS_ATTEMPTS}
+    ) == pytest.approx(0.0)
+    assert question_difficulty(
+        {"difficulty": "HARD", "mean_score": 9.0, "attempts": MIN_STATS_ATTEMPTS - 1}
+    ) == LABEL_PRIOR["HARD"]
+    assert question_difficulty({"difficulty": "easy"}) == LABEL_PRIOR["EASY"]
+    assert question_difficulty({}) == 0.0
+
+
+def test_difficulty_label():
+    assert difficulty_label(-3.0) == "EASY"
+    assert difficulty_label(0.2) == "MEDIUM"
+    assert difficulty_label(0.8) == "HARD"
+
+
+def test_ability_moves_towards_the_evidence_and_settles():
+    ability = _Ability()
+    steps = []
+    for _ in range(5):
+        before = ability.theta
+        ability.update(0.0, 1.0)
+        steps.append(ability.theta - before)
+
+    assert ability.theta > 0
+    assert steps == sorted(steps, reverse=True)
+
+
+def synthetic_turns(true_b, sessions=200, seed=1):
+    rng = np.random.default_rng(seed)
+    theta = rng.normal(0.0, 1.0, sessions)
+    s_idx = np.repeat(np.arange(sessions), len(true_b))
+    q_idx = np.tile(np.arange(len(true_b)), sessions)
+    p = 1.0 / (1.0 + np.exp(np.asarray(true_b)[q_idx] - theta[s_idx]))
+    outcome = (rng.random(len(p)) < p).astype(np.float64)
+    return s_idx, q_idx, outcome
+
+
+def test_fit_recovers_the_ordering_of_difficulties():
+    true_b = [-1.5, 0.0, 1.5]
+    s_idx, q_idx, outcome = synthetic_turns(true_b)
+
+    fitted = fit_difficulties(s_idx, q_idx, outcome, prior=np.zeros(3))
+
+    assert list(np.argsort(fitted)) == [0, 1, 2]
+    assert fitted == pytest.approx(true_b, abs=0.5)
+
+
+def test_fit_keeps_thin_evidence_near_the_prior():
+    # One session answered one question perfectly
+    fitted = fit_difficulties(
+        np.array([0]), np.array([0]), np.array([1.0]), prior=np.array([1.0]), regularization=5.0
+    )
+    assert 0.0 < fitted[0] < 1.0
+
+
+def test_fit_is_clipped_to_the_bin_range():
+    s_idx, q_idx, outcome = synthetic_turns([0.0, 0.0])
+    outcome[q_idx == 1] = 0.0  # nobody ever gets question 1 right
+
+    fitted = fit_difficulties(s_idx, q_idx, outcome, prior=np.zeros(2), iterations=200, regularization=1e-6)
+
+    assert fitted[1] == BIN_RANGE
@@ -0,0 +1,114 @@
+# tests/test_evaluation_cache.py
+import json
+
+import pytest
+
+from src.Tools.interview.evaluation_cache import REDIS_KEY_PREFIX, EvaluationCache, evaluation_cache_key
+
+EVALUATION = {"score": 7, "reasoning": "Mostly right.", "feedback": "Mention the trade-offs."}
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+        self.deleted = []
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis is down")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis is down")
+        self.data[key] = value.encode("utf-8")
+
+    def delete(self, key):
+        self.deleted.append(key)
+        self.data.pop(key, None)
+
+
+def with_redis(redis):
+    cache = EvaluationCache()
+    cache._redis_checked = True
+    cache._redis = redis
+    return cache
+
+
+def key(transcript="A hash map with O(1) lookups"):
+    return evaluation_cache_key("v1", "What is a dict?", "hash table", transcript)
+
+
+def test_key_ignores_case_and_whitespace():
+    assert key("A hash map  with\nO(1) lookups") == key("a HASH map with o(1) lookups")
+
+
+def test_key_depends_on_every_part():
+    base = evaluation_cache_key("v1", "q", "points", "answer")
+    assert len({
+        base,
+        evaluation_cache_key("v2", "q", "points", "answer"),
+        evaluation_cache_key("v1", "q2", "points", "answer"),
+        evaluation_cache_key("v1", "q", "points2", "answer"),
+        evaluation_cache_key("v1", "q", "points", "answer2"),
+    }) == 5
+
+
+def test_local_tier_returns_copies():
+    cache = EvaluationCache()
+    cache.set(key(), EVALUATION)
+
+    cached = cache.get(key())
+    cached["score"] = 0
+    assert cache.get(key()) == EVALUATION
+
+
+def test_local_tier_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setenv("EVALUATION_CACHE_SIZE", "2")
+    cache = EvaluationCache()
+    for name in ("a", "b"):
+        cache.set(name, EVALUATION)
+    cache.get("a")
+    cache.set("c", EVALUATION)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+
+
+def test_redis_hit_fills_the_local_tier():
+    redis = FakeRedis()
+    with_redis(redis).set(key(), EVALUATION)
+
+    cache = with_redis(redis)
+    assert cache.get(key()) == EVALUATION
+    redis.data.clear()
+    assert cache.get(key()) == EVALUATION
+
+
+@pytest.mark.parametrize("raw", [b"{\"score\": 7, \"reas", b"\xff\xfe", b"[1, 2]", b"null"])
+def test_corrupt_redis_entry_is_a_miss_and_deleted(raw):
+    redis = FakeRedis()
+    redis.data[REDIS_KEY_PREFIX + key()] = raw
+    cache = with_redis(redis)
+
+    assert cache.get(key()) is None
+    assert redis.deleted == [REDIS_KEY_PREFIX + key()]
+    assert cache._local_get(key()) is None
+
+
+def test_redis_outage_is_a_miss_and_keeps_the_entry():
+    redis = FakeRedis(fail=True)
+    cache = with_redis(redis)
+
+    cache.set(key(), EVALUATION)  # the Redis write fails quietly
+    cache.clear()
+
+    assert cache.get(key()) is None
+    assert redis.deleted == []
+
+
+def test_stored_entries_are_json():
+    redis = FakeRedis()
+    with_redis(redis).set(key(), EVALUATION)
+    assert json.loads(redis.data[REDIS_KEY_PREFIX + key()]) == EVALUATION
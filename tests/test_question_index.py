@@ -0,0 +1,166 @@
+# tests/test_question_index.py
+import uuid
+
+import pytest
+
+from src.Tools.interview import question_index
+from src.Tools.interview.question_index import QuestionIndex
+from src.Tools.interview.session_history import SessionQuestionHistory
+
+
+def row(difficulty, topic, **extra):
+    return {
+        "id": uuid.uuid4(),
+        "text": f"{difficulty} {topic} question",
+        "expected_answer_points": "",
+        "difficulty": difficulty,
+        "topic": topic,
+        "difficulty_rating": None,
+        **extra,
+    }
+
+
+class FakeQuestionModel:
+    def __init__(self, rows):
+        self.rows = rows
+        self.loads = 0
+        self.objects = self
+
+    def values(self, *fields):
+        self.loads += 1
+        return self
+
+    def iterator(self, chunk_size):
+        return iter(self.rows)
+
+
+@pytest.fixture
+def rows():
+    return (
+        [row("EASY", "Python") for _ in range(3)]
+        + [row("EASY", "  python   basics ") for _ in range(2)]
+        + [row("HARD", "Python") for _ in range(4)]
+        + [row("MEDIUM", "Databases", stats__attempts=7, stats__mean_score=6.5)]
+    )
+
+
+@pytest.fixture
+def model(monkeypatch, rows):
+    model = FakeQuestionModel(rows)
+    monkeypatch.setattr(question_index, "get_model", lambda label: model)
+    monkeypatch.setenv("QUESTION_INDEX_TTL_SECONDS", "0")
+    return model
+
+
+@pytest.fixture
+def index(model):
+    return QuestionIndex()
+
+
+def ids(pool):
+    return {pool.get(position)["id"] for position in range(len(pool))}
+
+
+def test_loads_once_and_joins_stats(index, model, rows):
+    assert len(index.items()) == len(rows)
+    index.pool("EASY")
+    assert model.loads == 1
+
+    item = index.get(str(rows[-1]["id"]))
+    assert item["attempts"] == 7
+    assert item["mean_score"] == 6.5
+    assert index.get(str(rows[0]["id"]))["attempts"] == 0
+
+
+def test_pool_matches_difficulty_and_topic_substring(index, rows):
+    assert len(index.pool()) == len(rows)
+    assert len(index.pool("easy")) == 5
+    assert len(index.pool("EASY", "PYTHON")) == 5
+    assert len(index.pool("EASY", "basics")) == 2
+    assert len(index.pool("", "python")) == 9
+    assert len(index.pool("HARD", "databases")) == 0
+    assert index.sample("HARD", "databases") is None
+
+
+def test_pool_positions_cover_every_question_once(index, rows):
+    pool = index.pool("", "python")
+    assert ids(pool) == {str(r["id"]) for r in rows[:9]}
+    assert set(pool.ids()) == ids(pool)
+    with pytest.raises(IndexError):
+        pool.get(len(pool))
+
+
+def test_upsert_moves_a_question_between_buckets(index, rows):
+    question = dict(index.get(str(rows[0]["id"])), difficulty="HARD")
+    version = index.pool("HARD").version
+
+    index.upsert(question)
+
+    assert question["id"] not in ids(index.pool("EASY"))
+    assert question["id"] in ids(index.pool("HARD"))
+    assert index.pool("HARD").version > version
+
+
+def test_remove_keeps_the_rest_of_the_bucket_addressable(index, rows):
+    index.ensure_loaded()
+    for r in rows[:2]:
+        index.remove(str(r["id"]))
+
+    assert ids(index.pool("EASY", "python")) == {str(r["id"]) for r in rows[2:5]}
+    index.remove(str(rows[-1]["id"]))
+    assert len(index.pool("MEDIUM")) == 0
+    index.remove("not-a-question")
+
+
+def test_changes_before_the_first_load_are_ignored(model, rows):
+    index = QuestionIndex()
+    index.remove(str(rows[0]["id"]))
+    assert len(index.items()) == len(rows)
+
+
+@pytest.fixture
+def history(monkeypatch):
+    history = SessionQuestionHistory()
+    monkeypatch.setattr(history, "_seed", lambda session_id: set())
+    return history
+
+
+def test_draw_never_repeats_until_the_pool_is_exhausted(index, history):
+    pool = index.pool("", "python")
+    drawn = [history.draw("session-1", pool)["id"] for _ in range(len(pool))]
+
+    assert set(drawn) == ids(pool)
+    assert history.draw("session-1", pool) is None
+    assert history.asked_ids("session-1") == set(drawn)
+
+
+def test_draw_skips_questions_already_asked(index, history):
+    pool = index.pool("HARD")
+    asked = sorted(ids(pool))[:3]
+    for question_id in asked:
+        history.mark_asked("session-1", question_id)
+
+    remaining = history.draw("session-1", pool)
+    assert remaining["id"] not in asked
+    assert history.draw("session-1", pool) is None
+
+
+def test_sessions_are_independent(index, history):
+    pool = index.pool("HARD")
+    for _ in range(len(pool)):
+        history.draw("session-1", pool)
+
+    assert history.draw("session-2", pool) is not None
+
+
+def test_bank_change_restarts_the_shuffle_but_keeps_asked(index, history, rows):
+    first = history.draw("session-1", index.pool("HARD"))
+    added = dict(index.get(str(rows[-1]["id"])), difficulty="HARD")
+    index.upsert(added)
+
+    pool = index.pool("HARD")
+    drawn = {history.draw("session-1", pool)["id"] for _ in range(len(pool) - 1)}
+
+    assert first["id"] not in drawn
+    assert added["id"] in drawn
+    assert history.draw("session-1", pool) is None
@@ -0,0 +1,57 @@
+# tests/test_question_io.py
+import io
+
+import pytest
+
+from apps.interviews.question_io import detect_format, read_rows, row_writer
+from apps.interviews.text import normalize_topic, text_hash
+
+
+def test_import_dedup_hash_ignores_case_punctuation_and_spacing():
+    assert text_hash("What is a Python  decorator?") == text_hash("what is a python decorator")
+    assert text_hash("What is a decorator?") != text_hash("What is a generator?")
+
+
+def test_normalize_topic():
+    assert normalize_topic("  System   Design ") == "system design"
+    assert normalize_topic(None) == ""
+
+
+@pytest.mark.parametrize("path, fmt", [
+    ("bank.jsonl", "jsonl"),
+    ("bank.ndjson.gz", "jsonl"),
+    ("bank.csv", "csv"),
+    ("bank.csv.gz", "csv"),
+])
+def test_detect_format(path, fmt):
+    assert detect_format(path) == fmt
+
+
+def test_detect_format_needs_a_known_extension():
+    assert detect_format("-", "csv") == "csv"
+    with pytest.raises(ValueError):
+        detect_format("bank.txt")
+
+
+def test_jsonl_rows_report_bad_lines_and_keep_going():
+    stream = io.StringIO('{"text": "a"}\n\nnot json\n[1, 2]\n{"text": "b"}\n')
+    rows = list(read_rows(stream, "jsonl"))
+
+    assert [(line, row) for line, row, error in rows if error is None] == [
+        (1, {"text": "a"}), (5, {"text": "b"})
+    ]
+    assert [line for line, _, error in rows if error is not None] == [3, 4]
+
+
+def test_csv_round_trip():
+    row = {"topic": "SQL", "difficulty": "HARD", "text": "What is an index?", "expected_answer_points": "- B-tree\n- lookups"}
+    stream = io.StringIO()
+    row_writer(stream, "csv")(row)
+    stream.seek(0)
+
+    assert [parsed for _, parsed, _ in read_rows(stream, "csv")] == [row]
+
+
+def test_csv_needs_the_question_columns():
+    with pytest.raises(ValueError):
+        list(read_rows(io.StringIO("topic,text\nSQL,What?\n"), "csv"))
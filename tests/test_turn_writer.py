@@ -0,0 +1,146 @@
+# tests/test_turn_writer.py
+import contextlib
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from django.db import IntegrityError, OperationalError, transaction
+
+from src.Tools.interview import turn_writer
+from src.Tools.interview.turn_writer import TurnWriteBuffer, as_uuid
+
+SESSION = str(uuid.uuid4())
+OTHER_SESSION = str(uuid.uuid4())
+QUESTION = uuid.uuid4()
+
+
+class FakeModels:
+    """Just enough of the interviews models for TurnWriteBuffer._write."""
+
+    def __init__(self, sessions, questions):
+        self.sessions = {session_id: {"turns": 0, "score_sum": 0} for session_id in sessions}
+        self.questions = set(questions)
+        self.turns = []
+        self.stats = []
+        self.fail_with = None
+
+        models = self
+
+        class InterviewSession:
+            @staticmethod
+            def add_turn_scores(session_id, turns, score_sum):
+                totals = models.sessions.get(session_id)
+                if totals is None:
+                    return 0
+                totals["turns"] += turns
+                totals["score_sum"] += score_sum
+                return 1
+
+        class InterviewTurn(SimpleNamespace):
+            objects = SimpleNamespace(bulk_create=self._bulk_create)
+
+        class Question:
+            objects = SimpleNamespace(filter=self._filter_questions)
+
+        class QuestionStats:
+            tally = staticmethod(list)
+            add_turns = staticmethod(self.stats.extend)
+
+        self.by_label = {
+            "interviews.InterviewSession": InterviewSession,
+            "interviews.InterviewTurn": InterviewTurn,
+            "interviews.Question": Question,
+            "interviews.QuestionStats": QuestionStats,
+        }
+
+    def _bulk_create(self, rows, batch_size):
+        if self.fail_with is not None:
+            raise self.fail_with
+        self.turns.extend(rows)
+
+    def _filter_questions(self, id__in):
+        return SimpleNamespace(values_list=lambda field, flat: [q for q in self.questions if q in id__in])
+
+
+@pytest.fixture
+def models(monkeypatch):
+    models = FakeModels(sessions=[SESSION, OTHER_SESSION], questions=[QUESTION])
+    monkeypatch.setattr(turn_writer, "ensure_django", lambda: None)
+    monkeypatch.setattr(turn_writer, "get_model", models.by_label.__getitem__)
+    monkeypatch.setattr(transaction, "atomic", contextlib.nullcontext)
+    return models
+
+
+def turn(session_id=SESSION, question_id=QUESTION, score=5):
+    return {
+        "id": uuid.uuid4(),
+        "session_id": session_id,
+        "question_id": question_id,
+        "ai_message": "",
+        "user_transcript": "an answer",
+        "score": score,
+        "feedback": "",
+        "eval_latency_ms": None,
+    }
+
+
+def test_as_uuid():
+    value = uuid.uuid4()
+    assert as_uuid(value) is value
+    assert as_uuid(str(value)) == value
+    assert as_uuid("q-42") is None
+    assert as_uuid("") is None
+    assert as_uuid(None) is None
+
+
+def test_flush_folds_each_sessions_totals_once(models):
+    buffer = TurnWriteBuffer()
+    for score in (4, 6, 8):
+        buffer._pending.append(turn(score=score))
+    buffer._pending.append(turn(session_id=OTHER_SESSION, score=10))
+
+    assert buffer.flush() == 4
+    assert models.sessions[SESSION] == {"turns": 3, "score_sum": 18}
+    assert models.sessions[OTHER_SESSION] == {"turns": 1, "score_sum": 10}
+    assert [question_id for question_id, _, _ in models.stats] == [QUESTION] * 4
+    assert len(buffer) == 0
+    assert buffer.flush() == 0
+
+
+def test_unknown_or_malformed_question_ids_are_stored_as_null(models):
+    buffer = TurnWriteBuffer()
+    buffer._pending.extend([turn(question_id=uuid.uuid4()), turn(question_id="q-42"), turn()])
+
+    assert buffer.flush() == 3
+    assert [row.question_id for row in models.turns] == [None, None, QUESTION]
+
+
+def test_turns_for_unknown_sessions_are_dropped(models):
+    buffer = TurnWriteBuffer()
+    buffer._pending.extend([turn(session_id=str(uuid.uuid4())), turn()])
+
+    assert buffer.flush() == 1
+    assert models.sessions[SESSION] == {"turns": 1, "score_sum": 5}
+
+
+def test_operational_error_requeues_the_batch(models):
+    buffer = TurnWriteBuffer()
+    buffer._pending.extend([turn(), turn()])
+    models.fail_with = OperationalError("connection lost")
+
+    with pytest.raises(OperationalError):
+        buffer.flush()
+    buffer._pending.append(turn())
+    assert len(buffer) == 3
+
+    models.fail_with = None
+    assert buffer.flush() == 3
+
+
+def test_other_errors_drop_the_batch(models):
+    buffer = TurnWriteBuffer()
+    buffer._pending.extend([turn(), turn()])
+    models.fail_with = IntegrityError("duplicate key")
+
+    assert buffer.flush() == 0
+    assert len(buffer) == 0